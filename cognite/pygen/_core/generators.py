@@ -219,6 +219,7 @@ def __init__(
         self.client_name = client_name
         self.default_instance_space = default_instance_space
         self._implements = implements
+        self._config = config
         self._logger = logger or print
         seen_views: set[dm.ViewId] = set()
         unique_views: list[dm.View] = []
@@ -493,6 +494,8 @@ def generate_data_class_core_base_file(self) -> str:
             data_class_core.render(
                 has_default_instance_space=self.has_default_instance_space,
                 top_level_package=self.top_level_package,
+                compact_read_classes=self._config.compact_read_classes,
+                msgspec_read_classes=self._config.msgspec_read_classes,
             )
             + "\n"
         )
@@ -533,7 +536,20 @@ def generate_data_class_core_query_files(self) -> dict[str, str]:
         These are the exact same files as in cognite.pygen._query.
         """
         output: dict[str, str] = {}
-        for file_name in ["builder", "constants", "processing", "step", "executor"]:
+        for file_name in [
+            "builder",
+            "constants",
+            "processing",
+            "step",
+            "executor",
+            "tuning",
+            "reporting",
+            "columnar",
+            "partitioning",
+            "planning",
+            "optimizer",
+            "raw",
+        ]:
             file_content = get_file_content(f"{file_name}.py")
             output[f"{file_name}.py"] = file_content.replace(
                 "cognite.pygen._query", f"{self.top_level_package}.data_classes._core.query"
@@ -648,6 +664,8 @@ def generate_data_classes_init_file(self) -> str:
                 ft=fields,
                 dm=dm,
                 top_level_package=self.top_level_package,
+                compact_read_classes=self._config.compact_read_classes,
+                msgspec_read_classes=self._config.msgspec_read_classes,
             )
             + "\n"
         )
@@ -905,6 +923,8 @@ def generate_data_class_file(self) -> str:
                 grouped_edge_classes=grouped_edge_classes,
                 has_default_instance_space=self.has_default_instance_space,
                 top_level_package=self.top_level_package,
+                compact_read_classes=self._config.compact_read_classes,
+                msgspec_read_classes=self._config.msgspec_read_classes,
             )
             + "\n"
         )
@@ -950,6 +970,8 @@ def method_text_wrap(text: str) -> str:
                 ft=fields,
                 dm=dm,
                 retrieve_connections_doc=retrieve_connections_doc,
+                compact_read_classes=self._config.compact_read_classes,
+                msgspec_read_classes=self._config.msgspec_read_classes,
             )
             + "\n"
         )
@@ -252,6 +252,26 @@ def query_cls_name(self) -> str:
         """The name of the class used to create queries for this data class."""
         return f"{self.read_name}Query"
 
+    @property
+    def compact_name(self) -> str:
+        """The name of the compact, read-only version of this data class."""
+        return f"{self.read_name}Compact"
+
+    @property
+    def compact_list_name(self) -> str:
+        """The name of the list of the compact, read-only version of this data class."""
+        return f"{self.read_name}CompactList"
+
+    @property
+    def struct_name(self) -> str:
+        """The name of the msgspec Struct version of this data class."""
+        return f"{self.read_name}Struct"
+
+    @property
+    def struct_list_name(self) -> str:
+        """The name of the list of the msgspec Struct version of this data class."""
+        return f"{self.read_name}StructList"
+
     @property
     def view_id_str(self) -> str:
         """The view id as a string."""
@@ -649,6 +669,11 @@ def has_multi_connection_fields(self) -> bool:
         """Check if the data class has any multi connection fields."""
         return any(isinstance(field_, OneToManyConnectionField) for field_ in self)
 
+    @property
+    def has_direct_relation_list_fields(self) -> bool:
+        """Check if the data class has any direct relation fields that are lists."""
+        return any(field_.is_direct_relation for field_ in self.fields_of_type(OneToManyConnectionField))
+
     @property
     def single_connection_names(self) -> str:
         """The names of all single connection fields."""
@@ -123,12 +123,22 @@ def as_write_type_hint(self) -> str:
     def as_graphql_type_hint(self) -> str:
         raise NotImplementedError()
 
+    def as_struct_type_hint(self) -> str:
+        """The type hint for the field in the msgspec Struct, the property value is decoded into this type."""
+        raise NotImplementedError()
+
     def as_typed_hint(self, operation: Literal["write", "read"] = "write") -> str:
         raise NotImplementedError()
 
     def as_typed_init_set(self) -> str:
         return self.name
 
+    def _create_struct_type_hint(self, type_: str) -> str:
+        # All fields are optional, as the properties that are not set are not returned by the API.
+        if self.need_alias:
+            return f'Optional[{type_}] = struct_field(default=None, name="{self.prop_name}")'
+        return f"Optional[{type_}] = None"
+
     @property
     def argument_documentation(self) -> str:
         if self.description:
@@ -147,6 +157,13 @@ def argument_documentation_method(self) -> str:
         line_width = 120 - 14 - len(self.name) - 1
         return ("\n" + " " * 16).join(textwrap.wrap(msg, width=line_width))
 
+    def as_read_from_raw(self, value: str) -> str:
+        """The code converting the raw property value, given by the code in value, to the read type.
+
+        Only the conversions pydantic would otherwise do are included, other values are used as is.
+        """
+        return value
+
     # The properties below are overwritten in the child classes
     @property
     def is_connection(self) -> bool:
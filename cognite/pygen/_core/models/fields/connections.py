@@ -425,6 +425,14 @@ def as_write_type_hint(self) -> str:
 
         return self._create_type_hint(types, self.type_hint_node_reference)
 
+    def as_struct_type_hint(self) -> str:
+        """Return the type hint for the field in the msgspec Struct."""
+        if not self.is_direct_relation:
+            raise NotImplementedError("Only direct relations are decoded into the msgspec Structs")
+        return self._create_struct_type_hint(
+            "list[DirectRelationStruct]" if self._wrap_list else "DirectRelationStruct"
+        )
+
     def as_graphql_type_hint(self) -> str:
         """Return the type hint for the field in the GraphQL data class."""
         type_hint_node_reference: list[str] = []
@@ -488,6 +496,11 @@ def as_typed_init_set(self) -> str:
             )
         return self.name
 
+    def as_read_from_raw(self, value: str) -> str:
+        if self.is_direct_relation:
+            return f'parse_connection_list({value}, "{self.name}")'
+        return value
+
 
 @dataclass(frozen=True)
 class OneToOneConnectionField(BaseConnectionField):
@@ -509,6 +522,11 @@ def as_typed_init_set(self) -> str:
             return f"DirectRelationReference.load({self.name}) if {self.name} else None"
         return self.name
 
+    def as_read_from_raw(self, value: str) -> str:
+        if self.is_direct_relation:
+            return f'parse_single_connection({value}, "{self.name}")'
+        return value
+
     @property
     def filtering_cls(self) -> str:
         if self.is_direct_relation:
@@ -53,6 +53,24 @@ def is_text_field(self) -> bool:
     def type_as_string(self) -> str:
         return _to_python_type(self.type_)
 
+    def as_read_from_raw(self, value: str) -> str:
+        if isinstance(self.type_, dm.Timestamp):
+            return f"parse_timestamp({value})"
+        elif isinstance(self.type_, dm.Date):
+            return f"parse_date({value})"
+        return value
+
+    def as_struct_type_hint(self) -> str:
+        if isinstance(self.type_, Enum | dm.TimeSeriesReference):
+            # Enums are decoded as strings, in case a new value is added to the enum, and the
+            # time series are referenced by their external ID.
+            type_ = "str"
+        else:
+            type_ = _to_python_type(self.type_)
+        if isinstance(self.type_, ListablePropertyType) and self.type_.is_list:
+            type_ = f"list[{type_}]"
+        return self._create_struct_type_hint(type_)
+
     def as_typed_hint(self, operation: Literal["write", "read"] = "write") -> str:
         type_ = _to_python_type(self.type_, typed=True, operation=operation)
         if isinstance(self.type_, ListablePropertyType) and self.type_.is_list:
@@ -1,3 +1,4 @@
 from .interface import QueryExecutor
+from .reporting import LoggingReporter, QueryReporter, StatsReporter
 
-__all__ = ["QueryExecutor"]
+__all__ = ["QueryExecutor", "QueryReporter", "LoggingReporter", "StatsReporter"]
@@ -1,16 +1,29 @@
+import copy
 import sys
-from collections.abc import Collection, Iterable, Iterator, MutableSequence
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator, Mapping, MutableSequence, Sequence
+from dataclasses import dataclass
 from typing import (
+    Any,
     SupportsIndex,
     cast,
     overload,
 )
 
+from cognite.client import CogniteClient
 from cognite.client.data_classes import data_modeling as dm
 from cognite.client.data_classes.data_modeling.query import NodeOrEdgeResultSetExpression
 
+from cognite.pygen._query.constants import (
+    PREPARED_QUERY_CACHE_SIZE,
+    SEARCH_MAX_WORKERS,
+)
 from cognite.pygen._query.executor import QueryExecutor
+from cognite.pygen._query.optimizer import QueryOptimizer
+from cognite.pygen._query.planning import QueryPlan, create_query_plan
 from cognite.pygen._query.step import QueryBuildStep
+from cognite.pygen._query.tuning import BatchLimitStore
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -26,19 +39,17 @@ def __init__(self, steps: Collection[QueryBuildStep] | None = None):
         super().__init__(steps or [])
 
     def _build(self) -> tuple[dm.query.Query, list[QueryBuildStep], set[str]]:
-        # We serialize and deserialize query steps to get a copy as we will modify the
-        # cursor and limit in the execution.
+        # The executor only modifies the limit of the expressions, the cursors are set on the query and
+        # the pagination state is kept in the executor. Thus, a shallow copy is sufficient, and the filters,
+        # which can contain large lists of ids, are shared with the steps instead of being copied.
         # The cast is needed as mypy does not understand that the NodeOrEdgeResultSetExpression is
         # the parent of NodeSetExpression and EdgeSetExpression.
         with_ = {
-            step.name: cast(
-                NodeOrEdgeResultSetExpression, dm.query.NodeOrEdgeResultSetExpression._load(step.expression.dump())
-            )
+            step.name: cast(NodeOrEdgeResultSetExpression, copy.copy(step.expression))
             for step in self
             if step.is_queryable
         }
         select = {step.name: step.select for step in self if step.select is not None and step.is_queryable}
-        step_by_name = {step.name: step for step in self}
         search: list[QueryBuildStep] = []
         temporary_select: set[str] = set()
         for step in self:
@@ -46,28 +57,88 @@ def _build(self) -> tuple[dm.query.Query, list[QueryBuildStep], set[str]]:
                 continue
             if step.node_expression is not None:
                 search.append(step)
-                # Ensure that select is set for the parent
+                # Ensure that the parent is returned, reusing its select if it has one.
                 if step.from_ in select or step.from_ is None:
                     continue
-                view_id = step_by_name[step.from_].view_id
-                if view_id is None:
-                    continue
-                select[step.from_] = dm.query.Select([dm.query.SourceSelector(view_id, ["*"])])
+                # The search only uses the identifiers of the parents, thus, no properties are selected.
+                select[step.from_] = dm.query.Select()
                 temporary_select.add(step.from_)
         # MyPy requires with to be an invariant mapping. We do not control the query clas in the SDK,
         # so we use a cast here.
-        return dm.query.Query(with_=with_, select=select), search, temporary_select  # type: ignore[arg-type]
+        query = dm.query.Query(with_=with_, select=select)  # type: ignore[arg-type]
+        return query, search, temporary_select
 
     def _dump_yaml(self) -> str:
         return self._build()[0].dump_yaml()
 
-    def build(self) -> QueryExecutor:
-        query, to_search, temp_select = self._build()
+    def build(
+        self,
+        max_search_workers: int = SEARCH_MAX_WORKERS,
+        target_latency: float | None = None,
+        batch_limit_store: BatchLimitStore | None = None,
+        parameters: Mapping[str, Any] | None = None,
+        optimize: bool = True,
+        raw: bool = False,
+    ) -> QueryExecutor:
+        """Build the query executor.
+
+        Args:
+            max_search_workers: The maximum number of concurrent /search calls used for steps that cannot
+                be expressed in the query API, i.e., reverse direct relations of lists.
+            target_latency: The target latency in seconds of a single query. If passed, the batch limits are
+                reduced when a query is slower than this, and increased, up to the step's max_retrieve_batch_limit,
+                when it is faster. Defaults to None, which only reduces the batch limits on timeouts and throttling.
+            batch_limit_store: If passed, the batch limits start from the last stable batch limits stored for
+                the same steps, and the stable batch limits are stored when the execution ends.
+            parameters: The values of the parameters used in the filters of the steps, i.e.,
+                `dm.filters.ParameterValue`. This enables reusing the same steps with different filter values.
+            optimize: Whether to rewrite the query into an equivalent, cheaper query before executing it, i.e.,
+                narrowing the selected properties to the ones that are read, and merging identical result sets.
+            raw: Whether to post the query directly and keep the response JSON in the returned instances,
+                instead of loading the response into cognite-sdk objects. This makes unpacking the instances
+                cheaper, as dumping an instance returns the response JSON.
+
+        """
+        return self.compile(optimize).create_executor(
+            parameters,
+            max_search_workers=max_search_workers,
+            target_latency=target_latency,
+            batch_limit_store=batch_limit_store,
+            raw=raw,
+        )
+
+    def compile(self, optimize: bool = True) -> "CompiledQuery":
+        """Build and optimize the query once, such that it can be executed any number of times.
+
+        Args:
+            optimize: Whether to rewrite the query into an equivalent, cheaper query.
+
+        Returns:
+            The compiled query, from which an executor is created for each execution.
 
+        """
         if not self:
             raise ValueError("No query steps to execute")
+        query, to_search, temp_select = self._build()
+        aliases = QueryOptimizer(self, temp_select).optimize(query) if optimize else None
+        return CompiledQuery(self, query, to_search, temp_select, aliases)
+
+    def explain(self, client: CogniteClient | None = None, parameters: Mapping[str, Any] | None = None) -> QueryPlan:
+        """Explain how the query will be executed without executing it.
+
+        Args:
+            client: If passed, the number of instances of each node step is estimated with an aggregate
+                call, otherwise, the estimates are based on the limits of the steps only.
+            parameters: The values of the parameters used in the filters of the steps. Steps with
+                parameters without values are estimated based on their limits only.
+
+        Returns:
+            The plan of the query, with the method, batch limits, estimated count and round trips of each step.
 
-        return QueryExecutor(self, query, to_search, temp_select)
+        """
+        if not self:
+            raise ValueError("No query steps to explain")
+        return create_query_plan(self, client, parameters)
 
     def get_from(self) -> str | None:
         if len(self) == 0:
@@ -108,3 +179,104 @@ def __getitem__(self, item: SupportsIndex | slice, /) -> QueryBuildStep | Self:
         if isinstance(item, slice):
             return QueryBuilder(value)  # type: ignore[arg-type, return-value]
         return cast(QueryBuildStep, value)
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A query that is built and optimized once and can be executed any number of times, also concurrently.
+
+    The compiled query is only read, each execution gets an executor with its own copy of the expressions
+    and its own pagination state.
+
+    Args:
+        steps: The steps the query was built from.
+        query: The optimized query, without parameters.
+        to_search: The steps retrieved with the /search endpoint.
+        temp_select: The steps that are only selected to find the parents of searched steps.
+        aliases: The steps merged by the optimizer, mapping the merged step to the result set it is read from.
+    """
+
+    steps: QueryBuilder
+    query: dm.query.Query
+    to_search: Sequence[QueryBuildStep]
+    temp_select: set[str]
+    aliases: Mapping[str, str] | None = None
+
+    def create_executor(
+        self,
+        parameters: Mapping[str, Any] | None = None,
+        max_search_workers: int = SEARCH_MAX_WORKERS,
+        target_latency: float | None = None,
+        batch_limit_store: BatchLimitStore | None = None,
+        raw: bool = False,
+    ) -> QueryExecutor:
+        """Create an executor for one execution of the query.
+
+        Args:
+            parameters: The values of the parameters used in the filters of the steps.
+            max_search_workers: The maximum number of concurrent /search calls.
+            target_latency: The target latency in seconds of a single query. Defaults to None, which only reduces
+                the batch limits on timeouts and throttling.
+            batch_limit_store: If passed, the batch limits start from the last stable batch limits stored for
+                the same steps.
+            raw: Whether to post the query directly and keep the response JSON in the returned instances.
+
+        Returns:
+            The query executor.
+
+        """
+        # The executor sets the limits of the expressions and the cursors of the query, thus, each execution
+        # gets a shallow copy, while the filters and selects are shared.
+        with_ = {
+            name: cast(NodeOrEdgeResultSetExpression, copy.copy(expression))
+            for name, expression in self.query.with_.items()
+        }
+        query = dm.query.Query(with_=with_, select=self.query.select, parameters=parameters or {})  # type: ignore[arg-type]
+        return QueryExecutor(
+            self.steps,
+            query,
+            self.to_search,
+            self.temp_select,
+            max_search_workers=max_search_workers,
+            target_latency=target_latency,
+            batch_limit_store=batch_limit_store,
+            aliases=self.aliases,
+            raw=raw,
+        )
+
+
+class CompiledQueryCache:
+    """Caches compiled queries by the shape of the query, evicting the least recently used.
+
+    The compiled queries are only read when a query executor is created, thus, the same compiled query
+    can be executed any number of times, also concurrently.
+
+    Args:
+        maxsize: The maximum number of cached compiled queries.
+    """
+
+    def __init__(self, maxsize: int = PREPARED_QUERY_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._compiled_by_key: OrderedDict[Hashable, CompiledQuery] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._compiled_by_key)
+
+    def get_or_create(self, key: Hashable, create: Callable[[], CompiledQuery]) -> CompiledQuery:
+        with self._lock:
+            if (compiled := self._compiled_by_key.get(key)) is not None:
+                self._compiled_by_key.move_to_end(key)
+                return compiled
+        # Created outside the lock, two threads can compile the same query, the last one is kept.
+        compiled = create()
+        with self._lock:
+            self._compiled_by_key[key] = compiled
+            self._compiled_by_key.move_to_end(key)
+            while len(self._compiled_by_key) > self._maxsize:
+                self._compiled_by_key.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled_by_key.clear()
@@ -3,7 +3,7 @@
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from typing import Any, Literal, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 from cognite.client import CogniteClient
 from cognite.client import data_modeling as dm
@@ -16,11 +16,17 @@
 from cognite.pygen._version import __version__
 
 from .builder import QueryBuilder
+from .columnar import ColumnarTable, ColumnarUnpacker, concat_tables
 from .constants import AGGREGATION_LIMIT, IN_FILTER_CHUNK_SIZE, SEARCH_LIMIT, SelectedProperties
+from .executor import QueryExecutor as QueryStepExecutor
 from .executor import chunker
 from .processing import QueryUnpacker
+from .reporting import QueryReporter
 from .step import QueryBuildStepFactory
 
+if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+
 
 @dataclass
 class Page:
@@ -38,6 +44,8 @@ class QueryExecutor:
         unpack_edges (Literal["skip", "include"], optional): Whether to unpack edges in the result.
             If "skip", edges will not be included in the result. If "include", edges will be included.
             Defaults to "include".
+        reporter (QueryReporter, optional): Receives the events of the executed queries, such as retrieved
+            batches, retries, and batch limit changes. Defaults to None, which prints the progress of large queries.
     """
 
     def __init__(
@@ -45,6 +53,7 @@ def __init__(
         client: CogniteClient,
         views: Sequence[dm.View] | None = None,
         unpack_edges: Literal["skip", "include"] = "skip",
+        reporter: QueryReporter | None = None,
     ):
         self._client = client
         # Used for aggregated logging of requests
@@ -52,6 +61,7 @@ def __init__(
             client.config.client_name = f"CognitePygen:{__version__}:QueryExecutor:{client.config.client_name}"
         self._view_by_id: dict[dm.ViewId, dm.View] = {view.as_id(): view for view in views or []}
         self._unpack_edges: Literal["skip", "include"] = unpack_edges
+        self._reporter = reporter
 
     def search(
         self,
@@ -333,6 +343,24 @@ def _execute_list(
         if view.used_for == "edge":
             raise ValueError("Nested properties are not supported for edges")
 
+        executor = self._build_list(builder, factory, filter, sort, limit)
+        output: list[dict[str, Any]] = []
+        for results in executor.iterate_resolved(self._client, remove_not_connected=False, reporter=self._reporter):
+            output.extend(
+                QueryUnpacker(
+                    results, edges=self._unpack_edges, as_data_record=False, edge_type_key="type", node_type_key="type"
+                ).unpack()
+            )
+        return output
+
+    def _build_list(
+        self,
+        builder: QueryBuilder,
+        factory: QueryBuildStepFactory,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        limit: int | None = None,
+    ) -> QueryStepExecutor:
         reverse_views = {
             prop.through.source: self._get_view(prop.through.source)
             for prop in factory.reverse_properties.values()
@@ -341,11 +369,26 @@ def _execute_list(
         builder.append(factory.root(filter, limit=limit, sort=self._as_sort_list(sort)))
         for connection_id, connection in factory.connection_properties.items():
             builder.extend(factory.from_connection(connection_id, connection, reverse_views))
-        executor = builder.build()
-        results = executor.execute_query(self._client, remove_not_connected=False)
-        return QueryUnpacker(
-            results, edges=self._unpack_edges, as_data_record=False, edge_type_key="type", node_type_key="type"
-        ).unpack()
+        return builder.build()
+
+    def _execute_to_arrow(
+        self,
+        view_id: dm.ViewId,
+        properties: SelectedProperties,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        limit: int | None = None,
+    ) -> "dict[str, pa.Table]":
+        view = self._get_view(view_id)
+        if view.used_for == "edge":
+            raise ValueError("Columnar results are not supported for edges")
+        builder = QueryBuilder()
+        factory = QueryBuildStepFactory(builder.create_name, view=view, user_selected_properties=properties)
+        executor = self._build_list(builder, factory, filter, sort, limit)
+        tables: dict[str, ColumnarTable] = {}
+        for results in executor.iterate_resolved(self._client, remove_not_connected=False, reporter=self._reporter):
+            concat_tables(tables, ColumnarUnpacker(results).unpack())
+        return {name: table.to_arrow() for name, table in tables.items()}
 
     @staticmethod
     def _get_instance_types(view: dm.View) -> list[Literal["node", "edge"]]:
@@ -372,7 +415,39 @@ def _execute_iterate(
         cursor: str | None = None,
         chunk_size: int = 10,
         nested_limit: int = 10,
+        prefetch: int = 0,
     ) -> Iterator[Page]:
+        executor, root_name = self._build_iterate(view_id, properties, filter, sort, chunk_size, nested_limit)
+        init_cursors: dict[str, str | None] | None = None
+        if cursor is not None:
+            init_cursors = {root_name: cursor}
+
+        for step in executor.iterate(
+            self._client,
+            remove_not_connected=False,
+            init_cursors=init_cursors,
+            prefetch=prefetch,
+            reporter=self._reporter,
+        ):
+            items = QueryUnpacker(
+                step,
+                edges=self._unpack_edges,
+                as_data_record=False,
+                edge_type_key="type",
+                node_type_key="type",
+                nested_connection_limit=nested_limit,
+            ).unpack()
+            yield Page(items=items, cursor=step._cursors.get(root_name))
+
+    def _build_iterate(
+        self,
+        view_id: dm.ViewId,
+        properties: SelectedProperties,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        chunk_size: int = 10,
+        nested_limit: int = 10,
+    ) -> tuple[QueryStepExecutor, str]:
         view = self._get_view(view_id)
         builder = QueryBuilder()
         factory = QueryBuildStepFactory(
@@ -400,22 +475,36 @@ def _execute_iterate(
                     max_retrieve_limit=nested_limit * chunk_size,
                 )
                 builder.extend(connection_steps)
+        return builder.build(), factory.root_name
 
-        executor = builder.build()
+    def _execute_iterate_arrow(
+        self,
+        view_id: dm.ViewId,
+        properties: SelectedProperties,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        cursor: str | None = None,
+        chunk_size: int = 1000,
+        nested_limit: int = 10,
+        prefetch: int = 0,
+    ) -> "Iterator[dict[str, pa.Table]]":
+        executor, root_name = self._build_iterate(view_id, properties, filter, sort, chunk_size, nested_limit)
         init_cursors: dict[str, str | None] | None = None
         if cursor is not None:
-            init_cursors = {factory.root_name: cursor}
-
-        for step in executor.iterate(self._client, remove_not_connected=False, init_cursors=init_cursors):
-            items = QueryUnpacker(
-                step,
-                edges=self._unpack_edges,
-                as_data_record=False,
-                edge_type_key="type",
-                node_type_key="type",
-                nested_connection_limit=nested_limit,
-            ).unpack()
-            yield Page(items=items, cursor=step._cursors.get(factory.root_name))
+            init_cursors = {root_name: cursor}
+
+        for step in executor.iterate(
+            self._client,
+            remove_not_connected=False,
+            init_cursors=init_cursors,
+            prefetch=prefetch,
+            reporter=self._reporter,
+        ):
+            metadata = {"cursor": json.dumps(step._cursors.get(root_name))}
+            yield {
+                name: table.to_arrow().replace_schema_metadata(metadata)
+                for name, table in ColumnarUnpacker(step).unpack().items()
+            }
 
     @staticmethod
     def _as_sort_list(sort: dm.InstanceSort | Sequence[dm.InstanceSort] | None) -> list[dm.InstanceSort] | None:
@@ -571,6 +660,7 @@ def iterate(
         initial_cursor: str | None = None,
         chunk_size: int = 10,
         nested_limit: int = 10,
+        prefetch: int = 0,
     ) -> Iterator[Page]:
         """Iterate over nodes in a view.
 
@@ -582,13 +672,83 @@ def iterate(
             initial_cursor: The cursor to start from. If None, starts from the beginning.
             chunk_size: The number of results to include in each page. Defaults to 10.
             nested_limit: The maximum number of nested properties to include in the result. Defaults to 10.
+            prefetch: The number of pages to fetch ahead in the background while the current page is being
+                processed. Defaults to 0, which disables prefetching.
 
         Returns:
             Page: The page of results.
 
         """
         filter = self._equals_none_to_not_exists(filter)
-        yield from self._execute_iterate(view, properties, filter, sort, initial_cursor, chunk_size, nested_limit)
+        yield from self._execute_iterate(
+            view, properties, filter, sort, initial_cursor, chunk_size, nested_limit, prefetch
+        )
+
+    def iterate_arrow(
+        self,
+        view: dm.ViewId,
+        properties: SelectedProperties,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        initial_cursor: str | None = None,
+        chunk_size: int = 1000,
+        nested_limit: int = 10,
+        prefetch: int = 0,
+    ) -> "Iterator[dict[str, pa.Table]]":
+        """Iterate over nodes in a view as Arrow tables.
+
+        The properties are read directly into columns, without creating a dictionary per node. This
+        requires pyarrow to be installed.
+
+        Args:
+            view: The view in which the nodes have properties.
+            properties: The properties to include in the result.
+            filter: The filter to apply ahead of the list operation.
+            sort: The sort order of the results.
+            initial_cursor: The cursor to start from. If None, starts from the beginning. The cursor of a chunk
+                is stored as JSON under the 'cursor' key in the schema metadata of its tables.
+            chunk_size: The number of nodes to include in each chunk. Defaults to 1000.
+            nested_limit: The maximum number of nested properties to include in the result. Defaults to 10.
+            prefetch: The number of chunks to fetch ahead in the background while the current chunk is being
+                processed. Defaults to 0, which disables prefetching.
+
+        Returns:
+            The Arrow tables of each chunk. See `to_arrow` for the format.
+
+        """
+        filter = self._equals_none_to_not_exists(filter)
+        yield from self._execute_iterate_arrow(
+            view, properties, filter, sort, initial_cursor, chunk_size, nested_limit, prefetch
+        )
+
+    def to_arrow(
+        self,
+        view: dm.ViewId,
+        properties: SelectedProperties,
+        filter: filters.Filter | None = None,
+        sort: Sequence[dm.InstanceSort] | dm.InstanceSort | None = None,
+        limit: int | None = None,
+    ) -> "dict[str, pa.Table]":
+        """List nodes in a view as Arrow tables.
+
+        The properties are read directly into columns, without creating a dictionary per node. This
+        requires pyarrow to be installed.
+
+        Args:
+            view: The view in which the nodes have properties.
+            properties: The properties to include in the result.
+            filter: The filter to apply ahead of the list operation.
+            sort: The sort order of the results.
+            limit: The maximum number of results to return. Pagination is handled automatically.
+
+        Returns:
+            dict[str, pa.Table]: One table per connection, by the path of connection properties, for example,
+                'assets' and 'assets.parent'. The root nodes are in the table ''. The connected tables have
+                a '_parentIndex' column with the rows in the parent table each row is connected to.
+
+        """
+        filter = self._equals_none_to_not_exists(filter)
+        return self._execute_to_arrow(view, properties, filter, sort, limit)
 
     def list(
         self,
@@ -0,0 +1,370 @@
+import dataclasses
+import json
+import queue
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
+
+from cognite.client import CogniteClient
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.aggregations import Count
+from cognite.client.exceptions import CogniteAPIError
+
+from cognite.pygen._query.constants import PARTITION_COUNT_MAX_WORKERS
+from cognite.pygen._query.executor import IS_THREADING_SUPPORTED, Progress, QueryExecutor, create_executor
+from cognite.pygen._query.reporting import BatchRetrieved, QueryEvent, QueryReporter
+from cognite.pygen._query.step import QueryResultStepList
+
+EXTERNAL_ID_PROPERTY = ("node", "externalId")
+# The characters used to split the external IDs, in the order they are sorted. External IDs starting with
+# other characters are still included in a partition, they are only not used to balance the partitions.
+PARTITION_ALPHABET = "-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+PARTITION_BOUNDARIES_CURSOR = "partitionBoundaries"
+
+
+def create_external_id_boundaries(
+    client: CogniteClient,
+    view_id: dm.ViewId,
+    filter: dm.Filter | None,
+    partitions: int,
+    max_workers: int = PARTITION_COUNT_MAX_WORKERS,
+) -> list[str]:
+    """Splits the nodes of a view into partitions of about the same size by external ID prefix.
+
+    The number of nodes starting with each character is counted. Prefixes with more nodes than the size of
+    one partition are split once more by the next character. The boundaries are then placed such that
+    each partition gets about the same number of nodes.
+
+    The partitions are range filters evaluated by the server, which can sort the external IDs differently
+    than Python, for example, ignoring case. Thus, the boundaries are ordered by the number of nodes before
+    each of them, as counted by the server, such that the partitions never overlap or leave gaps.
+
+    Args:
+        client: The client used to count the nodes.
+        view_id: The view of the nodes.
+        filter: The filter the nodes are selected with.
+        partitions: The number of partitions.
+        max_workers: The maximum number of concurrent aggregate calls used to count the nodes.
+
+    Returns:
+        The external IDs at which each partition after the first one starts. This can have fewer
+        than partitions - 1 boundaries if the nodes cannot be split further, or if some of the aggregate
+        calls fail. If the nodes cannot be counted at all, there are no boundaries, i.e., a single partition.
+
+    """
+    if partitions <= 1:
+        return []
+    pool = create_executor(max_workers=max(1, max_workers), thread_name_prefix="pygen-partition-count")
+
+    def count(prefixes: Sequence[str]) -> dict[str, int] | None:
+        counts = pool.map(lambda prefix: _count(client, view_id, filter, prefix), prefixes)
+        count_by_prefix: dict[str, int] = {}
+        for prefix, prefix_count in zip(prefixes, counts, strict=True):
+            if prefix_count is None:
+                return None
+            count_by_prefix[prefix] = prefix_count
+        return count_by_prefix
+
+    try:
+        total = _count(client, view_id, filter)
+        count_by_prefix = count(list(PARTITION_ALPHABET)) if total is not None else None
+        if total is None or count_by_prefix is None:
+            return []
+        target = total / partitions
+        for prefix in [prefix for prefix, prefix_count in count_by_prefix.items() if prefix_count > target]:
+            if (children := count([prefix + char for char in PARTITION_ALPHABET])) is None:
+                # The prefix is kept as a single candidate, which gives less balanced partitions.
+                continue
+            # The nodes with exactly the prefix as external ID, these are sorted before the children.
+            count_by_prefix[prefix] -= sum(children.values())
+            count_by_prefix.update(children)
+
+        candidates: list[str] = []
+        cumulative = 0
+        for prefix in sorted(count_by_prefix.keys()):
+            if len(candidates) == partitions - 1:
+                break
+            if cumulative >= target * (len(candidates) + 1):
+                candidates.append(prefix)
+            cumulative += count_by_prefix[prefix]
+
+        counts_before = pool.map(lambda boundary: _count(client, view_id, filter, before=boundary), candidates)
+        # A candidate that cannot be counted is skipped, which merges the two partitions around it.
+        count_before_by_boundary = {
+            boundary: count_before
+            for boundary, count_before in zip(candidates, counts_before, strict=True)
+            if count_before is not None
+        }
+    finally:
+        pool.shutdown(wait=True)
+
+    boundaries: list[str] = []
+    last_count = 0
+    for boundary in sorted(count_before_by_boundary, key=count_before_by_boundary.__getitem__):
+        # A boundary with the same number of nodes before it as the previous one gives an empty partition.
+        if count_before_by_boundary[boundary] > last_count:
+            boundaries.append(boundary)
+            last_count = count_before_by_boundary[boundary]
+    return boundaries
+
+
+def _count(
+    client: CogniteClient,
+    view_id: dm.ViewId,
+    filter: dm.Filter | None,
+    prefix: str | None = None,
+    before: str | None = None,
+) -> int | None:
+    """Counts the nodes matching the filter, None if the aggregate call fails."""
+    filters = [item for item in [filter] if item is not None]
+    if prefix is not None:
+        filters.append(dm.filters.Prefix(EXTERNAL_ID_PROPERTY, prefix))
+    if before is not None:
+        filters.append(dm.filters.Range(EXTERNAL_ID_PROPERTY, lt=before))
+    aggregate_filter = dm.filters.And(*filters) if len(filters) > 1 else next(iter(filters), None)
+    try:
+        result = client.data_modeling.instances.aggregate(
+            view_id, Count("externalId"), instance_type="node", filter=aggregate_filter
+        )
+    except CogniteAPIError:
+        return None
+    return int(result.value or 0)
+
+
+def create_partition_filter(boundaries: Sequence[str], partition: int) -> dm.Filter | None:
+    """Creates the filter selecting the nodes of a partition, None if there is a single partition."""
+    gte = boundaries[partition - 1] if partition > 0 else None
+    lt = boundaries[partition] if partition < len(boundaries) else None
+    if gte is None and lt is None:
+        return None
+    return dm.filters.Range(EXTERNAL_ID_PROPERTY, gte=gte, lt=lt)
+
+
+class _PartitionsReporter:
+    """Reports the batches of all partitions as the batches of a single query.
+
+    The batches are numbered across the partitions, and the total retrieved and the estimated total are
+    those of all partitions, such that, for example, the progress is estimated once for the whole query.
+
+    Args:
+        reporter: Receives the combined events.
+        partitions: The partitions that are iterated over.
+        total: The estimated total number of nodes in all partitions. This can be a future, such that
+            the count can run concurrently with the first batches.
+
+    """
+
+    def __init__(
+        self, reporter: QueryReporter, partitions: Sequence[int], total: float | Future[float | None] | None
+    ) -> None:
+        self._reporter = reporter
+        self._total = total
+        self._retrieved_by_partition = dict.fromkeys(partitions, 0)
+        self._unfinished = set(partitions)
+        self._batch_count = 0
+        # The events can be emitted from the workers of several partitions at the same time.
+        self._lock = threading.Lock()
+
+    def for_partition(self, partition: int) -> QueryReporter:
+        return _PartitionReporter(self, partition)
+
+    def on_event(self, partition: int, event: QueryEvent) -> None:
+        with self._lock:
+            if isinstance(event, BatchRetrieved):
+                self._batch_count += 1
+                self._retrieved_by_partition[partition] = event.total_retrieved
+                if event.is_finished:
+                    self._unfinished.discard(partition)
+                event = dataclasses.replace(
+                    event,
+                    batch_no=self._batch_count,
+                    total_retrieved=sum(self._retrieved_by_partition.values()),
+                    estimated_total=self._estimated_total(),
+                    is_finished=not self._unfinished,
+                )
+            self._reporter.on_event(event)
+
+    def _estimated_total(self) -> float | None:
+        if isinstance(self._total, Future):
+            if not self._total.done():
+                return None
+            self._total = None if self._total.exception() else self._total.result()
+        return self._total
+
+
+class _PartitionReporter(QueryReporter):
+    def __init__(self, partitions_reporter: _PartitionsReporter, partition: int) -> None:
+        self._partitions_reporter = partitions_reporter
+        self._partition = partition
+
+    def on_event(self, event: QueryEvent) -> None:
+        self._partitions_reporter.on_event(self._partition, event)
+
+
+class PartitionedQueryExecutor:
+    """Executes a query as disjoint partitions of the root nodes, each paged by its own worker.
+
+    The batches of all partitions are merged into one stream in the order they are retrieved. The cursors of
+    each yielded batch contain the cursors of all partitions that are not finished, as well as the partition
+    boundaries, and can be passed as init_cursors to resume the iteration.
+
+    Args:
+        build: Builds the query executor of a partition given the partition filter.
+        boundaries: The external IDs at which each partition after the first one starts.
+
+    """
+
+    def __init__(self, build: Callable[[dm.Filter | None], QueryExecutor], boundaries: Sequence[str]) -> None:
+        self._build = build
+        self._boundaries = list(boundaries)
+        # The cursors of the last yielded batch of each partition that is not finished.
+        self._cursors_by_partition: dict[int, dict[str, str | None]] = {}
+
+    @property
+    def partition_count(self) -> int:
+        return len(self._boundaries) + 1
+
+    @staticmethod
+    def load_boundaries(cursors: dict[str, str | None] | None) -> list[str] | None:
+        """Returns the partition boundaries stored in the cursors of a partitioned iteration, if any."""
+        if not cursors or (dumped := cursors.get(PARTITION_BOUNDARIES_CURSOR)) is None:
+            return None
+        return json.loads(dumped)
+
+    def iterate(
+        self,
+        client: CogniteClient,
+        remove_not_connected: bool = False,
+        init_cursors: dict[str, str | None] | None = None,
+        reporter: QueryReporter | None = None,
+    ) -> Iterator[QueryResultStepList]:
+        """Iterate over the query results of all partitions, one batch at a time.
+
+        Args:
+            client: The client to use for the queries.
+            remove_not_connected: Whether to remove nodes/edges that are not connected through the entire query.
+            init_cursors: The cursors of a batch from a previous partitioned iteration with the same boundaries.
+                The partitions that are not in the cursors were finished, and are skipped.
+            reporter: Receives the events of the execution of all partitions, reported as the events of a
+                single query. Defaults to printing the progress of large queries.
+
+        Returns:
+            An iterator over the batches of results.
+
+        """
+        self._cursors_by_partition = self._load_cursors(init_cursors)
+        executor_by_partition = {
+            partition: self._build(create_partition_filter(self._boundaries, partition))
+            for partition in self._cursors_by_partition
+        }
+        if not executor_by_partition:
+            return
+        # The total is counted once for the whole query, instead of once by each partition.
+        total_executor = self._build(None)
+        partitions_reporter = _PartitionsReporter(
+            reporter or Progress(),
+            list(executor_by_partition),
+            total_executor._start_count_total(client, total_executor._get_select_step()),
+        )
+        if not IS_THREADING_SUPPORTED or len(executor_by_partition) == 1:
+            for partition, executor in executor_by_partition.items():
+                for batch_results in executor.iterate(
+                    client,
+                    remove_not_connected,
+                    self._cursors_by_partition[partition] or None,
+                    reporter=partitions_reporter.for_partition(partition),
+                    estimate_total=False,
+                ):
+                    yield self._with_cursors(partition, batch_results, executor.is_finished)
+            return
+        yield from self._iterate_concurrently(client, executor_by_partition, remove_not_connected, partitions_reporter)
+
+    def _iterate_concurrently(
+        self,
+        client: CogniteClient,
+        executor_by_partition: dict[int, QueryExecutor],
+        remove_not_connected: bool,
+        partitions_reporter: _PartitionsReporter,
+    ) -> Iterator[QueryResultStepList]:
+        # The queue is bounded, such that the workers wait for the caller when it is slower than the API.
+        results: queue.Queue[tuple[int, QueryResultStepList | BaseException | None, bool]] = queue.Queue(
+            maxsize=len(executor_by_partition)
+        )
+        stop = threading.Event()
+
+        def put(item: tuple[int, QueryResultStepList | BaseException | None, bool]) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(partition: int, executor: QueryExecutor) -> None:
+            try:
+                for batch_results in executor.iterate(
+                    client,
+                    remove_not_connected,
+                    self._cursors_by_partition[partition] or None,
+                    reporter=partitions_reporter.for_partition(partition),
+                    estimate_total=False,
+                ):
+                    if not put((partition, batch_results, executor.is_finished)):
+                        return
+            except BaseException as e:
+                put((partition, e, True))
+                return
+            put((partition, None, True))
+
+        pool = create_executor(max_workers=len(executor_by_partition), thread_name_prefix="pygen-partition")
+        try:
+            for partition, executor in executor_by_partition.items():
+                pool.submit(run, partition, executor)
+            remaining = set(executor_by_partition)
+            while remaining:
+                partition, item, is_finished = results.get()
+                if isinstance(item, BaseException):
+                    raise item
+                elif item is None:
+                    remaining.discard(partition)
+                    continue
+                yield self._with_cursors(partition, item, is_finished)
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _with_cursors(
+        self, partition: int, batch_results: QueryResultStepList, is_finished: bool
+    ) -> QueryResultStepList:
+        if is_finished:
+            self._cursors_by_partition.pop(partition, None)
+        else:
+            self._cursors_by_partition[partition] = batch_results._cursors
+        batch_results._cursors = self._dump_cursors()
+        return batch_results
+
+    def _load_cursors(self, cursors: dict[str, str | None] | None) -> dict[int, dict[str, str | None]]:
+        if not cursors:
+            return {partition: {} for partition in range(self.partition_count)}
+        if self.load_boundaries(cursors) != self._boundaries:
+            raise ValueError("The cursors are from an iteration with different partitions")
+        cursors_by_partition: dict[int, dict[str, str | None]] = {}
+        for key, cursor in cursors.items():
+            if key == PARTITION_BOUNDARIES_CURSOR:
+                continue
+            partition, name = key.split("/", maxsplit=1)
+            partition_cursors = cursors_by_partition.setdefault(int(partition), {})
+            if name:
+                partition_cursors[name] = cursor
+        return cursors_by_partition
+
+    def _dump_cursors(self) -> dict[str, str | None]:
+        cursors: dict[str, str | None] = {PARTITION_BOUNDARIES_CURSOR: json.dumps(self._boundaries)}
+        for partition, partition_cursors in sorted(self._cursors_by_partition.items()):
+            if not partition_cursors:
+                # The partition has not started, it is kept such that it is not skipped when resuming.
+                cursors[f"{partition}/"] = None
+            for name, cursor in partition_cursors.items():
+                cursors[f"{partition}/{name}"] = cursor
+        return cursors
@@ -34,7 +34,17 @@ class PygenConfig:
 
     Args:
         naming: The naming convention used by pygen.
+        filtering: The filtering methods pygen generates.
+        compact_read_classes: Whether to generate a compact, read-only version of each node data class, in addition
+            to the pydantic read class. The compact classes store their values in slots, and use a fraction of the
+            memory of the pydantic classes. They are returned by the `list_compact` method of the node APIs.
+        msgspec_read_classes: Whether to generate a msgspec Struct version of each node data class, in addition to
+            the pydantic read class. The API responses are decoded directly into the Structs, without validation
+            through pydantic. They are returned by the `list_structs` method of the node APIs, and require msgspec
+            to be installed.
     """
 
     naming: NamingConfig = dataclass_field(default_factory=NamingConfig)
     filtering: Filtering = dataclass_field(default_factory=Filtering)
+    compact_read_classes: bool = False
+    msgspec_read_classes: bool = False
@@ -1,3 +1,3 @@
-from cognite_core._api_client import CogniteCoreClient
+from cognite_core._api_client import AsyncCogniteCoreClient, CogniteCoreClient
 
-__all__ = ["CogniteCoreClient"]
+__all__ = ["AsyncCogniteCoreClient", "CogniteCoreClient"]
@@ -16,6 +16,7 @@
     NodeAPI,
     SequenceNotStr,
 )
+from cognite_core.config import global_config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -432,7 +433,11 @@ def _build(
                 has_container_fields=True,
             )
         )
-        return builder.build()
+        return builder.build(
+            raw=global_config.raw_read,
+            batch_limit_store=global_config.batch_limit_store,
+            target_latency=global_config.target_query_latency,
+        )
 
     def iterate(
         self,
@@ -450,6 +455,8 @@ def iterate(
         filter: dm.Filter | None = None,
         limit: int | None = None,
         cursors: dict[str, str | None] | None = None,
+        prefetch: int = 0,
+        partitions: int = 1,
     ) -> Iterator[CogniteAssetClassList]:
         """Iterate over Cognite asset class
 
@@ -470,6 +477,11 @@ def iterate(
             limit: Maximum number of Cognite asset class to return. Defaults to None, which will return all items.
             cursors: (Advanced) Cursor to use for pagination. This can be used to resume an iteration from a
                 specific point. See example below for more details.
+            prefetch: The number of chunks to fetch ahead in the background while the current chunk is being
+                processed. Defaults to 0, which disables prefetching. Not supported together with partitions.
+            partitions: The number of partitions to split the Cognite asset class into by external ID.
+                Each partition is retrieved concurrently, and the chunks are returned in the order they are
+                retrieved. Defaults to 1, which retrieves all Cognite asset class in order.
 
         Returns:
             Iteration of Cognite asset class
@@ -529,7 +541,9 @@ def iterate(
             space,
             filter,
         )
-        yield from self._iterate(chunk_size, filter_, limit, "skip", cursors=cursors)
+        yield from self._iterate(
+            chunk_size, filter_, limit, "skip", cursors=cursors, prefetch=prefetch, partitions=partitions
+        )
 
     def list(
         self,
@@ -5,7 +5,7 @@
 from pathlib import Path
 from typing import Any
 
-from cognite.client import ClientConfig, CogniteClient
+from cognite.client import AsyncCogniteClient, ClientConfig, CogniteClient
 from cognite.client import data_modeling as dm
 from cognite.client.credentials import OAuthClientCredentials
 from cognite.client.data_classes import FileMetadataList, SequenceList, TimeSeriesList
@@ -43,7 +43,14 @@
     CogniteUnitAPI,
     CogniteVisualizableAPI,
 )
-from cognite_core._api._core import GraphQLQueryResponse, SequenceNotStr
+from cognite_core._api._core import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    AsyncNodeReadAPI,
+    GraphQLQueryResponse,
+    InstanceCache,
+    SequenceNotStr,
+)
 from cognite_core.data_classes._core import DEFAULT_INSTANCE_SPACE, GraphQLList
 
 
@@ -76,6 +83,7 @@ def __init__(self, config_or_client: CogniteClient | ClientConfig):
             client.config.client_name = f"CognitePygen:0.0.0:SDK:{client.config.client_name}"
 
         self._client = client
+        self._instance_cache: InstanceCache | None = None
 
         self.cognite_360_image = Cognite360ImageAPI(client)
         self.cognite_360_image_collection = Cognite360ImageCollectionAPI(client)
@@ -140,6 +148,7 @@ def upsert(
             auto_create_end_nodes=True,
             replace=replace,
         )
+        self._invalidate_cache(result.nodes.as_ids())
         time_series = TimeSeriesList([])
         if instances.time_series:
             time_series = self._client.time_series.upsert(instances.time_series, mode="patch")
@@ -205,12 +214,12 @@ def delete(
                 >>> client.delete("my_node_external_id")
         """
         if isinstance(external_id, str):
-            return self._client.data_modeling.instances.delete(nodes=(space, external_id))
+            result = self._client.data_modeling.instances.delete(nodes=(space, external_id))
         elif isinstance(external_id, dm.NodeId):
-            return self._client.data_modeling.instances.delete(nodes=external_id)
+            result = self._client.data_modeling.instances.delete(nodes=external_id)
         elif isinstance(external_id, data_classes.DomainModelWrite):
             resources = self._create_instances(external_id, False)
-            return self._client.data_modeling.instances.delete(
+            result = self._client.data_modeling.instances.delete(
                 nodes=resources.nodes.as_ids(),
                 edges=resources.edges.as_ids(),
             )
@@ -230,11 +239,78 @@ def delete(
                     raise ValueError(
                         f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
                     )
-            return self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
+            result = self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
         else:
             raise ValueError(
                 f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
             )
+        self._invalidate_cache(result.nodes)
+        return result
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared by all APIs of the client, and the nodes are invalidated by upsert and delete
+        through this client. Changes made by other clients are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        cache = InstanceCache(maxsize, ttl, ttl_by_view)
+        self._set_instance_cache(cache)
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._set_instance_cache(None)
+
+    def _set_instance_cache(self, cache: InstanceCache | None) -> None:
+        self._instance_cache = cache
+        self.cognite_360_image._instance_cache = cache
+        self.cognite_360_image_collection._instance_cache = cache
+        self.cognite_360_image_model._instance_cache = cache
+        self.cognite_360_image_station._instance_cache = cache
+        self.cognite_3_d_model._instance_cache = cache
+        self.cognite_3_d_object._instance_cache = cache
+        self.cognite_3_d_revision._instance_cache = cache
+        self.cognite_3_d_transformation_node._instance_cache = cache
+        self.cognite_activity._instance_cache = cache
+        self.cognite_asset._instance_cache = cache
+        self.cognite_asset_class._instance_cache = cache
+        self.cognite_asset_type._instance_cache = cache
+        self.cognite_cad_model._instance_cache = cache
+        self.cognite_cad_node._instance_cache = cache
+        self.cognite_cad_revision._instance_cache = cache
+        self.cognite_cube_map._instance_cache = cache
+        self.cognite_describable_node._instance_cache = cache
+        self.cognite_equipment._instance_cache = cache
+        self.cognite_equipment_type._instance_cache = cache
+        self.cognite_file._instance_cache = cache
+        self.cognite_file_category._instance_cache = cache
+        self.cognite_point_cloud_model._instance_cache = cache
+        self.cognite_point_cloud_revision._instance_cache = cache
+        self.cognite_point_cloud_volume._instance_cache = cache
+        self.cognite_schedulable._instance_cache = cache
+        self.cognite_source_system._instance_cache = cache
+        self.cognite_sourceable_node._instance_cache = cache
+        self.cognite_time_series._instance_cache = cache
+        self.cognite_unit._instance_cache = cache
+        self.cognite_visualizable._instance_cache = cache
+
+    def _invalidate_cache(self, node_ids: Sequence[dm.NodeId]) -> None:
+        if self._instance_cache is not None:
+            self._instance_cache.invalidate(node_ids)
 
     def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
         """Execute a GraphQl query against the CogniteCore data model.
@@ -308,3 +384,109 @@ def _repr_html_(self) -> str:
 &nbsp;&nbsp;&nbsp;&nbsp;.upsert - Create or update any instance.<br />
 &nbsp;&nbsp;&nbsp;&nbsp;.delete - Delete instances.<br />
 """
+
+
+class AsyncCogniteCoreClient:
+    """
+    AsyncCogniteCoreClient
+
+    The asynchronous version of CogniteCoreClient. The requests are awaited using the AsyncCogniteClient,
+    such that many list, retrieve, search, and aggregate calls can run concurrently in a single event loop.
+
+    Generated with:
+        pygen = 0.0.0
+        cognite-sdk = 8.0.5
+        pydantic = 2.12.5
+
+    Data Model:
+        space: cdf_cdm
+        externalId: CogniteCore
+        version: v1
+    """
+
+    _data_model_id = dm.DataModelId("cdf_cdm", "CogniteCore", "v1")
+
+    def __init__(self, config_or_client: AsyncCogniteClient | CogniteClient | ClientConfig):
+        if isinstance(config_or_client, AsyncCogniteClient):
+            client, cognite_client = config_or_client, config_or_client.get_sync_client()
+        elif isinstance(config_or_client, CogniteClient):
+            client, cognite_client = config_or_client.get_async_client(), config_or_client
+        elif isinstance(config_or_client, ClientConfig):
+            client = AsyncCogniteClient(config_or_client)
+            cognite_client = client.get_sync_client()
+        else:
+            raise ValueError(
+                f"Expected AsyncCogniteClient, CogniteClient or ClientConfig, got {type(config_or_client)}"
+            )
+        # The synchronous client builds the queries and unpacks the results, it does not make any requests.
+        sync_client = CogniteCoreClient(cognite_client)
+        self._client = client
+        self._sync_client = sync_client
+
+        self.cognite_360_image = AsyncNodeReadAPI(sync_client.cognite_360_image, client)
+        self.cognite_360_image_collection = AsyncNodeReadAPI(sync_client.cognite_360_image_collection, client)
+        self.cognite_360_image_model = AsyncNodeReadAPI(sync_client.cognite_360_image_model, client)
+        self.cognite_360_image_station = AsyncNodeReadAPI(sync_client.cognite_360_image_station, client)
+        self.cognite_3_d_model = AsyncNodeReadAPI(sync_client.cognite_3_d_model, client)
+        self.cognite_3_d_object = AsyncNodeReadAPI(sync_client.cognite_3_d_object, client)
+        self.cognite_3_d_revision = AsyncNodeReadAPI(sync_client.cognite_3_d_revision, client)
+        self.cognite_3_d_transformation_node = AsyncNodeReadAPI(sync_client.cognite_3_d_transformation_node, client)
+        self.cognite_activity = AsyncNodeReadAPI(sync_client.cognite_activity, client)
+        self.cognite_asset = AsyncNodeReadAPI(sync_client.cognite_asset, client)
+        self.cognite_asset_class = AsyncNodeReadAPI(sync_client.cognite_asset_class, client)
+        self.cognite_asset_type = AsyncNodeReadAPI(sync_client.cognite_asset_type, client)
+        self.cognite_cad_model = AsyncNodeReadAPI(sync_client.cognite_cad_model, client)
+        self.cognite_cad_node = AsyncNodeReadAPI(sync_client.cognite_cad_node, client)
+        self.cognite_cad_revision = AsyncNodeReadAPI(sync_client.cognite_cad_revision, client)
+        self.cognite_cube_map = AsyncNodeReadAPI(sync_client.cognite_cube_map, client)
+        self.cognite_describable_node = AsyncNodeReadAPI(sync_client.cognite_describable_node, client)
+        self.cognite_equipment = AsyncNodeReadAPI(sync_client.cognite_equipment, client)
+        self.cognite_equipment_type = AsyncNodeReadAPI(sync_client.cognite_equipment_type, client)
+        self.cognite_file = AsyncNodeReadAPI(sync_client.cognite_file, client)
+        self.cognite_file_category = AsyncNodeReadAPI(sync_client.cognite_file_category, client)
+        self.cognite_point_cloud_model = AsyncNodeReadAPI(sync_client.cognite_point_cloud_model, client)
+        self.cognite_point_cloud_revision = AsyncNodeReadAPI(sync_client.cognite_point_cloud_revision, client)
+        self.cognite_point_cloud_volume = AsyncNodeReadAPI(sync_client.cognite_point_cloud_volume, client)
+        self.cognite_schedulable = AsyncNodeReadAPI(sync_client.cognite_schedulable, client)
+        self.cognite_source_system = AsyncNodeReadAPI(sync_client.cognite_source_system, client)
+        self.cognite_sourceable_node = AsyncNodeReadAPI(sync_client.cognite_sourceable_node, client)
+        self.cognite_time_series = AsyncNodeReadAPI(sync_client.cognite_time_series, client)
+        self.cognite_unit = AsyncNodeReadAPI(sync_client.cognite_unit, client)
+        self.cognite_visualizable = AsyncNodeReadAPI(sync_client.cognite_visualizable, client)
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared with the synchronous client used to unpack the results. This client does not
+        write, thus, changes are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        return self._sync_client.enable_cache(maxsize, ttl, ttl_by_view)
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._sync_client.disable_cache()
+
+    async def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
+        """Execute a GraphQl query against the CogniteCore data model.
+
+        Args:
+            query (str): The GraphQL query to issue.
+            variables (dict[str, Any] | None): An optional dict of variables to pass to the query.
+        """
+        data_model_id = dm.DataModelId("cdf_cdm", "CogniteCore", "v1")
+        result = await self._client.data_modeling.graphql.query(data_model_id, query, variables)
+        return GraphQLQueryResponse(data_model_id).parse(result)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -218,6 +220,28 @@ class Cognite360Image(Cognite3DTransformationNode, CogniteCubeMap):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "Cognite360Image", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "back",
+            "bottom",
+            "collection360",
+            "eulerRotationX",
+            "eulerRotationY",
+            "eulerRotationZ",
+            "front",
+            "left",
+            "right",
+            "scaleX",
+            "scaleY",
+            "scaleZ",
+            "station360",
+            "takenAt",
+            "top",
+            "translationX",
+            "translationY",
+            "translationZ",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     collection_360: Union[Cognite360ImageCollection, str, dm.NodeId, None] = Field(
@@ -233,6 +257,50 @@ class Cognite360Image(Cognite3DTransformationNode, CogniteCubeMap):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "back" in properties:
+            args["back"] = parse_single_connection(properties["back"], "back")
+        if "bottom" in properties:
+            args["bottom"] = parse_single_connection(properties["bottom"], "bottom")
+        if "collection360" in properties:
+            args["collection_360"] = parse_single_connection(properties["collection360"], "collection_360")
+        if "eulerRotationX" in properties:
+            args["euler_rotation_x"] = properties["eulerRotationX"]
+        if "eulerRotationY" in properties:
+            args["euler_rotation_y"] = properties["eulerRotationY"]
+        if "eulerRotationZ" in properties:
+            args["euler_rotation_z"] = properties["eulerRotationZ"]
+        if "front" in properties:
+            args["front"] = parse_single_connection(properties["front"], "front")
+        if "left" in properties:
+            args["left"] = parse_single_connection(properties["left"], "left")
+        if "right" in properties:
+            args["right"] = parse_single_connection(properties["right"], "right")
+        if "scaleX" in properties:
+            args["scale_x"] = properties["scaleX"]
+        if "scaleY" in properties:
+            args["scale_y"] = properties["scaleY"]
+        if "scaleZ" in properties:
+            args["scale_z"] = properties["scaleZ"]
+        if "station360" in properties:
+            args["station_360"] = parse_single_connection(properties["station360"], "station_360")
+        if "takenAt" in properties:
+            args["taken_at"] = parse_timestamp(properties["takenAt"])
+        if "top" in properties:
+            args["top"] = parse_single_connection(properties["top"], "top")
+        if "translationX" in properties:
+            args["translation_x"] = properties["translationX"]
+        if "translationY" in properties:
+            args["translation_y"] = properties["translationY"]
+        if "translationZ" in properties:
+            args["translation_z"] = properties["translationZ"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Cognite360ImageWrite:
         """Convert this read version of Cognite 360 image to the writing version."""
         return Cognite360ImageWrite.model_validate(as_write_args(self))
@@ -689,7 +757,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.back = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -703,7 +771,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "back"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.bottom = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -719,7 +787,7 @@ def __init__(
 
         if (
             _Cognite360ImageCollectionQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.collection_360 = _Cognite360ImageCollectionQuery(
                 created_types.copy(),
@@ -734,7 +802,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "collection360"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.front = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -748,7 +816,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "front"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.left = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -762,7 +830,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "left"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.right = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -778,7 +846,7 @@ def __init__(
 
         if (
             _Cognite360ImageStationQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.station_360 = _Cognite360ImageStationQuery(
                 created_types.copy(),
@@ -793,7 +861,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "station360"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.top = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
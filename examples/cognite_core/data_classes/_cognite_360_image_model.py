@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -153,6 +154,16 @@ class Cognite360ImageModel(Cognite3DModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "Cognite360ImageModel", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "description",
+            "name",
+            "tags",
+            "thumbnail",
+            "type",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     collections: Optional[list[Cognite360ImageCollection]] = Field(default=None, repr=False)
@@ -169,6 +180,26 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if "thumbnail" in properties:
+            args["thumbnail"] = parse_single_connection(properties["thumbnail"], "thumbnail")
+        if "type" in properties:
+            args["type_"] = properties["type"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Cognite360ImageModelWrite:
         """Convert this read version of Cognite 360 image model to the writing version."""
         return Cognite360ImageModelWrite.model_validate(as_write_args(self))
@@ -339,7 +370,7 @@ def __init__(
 
         if (
             _Cognite360ImageCollectionQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.collections = _Cognite360ImageCollectionQuery(
                 created_types.copy(),
@@ -354,7 +385,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "collections"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.thumbnail = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
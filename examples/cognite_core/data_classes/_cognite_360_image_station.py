@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -121,10 +122,37 @@ class Cognite360ImageStation(CogniteDescribableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "Cognite360ImageStation", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "description",
+            "groupType",
+            "name",
+            "tags",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     group_type: Optional[Literal["Station360"]] | str = Field(None, alias="groupType")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "groupType" in properties:
+            args["group_type"] = properties["groupType"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Cognite360ImageStationWrite:
         """Convert this read version of Cognite 360 image station to the writing version."""
         return Cognite360ImageStationWrite.model_validate(as_write_args(self))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -197,6 +198,20 @@ class Cognite3DObject(CogniteDescribableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "Cognite3DObject", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "description",
+            "name",
+            "tags",
+            "xMax",
+            "xMin",
+            "yMax",
+            "yMin",
+            "zMax",
+            "zMin",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     asset: Optional[CogniteAsset] = Field(default=None, repr=False)
@@ -224,6 +239,34 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if "xMax" in properties:
+            args["x_max"] = properties["xMax"]
+        if "xMin" in properties:
+            args["x_min"] = properties["xMin"]
+        if "yMax" in properties:
+            args["y_max"] = properties["yMax"]
+        if "yMin" in properties:
+            args["y_min"] = properties["yMin"]
+        if "zMax" in properties:
+            args["z_max"] = properties["zMax"]
+        if "zMin" in properties:
+            args["z_min"] = properties["zMin"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Cognite3DObjectWrite:
         """Convert this read version of Cognite 3D object to the writing version."""
         return Cognite3DObjectWrite.model_validate(as_write_args(self))
@@ -452,7 +495,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.asset = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -466,7 +509,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "asset"),
             )
 
-        if _CogniteCADNodeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteCADNodeQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.cad_nodes = _CogniteCADNodeQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -482,7 +525,7 @@ def __init__(
 
         if (
             _Cognite360ImageAnnotationQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.images_360 = _Cognite360ImageAnnotationQuery(
                 created_types.copy(),
@@ -500,7 +543,7 @@ def __init__(
 
         if (
             _CognitePointCloudVolumeQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.point_cloud_volumes = _CognitePointCloudVolumeQuery(
                 created_types.copy(),
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -147,6 +148,19 @@ class Cognite3DTransformationNode(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "Cognite3DTransformation", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "eulerRotationX",
+            "eulerRotationY",
+            "eulerRotationZ",
+            "scaleX",
+            "scaleY",
+            "scaleZ",
+            "translationX",
+            "translationY",
+            "translationZ",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -160,6 +174,32 @@ class Cognite3DTransformationNode(DomainModel):
     translation_y: Optional[float] = Field(None, alias="translationY")
     translation_z: Optional[float] = Field(None, alias="translationZ")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "eulerRotationX" in properties:
+            args["euler_rotation_x"] = properties["eulerRotationX"]
+        if "eulerRotationY" in properties:
+            args["euler_rotation_y"] = properties["eulerRotationY"]
+        if "eulerRotationZ" in properties:
+            args["euler_rotation_z"] = properties["eulerRotationZ"]
+        if "scaleX" in properties:
+            args["scale_x"] = properties["scaleX"]
+        if "scaleY" in properties:
+            args["scale_y"] = properties["scaleY"]
+        if "scaleZ" in properties:
+            args["scale_z"] = properties["scaleZ"]
+        if "translationX" in properties:
+            args["translation_x"] = properties["translationX"]
+        if "translationY" in properties:
+            args["translation_y"] = properties["translationY"]
+        if "translationZ" in properties:
+            args["translation_z"] = properties["translationZ"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Cognite3DTransformationNodeWrite:
         """Convert this read version of Cognite 3D transformation node to the writing version."""
         return Cognite3DTransformationNodeWrite.model_validate(as_write_args(self))
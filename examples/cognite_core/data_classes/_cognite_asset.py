@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,9 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -298,6 +301,28 @@ class CogniteAsset(CogniteVisualizable, CogniteDescribableNode, CogniteSourceabl
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteAsset", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "assetClass",
+            "description",
+            "name",
+            "object3D",
+            "parent",
+            "path",
+            "pathLastUpdatedTime",
+            "root",
+            "source",
+            "sourceContext",
+            "sourceCreatedTime",
+            "sourceCreatedUser",
+            "sourceId",
+            "sourceUpdatedTime",
+            "sourceUpdatedUser",
+            "tags",
+            "type",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     activities: Optional[list[CogniteActivity]] = Field(default=None, repr=False)
@@ -324,6 +349,50 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "assetClass" in properties:
+            args["asset_class"] = parse_single_connection(properties["assetClass"], "asset_class")
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "object3D" in properties:
+            args["object_3d"] = parse_single_connection(properties["object3D"], "object_3d")
+        if "parent" in properties:
+            args["parent"] = parse_single_connection(properties["parent"], "parent")
+        if "path" in properties:
+            args["path"] = parse_connection_list(properties["path"], "path")
+        if "pathLastUpdatedTime" in properties:
+            args["path_last_updated_time"] = parse_timestamp(properties["pathLastUpdatedTime"])
+        if "root" in properties:
+            args["root"] = parse_single_connection(properties["root"], "root")
+        if "source" in properties:
+            args["source"] = parse_single_connection(properties["source"], "source")
+        if "sourceContext" in properties:
+            args["source_context"] = properties["sourceContext"]
+        if "sourceCreatedTime" in properties:
+            args["source_created_time"] = parse_timestamp(properties["sourceCreatedTime"])
+        if "sourceCreatedUser" in properties:
+            args["source_created_user"] = properties["sourceCreatedUser"]
+        if "sourceId" in properties:
+            args["source_id"] = properties["sourceId"]
+        if "sourceUpdatedTime" in properties:
+            args["source_updated_time"] = parse_timestamp(properties["sourceUpdatedTime"])
+        if "sourceUpdatedUser" in properties:
+            args["source_updated_user"] = properties["sourceUpdatedUser"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if "type" in properties:
+            args["type_"] = parse_single_connection(properties["type"], "type_")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteAssetWrite:
         """Convert this read version of Cognite asset to the writing version."""
         return CogniteAssetWrite.model_validate(as_write_args(self))
@@ -791,7 +860,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteActivityQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteActivityQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.activities = _CogniteActivityQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -806,7 +878,10 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _CogniteAssetClassQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteAssetClassQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.asset_class = _CogniteAssetClassQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -820,7 +895,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "assetClass"),
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.children = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -834,7 +909,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "children"),
             )
 
-        if _CogniteEquipmentQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteEquipmentQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.equipment = _CogniteEquipmentQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -848,7 +926,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "equipment"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.files = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -863,7 +941,10 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _Cognite3DObjectQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _Cognite3DObjectQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.object_3d = _Cognite3DObjectQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -877,7 +958,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "object3D"),
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.parent = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -891,7 +972,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "parent"),
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.path = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -905,7 +986,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "path"),
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.root = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -919,7 +1000,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "root"),
             )
 
-        if _CogniteSourceSystemQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteSourceSystemQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.source = _CogniteSourceSystemQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -933,7 +1017,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "source"),
             )
 
-        if _CogniteTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.time_series = _CogniteTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -948,7 +1035,10 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _CogniteAssetTypeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteAssetTypeQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.type_ = _CogniteAssetTypeQuery(
                 created_types.copy(),
                 self._creation_path,
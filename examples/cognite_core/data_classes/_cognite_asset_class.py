@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -28,6 +28,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -124,11 +125,41 @@ class CogniteAssetClass(CogniteDescribableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteAssetClass", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "code",
+            "description",
+            "name",
+            "standard",
+            "tags",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     code: Optional[str] = None
     standard: Optional[str] = None
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "code" in properties:
+            args["code"] = properties["code"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "standard" in properties:
+            args["standard"] = properties["standard"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteAssetClassWrite:
         """Convert this read version of Cognite asset clas to the writing version."""
         return CogniteAssetClassWrite.model_validate(as_write_args(self))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -147,6 +148,17 @@ class CogniteAssetType(CogniteDescribableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteAssetType", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "assetClass",
+            "code",
+            "description",
+            "name",
+            "standard",
+            "tags",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     asset_class: Union[CogniteAssetClass, str, dm.NodeId, None] = Field(default=None, repr=False, alias="assetClass")
@@ -158,6 +170,28 @@ class CogniteAssetType(CogniteDescribableNode):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "assetClass" in properties:
+            args["asset_class"] = parse_single_connection(properties["assetClass"], "asset_class")
+        if "code" in properties:
+            args["code"] = properties["code"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "standard" in properties:
+            args["standard"] = properties["standard"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteAssetTypeWrite:
         """Convert this read version of Cognite asset type to the writing version."""
         return CogniteAssetTypeWrite.model_validate(as_write_args(self))
@@ -347,7 +381,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteAssetClassQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteAssetClassQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.asset_class = _CogniteAssetClassQuery(
                 created_types.copy(),
                 self._creation_path,
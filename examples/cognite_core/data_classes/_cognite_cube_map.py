@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -135,6 +136,16 @@ class CogniteCubeMap(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteCubeMap", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "back",
+            "bottom",
+            "front",
+            "left",
+            "right",
+            "top",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -150,6 +161,26 @@ class CogniteCubeMap(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "back" in properties:
+            args["back"] = parse_single_connection(properties["back"], "back")
+        if "bottom" in properties:
+            args["bottom"] = parse_single_connection(properties["bottom"], "bottom")
+        if "front" in properties:
+            args["front"] = parse_single_connection(properties["front"], "front")
+        if "left" in properties:
+            args["left"] = parse_single_connection(properties["left"], "left")
+        if "right" in properties:
+            args["right"] = parse_single_connection(properties["right"], "right")
+        if "top" in properties:
+            args["top"] = parse_single_connection(properties["top"], "top")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteCubeMapWrite:
         """Convert this read version of Cognite cube map to the writing version."""
         return CogniteCubeMapWrite.model_validate(as_write_args(self))
@@ -433,7 +464,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.back = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -447,7 +478,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "back"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.bottom = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -461,7 +492,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "bottom"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.front = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -475,7 +506,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "front"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.left = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -489,7 +520,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "left"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.right = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -503,7 +534,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "right"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.top = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
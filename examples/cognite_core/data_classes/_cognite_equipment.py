@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,9 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -256,6 +259,26 @@ class CogniteEquipment(CogniteDescribableNode, CogniteSourceableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteEquipment", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "asset",
+            "description",
+            "equipmentType",
+            "files",
+            "manufacturer",
+            "name",
+            "serialNumber",
+            "source",
+            "sourceContext",
+            "sourceCreatedTime",
+            "sourceCreatedUser",
+            "sourceId",
+            "sourceUpdatedTime",
+            "sourceUpdatedUser",
+            "tags",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     activities: Optional[list[CogniteActivity]] = Field(default=None, repr=False)
@@ -280,6 +303,46 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "asset" in properties:
+            args["asset"] = parse_single_connection(properties["asset"], "asset")
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "equipmentType" in properties:
+            args["equipment_type"] = parse_single_connection(properties["equipmentType"], "equipment_type")
+        if "files" in properties:
+            args["files"] = parse_connection_list(properties["files"], "files")
+        if "manufacturer" in properties:
+            args["manufacturer"] = properties["manufacturer"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "serialNumber" in properties:
+            args["serial_number"] = properties["serialNumber"]
+        if "source" in properties:
+            args["source"] = parse_single_connection(properties["source"], "source")
+        if "sourceContext" in properties:
+            args["source_context"] = properties["sourceContext"]
+        if "sourceCreatedTime" in properties:
+            args["source_created_time"] = parse_timestamp(properties["sourceCreatedTime"])
+        if "sourceCreatedUser" in properties:
+            args["source_created_user"] = properties["sourceCreatedUser"]
+        if "sourceId" in properties:
+            args["source_id"] = properties["sourceId"]
+        if "sourceUpdatedTime" in properties:
+            args["source_updated_time"] = parse_timestamp(properties["sourceUpdatedTime"])
+        if "sourceUpdatedUser" in properties:
+            args["source_updated_user"] = properties["sourceUpdatedUser"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteEquipmentWrite:
         """Convert this read version of Cognite equipment to the writing version."""
         return CogniteEquipmentWrite.model_validate(as_write_args(self))
@@ -662,7 +725,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteActivityQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteActivityQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.activities = _CogniteActivityQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -677,7 +743,7 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.asset = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -691,7 +757,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "asset"),
             )
 
-        if _CogniteEquipmentTypeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteEquipmentTypeQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.equipment_type = _CogniteEquipmentTypeQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -705,7 +774,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "equipmentType"),
             )
 
-        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteFileQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.files = _CogniteFileQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -719,7 +788,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "files"),
             )
 
-        if _CogniteSourceSystemQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteSourceSystemQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.source = _CogniteSourceSystemQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -733,7 +805,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "source"),
             )
 
-        if _CogniteTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.time_series = _CogniteTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
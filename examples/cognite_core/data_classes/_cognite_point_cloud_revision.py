@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -140,6 +141,15 @@ class CognitePointCloudRevision(Cognite3DRevision, protected_namespaces=()):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CognitePointCloudRevision", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "model3D",
+            "published",
+            "revisionId",
+            "status",
+            "type",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     model_3d: Union[CognitePointCloudModel, str, dm.NodeId, None] = Field(default=None, repr=False, alias="model3D")
@@ -150,6 +160,24 @@ class CognitePointCloudRevision(Cognite3DRevision, protected_namespaces=()):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "model3D" in properties:
+            args["model_3d"] = parse_single_connection(properties["model3D"], "model_3d")
+        if "published" in properties:
+            args["published"] = properties["published"]
+        if "revisionId" in properties:
+            args["revision_id"] = properties["revisionId"]
+        if "status" in properties:
+            args["status"] = properties["status"]
+        if "type" in properties:
+            args["type_"] = properties["type"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CognitePointCloudRevisionWrite:
         """Convert this read version of Cognite point cloud revision to the writing version."""
         return CognitePointCloudRevisionWrite.model_validate(as_write_args(self))
@@ -320,7 +348,7 @@ def __init__(
 
         if (
             _CognitePointCloudModelQuery not in created_types
-            and len(creation_path) + 1 < global_config.max_select_depth
+            and len(creation_path) + 1 < config.global_config.max_select_depth
         ):
             self.model_3d = _CognitePointCloudModelQuery(
                 created_types.copy(),
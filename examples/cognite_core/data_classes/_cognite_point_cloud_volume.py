@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -189,6 +191,21 @@ class CognitePointCloudVolume(CogniteDescribableNode, protected_namespaces=()):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CognitePointCloudVolume", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "description",
+            "formatVersion",
+            "model3D",
+            "name",
+            "object3D",
+            "revisions",
+            "tags",
+            "volume",
+            "volumeReferences",
+            "volumeType",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     format_version: Optional[str] = Field(None, alias="formatVersion")
@@ -211,6 +228,36 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "formatVersion" in properties:
+            args["format_version"] = properties["formatVersion"]
+        if "model3D" in properties:
+            args["model_3d"] = parse_single_connection(properties["model3D"], "model_3d")
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "object3D" in properties:
+            args["object_3d"] = parse_single_connection(properties["object3D"], "object_3d")
+        if "revisions" in properties:
+            args["revisions"] = parse_connection_list(properties["revisions"], "revisions")
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if "volume" in properties:
+            args["volume"] = properties["volume"]
+        if "volumeReferences" in properties:
+            args["volume_references"] = properties["volumeReferences"]
+        if "volumeType" in properties:
+            args["volume_type"] = properties["volumeType"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CognitePointCloudVolumeWrite:
         """Convert this read version of Cognite point cloud volume to the writing version."""
         return CognitePointCloudVolumeWrite.model_validate(as_write_args(self))
@@ -467,7 +514,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteCADModelQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteCADModelQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.model_3d = _CogniteCADModelQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -481,7 +531,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "model3D"),
             )
 
-        if _Cognite3DObjectQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _Cognite3DObjectQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.object_3d = _Cognite3DObjectQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -495,7 +548,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "object3D"),
             )
 
-        if _CogniteCADRevisionQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteCADRevisionQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.revisions = _CogniteCADRevisionQuery(
                 created_types.copy(),
                 self._creation_path,
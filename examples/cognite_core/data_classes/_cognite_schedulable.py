@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -119,6 +121,14 @@ class CogniteSchedulable(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteSchedulable", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "endTime",
+            "scheduledEndTime",
+            "scheduledStartTime",
+            "startTime",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -127,6 +137,22 @@ class CogniteSchedulable(DomainModel):
     scheduled_start_time: Optional[datetime.datetime] = Field(None, alias="scheduledStartTime")
     start_time: Optional[datetime.datetime] = Field(None, alias="startTime")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "endTime" in properties:
+            args["end_time"] = parse_timestamp(properties["endTime"])
+        if "scheduledEndTime" in properties:
+            args["scheduled_end_time"] = parse_timestamp(properties["scheduledEndTime"])
+        if "scheduledStartTime" in properties:
+            args["scheduled_start_time"] = parse_timestamp(properties["scheduledStartTime"])
+        if "startTime" in properties:
+            args["start_time"] = parse_timestamp(properties["startTime"])
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteSchedulableWrite:
         """Convert this read version of Cognite schedulable to the writing version."""
         return CogniteSchedulableWrite.model_validate(as_write_args(self))
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -164,6 +166,17 @@ class CogniteSourceableNode(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteSourceable", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "source",
+            "sourceContext",
+            "sourceCreatedTime",
+            "sourceCreatedUser",
+            "sourceId",
+            "sourceUpdatedTime",
+            "sourceUpdatedUser",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -180,6 +193,28 @@ class CogniteSourceableNode(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "source" in properties:
+            args["source"] = parse_single_connection(properties["source"], "source")
+        if "sourceContext" in properties:
+            args["source_context"] = properties["sourceContext"]
+        if "sourceCreatedTime" in properties:
+            args["source_created_time"] = parse_timestamp(properties["sourceCreatedTime"])
+        if "sourceCreatedUser" in properties:
+            args["source_created_user"] = properties["sourceCreatedUser"]
+        if "sourceId" in properties:
+            args["source_id"] = properties["sourceId"]
+        if "sourceUpdatedTime" in properties:
+            args["source_updated_time"] = parse_timestamp(properties["sourceUpdatedTime"])
+        if "sourceUpdatedUser" in properties:
+            args["source_updated_user"] = properties["sourceUpdatedUser"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteSourceableNodeWrite:
         """Convert this read version of Cognite sourceable node to the writing version."""
         return CogniteSourceableNodeWrite.model_validate(as_write_args(self))
@@ -392,7 +427,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteSourceSystemQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteSourceSystemQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.source = _CogniteSourceSystemQuery(
                 created_types.copy(),
                 self._creation_path,
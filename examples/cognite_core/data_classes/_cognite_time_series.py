@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from cognite_core.config import global_config
+from cognite_core import config
 from cognite_core.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -31,6 +31,9 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -252,6 +255,27 @@ class CogniteTimeSeries(CogniteDescribableNode, CogniteSourceableNode):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("cdf_cdm", "CogniteTimeSeries", "v1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "assets",
+            "description",
+            "equipment",
+            "isStep",
+            "name",
+            "source",
+            "sourceContext",
+            "sourceCreatedTime",
+            "sourceCreatedUser",
+            "sourceId",
+            "sourceUnit",
+            "sourceUpdatedTime",
+            "sourceUpdatedUser",
+            "tags",
+            "type",
+            "unit",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     activities: Optional[list[CogniteActivity]] = Field(default=None, repr=False)
@@ -274,6 +298,48 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "assets" in properties:
+            args["assets"] = parse_connection_list(properties["assets"], "assets")
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "equipment" in properties:
+            args["equipment"] = parse_connection_list(properties["equipment"], "equipment")
+        if "isStep" in properties:
+            args["is_step"] = properties["isStep"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "source" in properties:
+            args["source"] = parse_single_connection(properties["source"], "source")
+        if "sourceContext" in properties:
+            args["source_context"] = properties["sourceContext"]
+        if "sourceCreatedTime" in properties:
+            args["source_created_time"] = parse_timestamp(properties["sourceCreatedTime"])
+        if "sourceCreatedUser" in properties:
+            args["source_created_user"] = properties["sourceCreatedUser"]
+        if "sourceId" in properties:
+            args["source_id"] = properties["sourceId"]
+        if "sourceUnit" in properties:
+            args["source_unit"] = properties["sourceUnit"]
+        if "sourceUpdatedTime" in properties:
+            args["source_updated_time"] = parse_timestamp(properties["sourceUpdatedTime"])
+        if "sourceUpdatedUser" in properties:
+            args["source_updated_user"] = properties["sourceUpdatedUser"]
+        if "tags" in properties:
+            args["tags"] = properties["tags"]
+        if "type" in properties:
+            args["type_"] = properties["type"]
+        if "unit" in properties:
+            args["unit"] = parse_single_connection(properties["unit"], "unit")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CogniteTimeSeriesWrite:
         """Convert this read version of Cognite time series to the writing version."""
         return CogniteTimeSeriesWrite.model_validate(as_write_args(self))
@@ -641,7 +707,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _CogniteActivityQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteActivityQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.activities = _CogniteActivityQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -656,7 +725,7 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteAssetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.assets = _CogniteAssetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -670,7 +739,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "assets"),
             )
 
-        if _CogniteEquipmentQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteEquipmentQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.equipment = _CogniteEquipmentQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -684,7 +756,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "equipment"),
             )
 
-        if _CogniteSourceSystemQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _CogniteSourceSystemQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.source = _CogniteSourceSystemQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -698,7 +773,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "source"),
             )
 
-        if _CogniteUnitQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _CogniteUnitQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.unit = _CogniteUnitQuery(
                 created_types.copy(),
                 self._creation_path,
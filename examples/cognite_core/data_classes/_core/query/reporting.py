@@ -0,0 +1,204 @@
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+
+@dataclass(frozen=True)
+class QueryEvent:
+    """Base class for the events emitted by the QueryExecutor."""
+
+    def dump(self) -> dict[str, Any]:
+        return {"event": type(self).__name__, **asdict(self)}
+
+
+@dataclass(frozen=True)
+class BatchRetrieved(QueryEvent):
+    """A batch of the query has been retrieved, including the reverse direct relations of lists.
+
+    Args:
+        batch_no: The number of the batch, starting at 1.
+        root_count: The number of instances retrieved in the root step.
+        instance_count_by_step: The number of instances retrieved by step name.
+        query_time: The time in seconds used by the query call.
+        search_time: The time in seconds used by the /search calls for reverse direct relations of lists.
+        total_retrieved: The total number of root instances retrieved so far.
+        estimated_total: The estimated total number of root instances. None if not (yet) known.
+        batch_limits: The batch limits used for the query by step name.
+        is_finished: Whether this is the last batch.
+
+    """
+
+    batch_no: int
+    root_count: int
+    instance_count_by_step: dict[str, int]
+    query_time: float
+    search_time: float
+    total_retrieved: int
+    estimated_total: float | None
+    batch_limits: dict[str, int]
+    is_finished: bool
+
+    @property
+    def execution_time(self) -> float:
+        return self.query_time + self.search_time
+
+
+@dataclass(frozen=True)
+class QueryRetried(QueryEvent):
+    """A query call failed with a retryable error, and will be retried with a smaller batch limit.
+
+    Args:
+        status_code: The status code of the failed call, 408 (timeout) or 429 (throttled).
+        failed_after: The time in seconds until the call failed.
+
+    """
+
+    status_code: int
+    failed_after: float
+
+
+@dataclass(frozen=True)
+class BatchLimitChanged(QueryEvent):
+    """The batch limit of a query step has been adapted.
+
+    Args:
+        step_name: The name of the query step.
+        old_limit: The batch limit before the change.
+        new_limit: The batch limit after the change.
+        reason: Why the batch limit was changed.
+
+    """
+
+    step_name: str
+    old_limit: int
+    new_limit: int
+    reason: Literal["timeout", "throttled", "slow", "fast"]
+
+
+@dataclass(frozen=True)
+class SearchExecuted(QueryEvent):
+    """The /search calls for a reverse direct relation of lists step have been executed.
+
+    Args:
+        step_name: The name of the query step.
+        call_count: The number of /search calls.
+        instance_count: The number of unique instances found.
+        search_time: The time in seconds used by the /search calls.
+
+    """
+
+    step_name: str
+    call_count: int
+    instance_count: int
+    search_time: float
+
+
+class QueryReporter(ABC):
+    """Receives the events emitted by the QueryExecutor.
+
+    Subclass this and implement `on_event` to, for example, export metrics. Note that the events can
+    be emitted from a background thread, for example, when prefetching batches.
+    """
+
+    @abstractmethod
+    def on_event(self, event: QueryEvent) -> None:
+        raise NotImplementedError()
+
+
+class LoggingReporter(QueryReporter):
+    """Logs every event as a JSON message.
+
+    The event is also passed as the `pygen_event` attribute on the log record, such that it can be
+    picked up by structured logging handlers.
+
+    Args:
+        logger: The logger to use. Defaults to the 'cognite.pygen.query' logger.
+        level: The log level. Defaults to INFO.
+
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        self._logger = logger or logging.getLogger("cognite.pygen.query")
+        self._level = level
+
+    def on_event(self, event: QueryEvent) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+        dumped = event.dump()
+        self._logger.log(self._level, json.dumps(dumped), extra={"pygen_event": dumped})
+
+
+@dataclass
+class StatsReporter(QueryReporter):
+    """Aggregates the events in memory. This is useful for finding slow queries.
+
+    Example:
+
+        ```python
+        stats = StatsReporter()
+        executor.execute_query(client, reporter=stats)
+        print(stats.dump())
+        ```
+
+    """
+
+    batch_count: int = 0
+    instance_count: int = 0
+    root_count: int = 0
+    retry_count: int = 0
+    query_time: float = 0.0
+    search_time: float = 0.0
+    search_call_count: int = 0
+    search_time_by_step: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    batch_limit_changes: list[BatchLimitChanged] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def execution_time(self) -> float:
+        return self.query_time + self.search_time
+
+    @property
+    def root_per_second(self) -> float:
+        return self.root_count / self.execution_time if self.execution_time else 0.0
+
+    @property
+    def instances_per_second(self) -> float:
+        return self.instance_count / self.execution_time if self.execution_time else 0.0
+
+    def on_event(self, event: QueryEvent) -> None:
+        with self._lock:
+            if isinstance(event, BatchRetrieved):
+                self.batch_count += 1
+                self.root_count += event.root_count
+                self.instance_count += sum(event.instance_count_by_step.values())
+                self.query_time += event.query_time
+                self.search_time += event.search_time
+            elif isinstance(event, QueryRetried):
+                self.retry_count += 1
+                # The failed call is also part of the time spent querying.
+                self.query_time += event.failed_after
+            elif isinstance(event, SearchExecuted):
+                self.search_call_count += event.call_count
+                self.search_time_by_step[event.step_name] += event.search_time
+            elif isinstance(event, BatchLimitChanged):
+                self.batch_limit_changes.append(event)
+
+    def dump(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "batchCount": self.batch_count,
+                "instanceCount": self.instance_count,
+                "rootCount": self.root_count,
+                "retryCount": self.retry_count,
+                "queryTime": self.query_time,
+                "searchTime": self.search_time,
+                "searchCallCount": self.search_call_count,
+                "searchTimeByStep": dict(self.search_time_by_step),
+                "batchLimitChangeCount": len(self.batch_limit_changes),
+                "rootPerSecond": self.root_per_second,
+                "instancesPerSecond": self.instances_per_second,
+            }
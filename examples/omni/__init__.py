@@ -1,3 +1,3 @@
-from omni._api_client import OmniClient
+from omni._api_client import AsyncOmniClient, OmniClient
 
-__all__ = ["OmniClient"]
+__all__ = ["AsyncOmniClient", "OmniClient"]
@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field
 
+from .data_classes._core.query.reporting import QueryReporter
+from .data_classes._core.query.tuning import BatchLimitStore
 
-class GlobalConfig(BaseModel, validate_assignment=True):
+
+class GlobalConfig(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     """Global configuration for the generated SDK.
 
     Args:
@@ -9,11 +12,28 @@ class GlobalConfig(BaseModel, validate_assignment=True):
             Note setting this to False can lead to unexpected behavior if required fields are missing
             or have the wrong type.
         max_select_depth (int): The maximum depth of select queries. Defaults to 4.
+        query_reporter (QueryReporter | None): Receives the events of the executed queries, for example,
+            `LoggingReporter()` or `StatsReporter()` from `data_classes._core.query`. Defaults to None,
+            which prints the progress of large queries.
+        raw_read (bool): Whether to read instances straight from the JSON of the API responses, instead of
+            loading the responses into cognite-sdk nodes and edges first. This applies to list, search, retrieve,
+            and query calls, and reduces the CPU time and memory used per instance. If msgspec is installed,
+            it is used to decode the responses. Defaults to False.
+        batch_limit_store (BatchLimitStore | None): Stores the last stable batch limit of each query step, such that
+            the queries of the next run start from it instead of rediscovering it through timeouts, for example,
+            `BatchLimitStore()` from `data_classes._core.query`. Defaults to None.
+        target_query_latency (float | None): The target latency in seconds of a single query. If set, the batch
+            limits of the queries are reduced when a query is slower than this. Defaults to None, which only
+            reduces the batch limits on timeouts and throttling.
 
     """
 
     validate_retrieve: bool = True
     max_select_depth: int = Field(3, ge=1)
+    query_reporter: QueryReporter | None = None
+    raw_read: bool = False
+    batch_limit_store: BatchLimitStore | None = None
+    target_query_latency: float | None = Field(None, gt=0)
 
 
 global_config = GlobalConfig()
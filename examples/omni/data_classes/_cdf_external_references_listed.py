@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
@@ -14,7 +14,7 @@
 )
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -46,6 +46,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -135,6 +136,13 @@ class CDFExternalReferencesListed(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "CDFExternalReferencesListed", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "files",
+            "sequences",
+            "timeseries",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -142,6 +150,20 @@ class CDFExternalReferencesListed(DomainModel):
     sequences: Optional[list[Union[SequenceRead, str]]] = None
     timeseries: Optional[list[Union[TimeSeries, str]]] = None
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "files" in properties:
+            args["files"] = properties["files"]
+        if "sequences" in properties:
+            args["sequences"] = properties["sequences"]
+        if "timeseries" in properties:
+            args["timeseries"] = properties["timeseries"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> CDFExternalReferencesListedWrite:
         """Convert this read version of cdf external references listed to the writing version."""
         return CDFExternalReferencesListedWrite.model_validate(as_write_args(self))
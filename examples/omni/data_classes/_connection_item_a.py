@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -139,6 +140,13 @@ class ConnectionItemA(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "ConnectionItemA", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "name",
+            "otherDirect",
+            "selfDirect",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
@@ -163,6 +171,20 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "otherDirect" in properties:
+            args["other_direct"] = parse_single_connection(properties["otherDirect"], "other_direct")
+        if "selfDirect" in properties:
+            args["self_direct"] = parse_single_connection(properties["selfDirect"], "self_direct")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> ConnectionItemAWrite:
         """Convert this read version of connection item a to the writing version."""
         return ConnectionItemAWrite.model_validate(as_write_args(self))
@@ -383,7 +405,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _ConnectionItemCNodeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemCNodeQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.other_direct = _ConnectionItemCNodeQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -397,7 +422,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "otherDirect"),
             )
 
-        if _ConnectionItemBQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemBQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.outwards = _ConnectionItemBQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -411,7 +439,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "outwards"),
             )
 
-        if _ConnectionItemAQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemAQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.self_direct = _ConnectionItemAQuery(
                 created_types.copy(),
                 self._creation_path,
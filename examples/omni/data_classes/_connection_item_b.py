@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -128,6 +129,11 @@ class ConnectionItemB(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "ConnectionItemB", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "name",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
@@ -146,6 +152,16 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> ConnectionItemBWrite:
         """Convert this read version of connection item b to the writing version."""
         return ConnectionItemBWrite.model_validate(as_write_args(self))
@@ -298,7 +314,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _ConnectionItemAQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemAQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.inwards = _ConnectionItemAQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -312,7 +331,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "inwards"),
             )
 
-        if _ConnectionItemBQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemBQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.self_edge = _ConnectionItemBQuery(
                 created_types.copy(),
                 self._creation_path,
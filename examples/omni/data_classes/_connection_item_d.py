@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -132,6 +134,13 @@ class ConnectionItemD(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "ConnectionItemD", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "directMulti",
+            "directSingle",
+            "name",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
@@ -158,6 +167,20 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "directMulti" in properties:
+            args["direct_multi"] = parse_connection_list(properties["directMulti"], "direct_multi")
+        if "directSingle" in properties:
+            args["direct_single"] = parse_single_connection(properties["directSingle"], "direct_single")
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> ConnectionItemDWrite:
         """Convert this read version of connection item d to the writing version."""
         return ConnectionItemDWrite.model_validate(as_write_args(self))
@@ -387,7 +410,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _ConnectionItemEQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemEQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.direct_multi = _ConnectionItemEQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -401,7 +427,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "directMulti"),
             )
 
-        if _ConnectionItemEQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemEQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.direct_single = _ConnectionItemEQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -415,7 +444,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "directSingle"),
             )
 
-        if _ConnectionItemEQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemEQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.outwards_single = _ConnectionItemEQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -162,6 +164,13 @@ class ConnectionItemE(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "ConnectionItemE", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "directListNoSource",
+            "directNoSource",
+            "name",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
@@ -191,6 +200,22 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "directListNoSource" in properties:
+            args["direct_list_no_source"] = parse_connection_list(
+                properties["directListNoSource"], "direct_list_no_source"
+            )
+        if "directNoSource" in properties:
+            args["direct_no_source"] = parse_single_connection(properties["directNoSource"], "direct_no_source")
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> ConnectionItemEWrite:
         """Convert this read version of connection item e to the writing version."""
         return ConnectionItemEWrite.model_validate(as_write_args(self))
@@ -446,7 +471,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _ConnectionItemDQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemDQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.direct_reverse_multi = _ConnectionItemDQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -461,7 +489,10 @@ def __init__(
                 connection_type="reverse-list",
             )
 
-        if _ConnectionItemDQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemDQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.direct_reverse_single = _ConnectionItemDQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -475,7 +506,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "directReverseSingle"),
             )
 
-        if _ConnectionItemDQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionItemDQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.inwards_single = _ConnectionItemDQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -489,7 +523,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "inwardsSingle"),
             )
 
-        if _ConnectionEdgeAQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _ConnectionEdgeAQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.inwards_single_property = _ConnectionEdgeAQuery(
                 created_types.copy(),
                 self._creation_path,
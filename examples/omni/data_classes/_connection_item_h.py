@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -131,6 +133,13 @@ class ConnectionItemH(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "ConnectionItemH", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "directParentMulti",
+            "directParentSingle",
+            "name",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
@@ -156,6 +165,22 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "directParentMulti" in properties:
+            args["direct_parent_multi"] = parse_connection_list(properties["directParentMulti"], "direct_parent_multi")
+        if "directParentSingle" in properties:
+            args["direct_parent_single"] = parse_single_connection(
+                properties["directParentSingle"], "direct_parent_single"
+            )
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> ConnectionItemHWrite:
         """Convert this read version of connection item h to the writing version."""
         return ConnectionItemHWrite.model_validate(as_write_args(self))
@@ -381,7 +406,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _MainInterfaceQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _MainInterfaceQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.direct_parent_multi = _MainInterfaceQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -395,7 +420,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "directParentMulti"),
             )
 
-        if _MainInterfaceQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _MainInterfaceQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.direct_parent_single = _MainInterfaceQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -0,0 +1,295 @@
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Instance
+
+from omni.data_classes._core.query.step import QueryResultStep
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+
+INSTANCE_COLUMNS = ("space", "externalId", "version", "lastUpdatedTime", "createdTime")
+EDGE_COLUMNS = ("type", "startNode", "endNode")
+PARENT_INDEX_COLUMN = "_parentIndex"
+
+
+@dataclass
+class ColumnarTable:
+    """The instances retrieved in one query step, stored column by column.
+
+    The connection to the parent table is stored as row indices in compressed sparse row format, i.e.,
+    the parent rows of row i are `parent_index[parent_offsets[i]:parent_offsets[i + 1]]`.
+
+    Args:
+        name: The name of the table. This is the path of connection properties from the root, for
+            example, 'children.parent'. The root table has the name ''.
+        columns: The values of each column. Missing values are None.
+        parent: The name of the parent table. None for the root table.
+        parent_offsets: The offsets into the parent_index for each row.
+        parent_index: The rows in the parent table each row is connected to.
+
+    """
+
+    name: str
+    columns: dict[str, list[Any]]
+    parent: str | None = None
+    parent_offsets: list[int] = field(default_factory=lambda: [0])
+    parent_index: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.columns["externalId"])
+
+    def extend(self, other: "ColumnarTable", parent_row_offset: int = 0) -> None:
+        """Appends the rows of another table with the same name.
+
+        Args:
+            other: The table to append.
+            parent_row_offset: The number of rows in the parent table before the parent table of
+                the other table was appended. This is used to shift the parent indices.
+
+        """
+        row_count = len(self)
+        for name in self.columns.keys() - other.columns.keys():
+            self.columns[name].extend([None] * len(other))
+        for name, values in other.columns.items():
+            if name not in self.columns:
+                self.columns[name] = [None] * row_count
+            self.columns[name].extend(values)
+        offset = self.parent_offsets[-1]
+        self.parent_offsets.extend(offset + other_offset for other_offset in other.parent_offsets[1:])
+        self.parent_index.extend(parent_row_offset + row for row in other.parent_index)
+
+    def to_numpy(self) -> "dict[str, np.ma.MaskedArray]":
+        """Returns the columns as NumPy masked arrays, where the mask marks the missing values.
+
+        Booleans, integers, and floats get their NumPy dtype, all other values are stored as objects.
+        The connection to the parent is available through `parent_index_to_numpy`.
+        """
+        np = _import("numpy")
+        return {name: _as_masked_array(np, values) for name, values in self.columns.items()}
+
+    def parent_index_to_numpy(self) -> "tuple[np.ndarray, np.ndarray]":
+        """Returns the parent offsets and the parent index as NumPy int64 arrays."""
+        np = _import("numpy")
+        return np.asarray(self.parent_offsets, dtype=np.int64), np.asarray(self.parent_index, dtype=np.int64)
+
+    def to_arrow(self) -> "pa.Table":
+        """Returns the table as an Arrow table.
+
+        The connection to the parent is stored in the '_parentIndex' column as a list of parent rows.
+        """
+        pa = _import("pyarrow")
+        arrays = {name: pa.array(values) for name, values in self.columns.items()}
+        if self.parent is not None:
+            arrays[PARENT_INDEX_COLUMN] = pa.ListArray.from_arrays(
+                pa.array(self.parent_offsets, type=pa.int32()), pa.array(self.parent_index, type=pa.int64())
+            )
+        return pa.table(arrays)
+
+
+class ColumnarUnpacker:
+    """Unpacks the results of a query into one ColumnarTable per step.
+
+    Unlike the QueryUnpacker, this does not create a dictionary per instance. The properties are appended
+    directly to the column buffers, and the connections between the steps are stored as row indices.
+
+    Args:
+        steps: The steps of the query to unpack. A step must come after the step it is connected from.
+
+    """
+
+    def __init__(self, steps: Sequence[QueryResultStep]) -> None:
+        self._steps = steps
+
+    def unpack(self) -> dict[str, ColumnarTable]:
+        tables: dict[str, ColumnarTable] = {}
+        name_by_step: dict[str, str] = {}
+        step_by_name = {step.name: step for step in self._steps}
+        # The rows of each step by the node ID the next steps connect through.
+        rows_by_node_id_by_step: dict[str, dict[dm.NodeId, list[int]]] = {}
+        # Edges and reverse direct relations are not properties of the instances, they are only tables.
+        not_stored_by_step: dict[str, set[str]] = defaultdict(set)
+        for step in self._steps:
+            if step.from_ is not None and step.connection_property is not None and not self._is_direct_relation(step):
+                not_stored_by_step[step.from_].add(step.connection_property.property)
+
+        for step in self._steps:
+            if step.from_ is None:
+                table_name = ""
+            elif step.connection_property is not None and step.from_ in name_by_step:
+                parent_name = name_by_step[step.from_]
+                table_name = f"{parent_name}.{step.connection_property.property}".removeprefix(".")
+            else:
+                raise ValueError(f"Step {step.name!r} is not connected to a previous step.")
+            name_by_step[step.name] = table_name
+
+            table = ColumnarTable(table_name, self._create_columns(step, not_stored_by_step[step.name]))
+            if step.from_ is not None:
+                table.parent = name_by_step[step.from_]
+                self._add_parent_index(
+                    table, step, step_by_name[step.from_], rows_by_node_id_by_step.get(step.from_, {})
+                )
+            rows_by_node_id_by_step[step.name] = self._rows_by_node_id(step)
+            tables[table_name] = table
+        return tables
+
+    @staticmethod
+    def _is_direct_relation(step: QueryResultStep) -> bool:
+        node_expression = step.node_expression
+        return (
+            node_expression is not None
+            and node_expression.through is not None
+            and node_expression.direction == "outwards"
+        )
+
+    @staticmethod
+    def _create_columns(step: QueryResultStep, not_stored: set[str]) -> dict[str, list[Any]]:
+        selected = [prop for prop in step.selected_properties or [] if prop != "*"] or None
+        base_columns = [
+            column
+            for column in INSTANCE_COLUMNS + (EDGE_COLUMNS if step.edge_expression else ())
+            if column in ("space", "externalId") or selected is None or column in selected
+        ]
+        if selected is None:
+            # All properties are selected, the columns are the union of the properties of all instances.
+            property_names = list(
+                dict.fromkeys(key for instance in step.results for key in _get_properties(instance).keys())
+            )
+        else:
+            property_names = [
+                name for name in selected if name not in INSTANCE_COLUMNS + EDGE_COLUMNS and name not in not_stored
+            ]
+
+        columns: dict[str, list[Any]] = {name: [] for name in base_columns}
+        columns.update({name: [] for name in property_names})
+        for instance in step.results:
+            for column in base_columns:
+                columns[column].append(_get_base_value(instance, column))
+            properties = _get_properties(instance)
+            for name in property_names:
+                columns[name].append(properties.get(name))
+        return columns
+
+    @staticmethod
+    def _rows_by_node_id(step: QueryResultStep) -> dict[dm.NodeId, list[int]]:
+        rows_by_node_id: dict[dm.NodeId, list[int]] = defaultdict(list)
+        if edge_expression := step.edge_expression:
+            for row, edge in enumerate(step.edge_results):
+                target = edge.end_node if edge_expression.direction == "outwards" else edge.start_node
+                rows_by_node_id[dm.NodeId(target.space, target.external_id)].append(row)
+        else:
+            for row, node in enumerate(step.node_results):
+                rows_by_node_id[node.as_id()].append(row)
+        return rows_by_node_id
+
+    @classmethod
+    def _add_parent_index(
+        cls,
+        table: ColumnarTable,
+        step: QueryResultStep,
+        parent: QueryResultStep,
+        parent_rows_by_node_id: dict[dm.NodeId, list[int]],
+    ) -> None:
+        if edge_expression := step.edge_expression:
+            for edge in step.edge_results:
+                source = edge.start_node if edge_expression.direction == "outwards" else edge.end_node
+                cls._append_parent_rows(
+                    table, parent_rows_by_node_id.get(dm.NodeId(source.space, source.external_id), [])
+                )
+            return
+        node_expression = step.node_expression
+        through = node_expression.through if node_expression else None
+        if node_expression is None or through is None:
+            # The node is the target of the edges in the parent step.
+            for node in step.node_results:
+                cls._append_parent_rows(table, parent_rows_by_node_id.get(node.as_id(), []))
+        elif node_expression.direction == "inwards":
+            # Reverse direct relation, the node points to the parent(s).
+            for node in step.node_results:
+                parent_ids = _as_node_ids(_get_properties(node).get(through.property))
+                cls._append_parent_rows(
+                    table, [row for node_id in parent_ids for row in parent_rows_by_node_id.get(node_id, [])]
+                )
+        else:
+            # Direct relation, the parent points to the node.
+            parent_rows_by_target: dict[dm.NodeId, list[int]] = defaultdict(list)
+            for row, parent_node in enumerate(parent.node_results):
+                for target_id in _as_node_ids(_get_properties(parent_node).get(through.property)):
+                    parent_rows_by_target[target_id].append(row)
+            for node in step.node_results:
+                cls._append_parent_rows(table, parent_rows_by_target.get(node.as_id(), []))
+
+    @staticmethod
+    def _append_parent_rows(table: ColumnarTable, rows: list[int]) -> None:
+        table.parent_index.extend(sorted(set(rows)))
+        table.parent_offsets.append(len(table.parent_index))
+
+
+def concat_tables(tables: dict[str, ColumnarTable], other: dict[str, ColumnarTable]) -> None:
+    """Appends the tables of another unpacked result, shifting the parent indices accordingly."""
+    row_count_by_name = {name: len(table) for name, table in tables.items()}
+    for name, table in other.items():
+        if name not in tables:
+            tables[name] = table
+            continue
+        parent_row_offset = row_count_by_name.get(table.parent, 0) if table.parent is not None else 0
+        tables[name].extend(table, parent_row_offset)
+
+
+def _get_properties(instance: Instance) -> Mapping[str, Any]:
+    # The query steps retrieve properties from a single view.
+    return next(iter(instance.properties.values()), {})
+
+
+def _get_base_value(instance: Instance, column: str) -> Any:
+    if column == "externalId":
+        return instance.external_id
+    elif column == "lastUpdatedTime":
+        return instance.last_updated_time
+    elif column == "createdTime":
+        return instance.created_time
+    elif column in ("type", "startNode", "endNode"):
+        reference = getattr(instance, {"startNode": "start_node", "endNode": "end_node"}.get(column, column))
+        return None if reference is None else {"space": reference.space, "externalId": reference.external_id}
+    return getattr(instance, column)
+
+
+def _as_node_ids(value: Any) -> list[dm.NodeId]:
+    if isinstance(value, dict):
+        return [dm.NodeId(value["space"], value["externalId"])]
+    elif isinstance(value, list):
+        return [dm.NodeId(item["space"], item["externalId"]) for item in value if isinstance(item, dict)]
+    return []
+
+
+def _as_masked_array(np: Any, values: list[Any]) -> "np.ma.MaskedArray":
+    mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    non_null = [value for value in values if value is not None]
+    dtype: Any = object
+    fill: Any = None
+    if non_null and all(isinstance(value, bool) for value in non_null):
+        dtype, fill = np.bool_, False
+    elif non_null and all(isinstance(value, int) and not isinstance(value, bool) for value in non_null):
+        dtype, fill = np.int64, 0
+    elif non_null and all(isinstance(value, int | float) and not isinstance(value, bool) for value in non_null):
+        dtype, fill = np.float64, np.nan
+    if dtype is object:
+        # Assigning into an empty array avoids NumPy turning lists into extra dimensions.
+        data = np.empty(len(values), dtype=object)
+        data[:] = values
+    else:
+        data = np.array([fill if value is None else value for value in values], dtype=dtype)
+    return np.ma.MaskedArray(data, mask=mask)
+
+
+def _import(module: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for the columnar results. Install it with 'pip install {module}'"
+        ) from e
@@ -1,23 +1,44 @@
+import asyncio
 import datetime
+import json
+import sys
+import threading
 import time
 import warnings
-from collections.abc import Iterator, Sequence
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any, ClassVar, Literal, TypeAlias
 
-from cognite.client import CogniteClient
+from cognite.client import AsyncCogniteClient, CogniteClient
 from cognite.client.data_classes import data_modeling as dm
 from cognite.client.data_classes.aggregations import Count
 from cognite.client.exceptions import CogniteAPIError
 
 from omni.data_classes._core.query.constants import (
+    BATCH_LIMIT_INCREASE_STEPS,
+    COUNT_CACHE_SIZE,
+    COUNT_CACHE_TTL_SECONDS,
     IN_FILTER_CHUNK_SIZE,
     INSTANCE_QUERY_LIMIT,
     MINIMUM_ESTIMATED_SECONDS_BEFORE_PRINT_PROGRESS,
     PRINT_PROGRESS_PER_N_NODES,
     SEARCH_LIMIT,
+    SEARCH_MAX_WORKERS,
 )
 from omni.data_classes._core.query.processing import QueryResultCleaner
+from omni.data_classes._core.query.raw import query_raw, query_raw_async
+from omni.data_classes._core.query.reporting import (
+    BatchLimitChanged,
+    BatchRetrieved,
+    QueryEvent,
+    QueryReporter,
+    QueryRetried,
+    SearchExecuted,
+)
 from omni.data_classes._core.query.step import QueryBuildStep, QueryResultStep, QueryResultStepList
+from omni.data_classes._core.query.tuning import BatchLimitStore
 
 
 class QueryReducingBatchSize(UserWarning):
@@ -27,8 +48,13 @@ class QueryReducingBatchSize(UserWarning):
 
 
 @dataclass
-class Progress:
-    total: float | None
+class Progress(QueryReporter):
+    """Estimates and prints the progress of large queries.
+
+    This is the default reporter of the QueryExecutor. The progress is not estimated until the
+    estimated total of the query is known.
+    """
+
     _last_print: float = field(default=0.0, init=False)
     _estimated_nodes_per_second: float = field(default=0.0, init=False)
     _is_large_query: bool = field(default=False, init=False)
@@ -43,19 +69,20 @@ def _update_nodes_per_second(self, last_node_count: int, last_execution_time: fl
                 0.1 * last_batch_nodes_per_second + 0.9 * self._estimated_nodes_per_second
             )
 
-    def log(self, last_node_count: int, last_execution_time: float, total_retrieved: int) -> None:
-        if self.total is None:
+    def on_event(self, event: QueryEvent) -> None:
+        if isinstance(event, BatchRetrieved) and not event.is_finished:
+            self.log(event.root_count, event.execution_time, event.total_retrieved, event.estimated_total)
+
+    def log(self, last_node_count: int, last_execution_time: float, total_retrieved: int, total: float | None) -> None:
+        if total is None:
             return
         self._update_nodes_per_second(last_node_count, last_execution_time)
         # Estimate the time to completion
-        remaining_nodes = self.total - total_retrieved
+        remaining_nodes = total - total_retrieved
         remaining_time = remaining_nodes / self._estimated_nodes_per_second
         if self._is_large_query and (total_retrieved - self._last_print) > PRINT_PROGRESS_PER_N_NODES:
             estimate = datetime.timedelta(seconds=round(remaining_time, 0))
-            print(
-                f"Progress: {total_retrieved:,}/{self.total:,} nodes retrieved. "
-                f"Estimated time to completion: {estimate}"
-            )
+            print(f"Progress: {total_retrieved:,}/{total:,} nodes retrieved. Estimated time to completion: {estimate}")
             self._last_print = total_retrieved
         if self._is_large_query is False and remaining_time > MINIMUM_ESTIMATED_SECONDS_BEFORE_PRINT_PROGRESS:
             self._is_large_query = True
@@ -64,6 +91,12 @@ def log(self, last_node_count: int, last_execution_time: float, total_retrieved:
 
 @dataclass
 class PaginationStatus:
+    """Keeps track of the pagination of a single query step.
+
+    The max_retrieve_batch_limit is adapted during the execution, additive increase and multiplicative
+    decrease, but never above the max_batch_limit, which defaults to the initial max_retrieve_batch_limit.
+    """
+
     is_unlimited: bool
     max_retrieve_limit: int
     is_queryable: bool
@@ -71,6 +104,11 @@ class PaginationStatus:
     cursor: str | None = None
     total_retrieved: int = 0
     last_batch_count: int = 0
+    max_batch_limit: int = 0
+
+    def __post_init__(self) -> None:
+        if self.max_batch_limit <= 0:
+            self.max_batch_limit = self.max_retrieve_batch_limit
 
     @property
     def is_finished(self) -> bool:
@@ -80,6 +118,83 @@ def is_finished(self) -> bool:
             or self.last_batch_count == 0
         )
 
+    def increase_batch_limit(self) -> None:
+        step = max(1, self.max_batch_limit // BATCH_LIMIT_INCREASE_STEPS)
+        self.max_retrieve_batch_limit = min(self.max_batch_limit, self.max_retrieve_batch_limit + step)
+
+    def decrease_batch_limit(self, factor: float = 0.5) -> None:
+        self.max_retrieve_batch_limit = max(1, int(self.max_retrieve_batch_limit * factor))
+
+
+# Pyodide, which is used in the Cognite JupyterLab environment, does not support threads.
+IS_THREADING_SUPPORTED = sys.platform != "emscripten"
+
+
+class SequentialExecutor(Executor):
+    """Executor that runs the submitted calls immediately in the calling thread.
+
+    This is used as a fallback when threads are not supported.
+    """
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def create_executor(max_workers: int, thread_name_prefix: str = "") -> Executor:
+    if not IS_THREADING_SUPPORTED:
+        return SequentialExecutor()
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+
+CountKey: TypeAlias = tuple[str, dm.ViewId, str]
+
+
+class CountCache:
+    """Caches the total count of instances in a view matching a filter for a limited time.
+
+    Args:
+        ttl: The time to live of the cached counts in seconds.
+        maxsize: The maximum number of cached counts, the least recently used are evicted first.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = COUNT_CACHE_SIZE) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._count_by_key: OrderedDict[CountKey, tuple[float, float]] = OrderedDict()
+
+    @staticmethod
+    def create_key(project: str, view_id: dm.ViewId, filter: dm.Filter | None) -> CountKey:
+        dumped_filter = "" if filter is None else json.dumps(filter.dump(), sort_keys=True, default=str)
+        return project, view_id, dumped_filter
+
+    def get(self, key: CountKey) -> float | None:
+        with self._lock:
+            if (entry := self._count_by_key.get(key)) is None:
+                return None
+            created, count = entry
+            if time.monotonic() - created > self._ttl:
+                del self._count_by_key[key]
+                return None
+            self._count_by_key.move_to_end(key)
+            return count
+
+    def set(self, key: CountKey, count: float) -> None:
+        with self._lock:
+            self._count_by_key[key] = (time.monotonic(), count)
+            self._count_by_key.move_to_end(key)
+            while len(self._count_by_key) > self._maxsize:
+                self._count_by_key.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._count_by_key.clear()
+
 
 def chunker(sequence: Sequence, chunk_size: int) -> Iterator[Sequence]:
     """
@@ -97,26 +212,77 @@ def chunker(sequence: Sequence, chunk_size: int) -> Iterator[Sequence]:
         yield sequence[i : i + chunk_size]
 
 
+def bind_parameters(filter: dm.Filter | None, parameters: Mapping[str, Any]) -> dm.Filter | None:
+    """Replaces the parameters in a filter, i.e., `dm.filters.ParameterValue`, with their values.
+
+    The query endpoint binds the parameters of a query, while the filters of the /search and aggregate
+    calls must contain the values.
+
+    Args:
+        filter: The filter to bind the parameters of.
+        parameters: The values of the parameters.
+
+    Returns:
+        The filter with the values of the parameters, or the same filter if it has no parameters.
+
+    Raises:
+        ValueError: If a parameter used in the filter has no value.
+    """
+    if filter is None:
+        return None
+    dumped = filter.dump()
+    bound = _bind_parameters(dumped, parameters)
+    if bound == dumped:
+        return filter
+    return dm.filters.Filter.load(bound)
+
+
+def _bind_parameters(value: Any, parameters: Mapping[str, Any]) -> Any:
+    if isinstance(value, dict):
+        if value.keys() == {"parameter"}:
+            if (name := value["parameter"]) not in parameters:
+                raise ValueError(f"Missing value for the parameter {name!r}")
+            return parameters[name]
+        return {key: _bind_parameters(item, parameters) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_bind_parameters(item, parameters) for item in value]
+    return value
+
+
 class QueryExecutor:
+    _count_cache: ClassVar[CountCache] = CountCache(COUNT_CACHE_TTL_SECONDS)
+
     def __init__(
         self,
         steps: Sequence[QueryBuildStep],
         query: dm.query.Query,
         to_search: Sequence[QueryBuildStep],
         temp_select: set[str],
+        max_search_workers: int = SEARCH_MAX_WORKERS,
+        target_latency: float | None = None,
+        batch_limit_store: BatchLimitStore | None = None,
+        aliases: Mapping[str, str] | None = None,
+        raw: bool = False,
     ) -> None:
         step_names = set(step.name for step in steps)
         search_names = set(step.name for step in to_search)
+        aliases = aliases or {}
         if not set(query.with_).issubset(step_names):
             raise ValueError("Bug in Pygen: Query step must be a subset of the query steps")
         if not search_names.issubset(step_names):
             raise ValueError("Bug in Pygen: Search step must be a subset of the query steps")
-        if (search_names | set(query.with_)) != step_names:
-            raise ValueError("Bug in Pygen: All steps must be either a query or a search step")
+        if not set(aliases.values()).issubset(query.with_):
+            raise ValueError("Bug in Pygen: Merged steps must be read from a query step")
+        if (search_names | set(query.with_) | set(aliases)) != step_names:
+            raise ValueError("Bug in Pygen: All steps must be either a query, a search, or a merged step")
         self._steps = steps
         self._query = query
         self._to_search = to_search
         self._temp_select = temp_select
+        # Steps merged by the optimizer into an equivalent query step, the merged step -> the query step.
+        self._aliases = dict(aliases)
+        # Whether to post the query directly and keep the response JSON in the instances.
+        self.raw = raw
         self._status_by_name = {
             step.name: PaginationStatus(
                 step.is_unlimited,
@@ -127,75 +293,265 @@ def __init__(
             for step in steps
         }
         self._in_filter_chunk_size = IN_FILTER_CHUNK_SIZE
+        self._max_search_workers = max(1, max_search_workers)
+        self._target_latency = target_latency
+        self._batch_limit_store = batch_limit_store
+        # The batch limits used in the last successful query.
+        self._stable_batch_limits: dict[str, int] = {}
+        # The estimated total of the select step. This can be a future, such that the count can run
+        # concurrently with the first batches.
+        self._total: float | Future[float | None] | asyncio.Future[float | None] | None = None
+        self._batch_count = 0
+        # The filters of the /search and aggregate calls, with the parameters of the query bound.
+        self._raw_filter_by_name: dict[str, dm.Filter | None] = {}
+        if batch_limit_store is not None:
+            for step in steps:
+                if (stored_limit := batch_limit_store.get(step)) is not None:
+                    status = self._status_by_name[step.name]
+                    status.max_retrieve_batch_limit = min(stored_limit, status.max_batch_limit)
 
     def execute_query(
         self,
         client: CogniteClient,
         remove_not_connected: bool = False,
         init_cursors: dict[str, str | None] | None = None,
+        reporter: QueryReporter | None = None,
     ) -> list[QueryResultStep]:
         results: dict[str, QueryResultStep] = {}
-        for iterate_response in self.iterate(client, remove_not_connected, init_cursors):
-            for result in iterate_response:
-                if result.name in results:
-                    results[result.name].results.extend(result.results)
-                else:
-                    results[result.name] = result
+        for iterate_response in self.iterate(client, remove_not_connected, init_cursors, reporter=reporter):
+            self._merge_results(results, iterate_response)
         return list(results.values())
 
+    def iterate_resolved(
+        self,
+        client: CogniteClient,
+        remove_not_connected: bool = False,
+        reporter: QueryReporter | None = None,
+    ) -> Iterator[list[QueryResultStep]]:
+        """Iterate over the query results in groups of batches in which all connections are resolved.
+
+        A group is complete when none of the connected steps have more pages, i.e., all nodes and edges
+        connected to the root instances in the group have been retrieved. Unpacking the results group by
+        group gives the same result as unpacking the result of execute_query, while the memory used by
+        the raw instances scales with the batch size instead of the full result.
+
+        Args:
+            client: The client to use for the queries.
+            remove_not_connected: Whether to remove nodes/edges that are not connected through the entire query.
+            reporter: Receives the events of the execution. Defaults to printing the progress of large queries.
+
+        Returns:
+            An iterator over the groups of results.
+
+        """
+        results: dict[str, QueryResultStep] = {}
+        for batch_results in self.iterate(client, remove_not_connected, reporter=reporter):
+            self._merge_results(results, batch_results)
+            if self._is_connections_resolved():
+                yield list(results.values())
+                # Release the raw instances before the next batch is fetched.
+                results = {}
+        if results:
+            yield list(results.values())
+
+    @staticmethod
+    def _merge_results(results: dict[str, QueryResultStep], batch_results: QueryResultStepList) -> None:
+        for result in batch_results:
+            if result.name in results:
+                results[result.name].results.extend(result.results)
+            else:
+                results[result.name] = result
+
+    def _is_connections_resolved(self) -> bool:
+        return all(
+            self._status_by_name[step.name].is_finished
+            for step in self._steps
+            if step.from_ is not None and self._status_by_name[step.name].is_queryable
+        )
+
     def iterate(
         self,
         client: CogniteClient,
         remove_not_connected: bool = False,
         init_cursors: dict[str, str | None] | None = None,
+        prefetch: int = 0,
+        reporter: QueryReporter | None = None,
+        estimate_total: bool = True,
     ) -> Iterator[QueryResultStepList]:
-        select_step = next((step for step in self._steps if step.select is not None), None)
-        if select_step is None:
-            raise ValueError("No select step found in the query")
-        total = self.count_total(client, select_step)
-        progress = Progress(total)
+        """Iterate over the query results, one batch at a time.
+
+        Args:
+            client: The client to use for the queries.
+            remove_not_connected: Whether to remove nodes/edges that are not connected through the entire query.
+            init_cursors: The cursors to start the iteration from.
+            prefetch: The number of batches to fetch ahead in a background thread while the caller is
+                processing the current batch. Defaults to 0, which fetches the next batch only when requested.
+            reporter: Receives the events of the execution, such as retrieved batches, retries, and batch
+                limit changes. Defaults to printing the progress of large queries.
+            estimate_total: Whether to count the total number of instances in the background to estimate
+                the progress. Defaults to True.
+
+        Returns:
+            An iterator over the batches of results.
+
+        """
+        select_step = self._get_select_step()
+        reporter = reporter or Progress()
+        self._total = self._start_count_total(client, select_step) if estimate_total else None
         self._query.cursors = init_cursors or self._cursors
         status = self._status_by_name[select_step.name]
+        try:
+            if prefetch > 0 and IS_THREADING_SUPPORTED:
+                yield from self._iterate_prefetch(client, select_step, reporter, remove_not_connected, prefetch)
+                return
+            while True:
+                yield self._fetch_batch(client, select_step, reporter, remove_not_connected)
+
+                if status.is_finished:
+                    break
+        finally:
+            self._save_batch_limits()
+
+    def _iterate_prefetch(
+        self,
+        client: CogniteClient,
+        select_step: QueryBuildStep,
+        reporter: QueryReporter,
+        remove_not_connected: bool,
+        prefetch: int,
+    ) -> Iterator[QueryResultStepList]:
+        """Fetches batches in a single background worker.
+
+        A single worker guarantees that the batches are fetched in cursor order, as each fetch
+        starts from the cursors set by the previous one.
+        """
+        status = self._status_by_name[select_step.name]
+
+        def fetch_next() -> QueryResultStepList | None:
+            if status.is_finished:
+                return None
+            return self._fetch_batch(client, select_step, reporter, remove_not_connected)
+
+        pool = create_executor(max_workers=1, thread_name_prefix="pygen-prefetch")
+        try:
+            pending: deque[Future[QueryResultStepList | None]] = deque(
+                [pool.submit(self._fetch_batch, client, select_step, reporter, remove_not_connected)]
+            )
+            pending.extend(pool.submit(fetch_next) for _ in range(prefetch))
+            while pending:
+                batch_results = pending.popleft().result()
+                if batch_results is None:
+                    break
+                # The next fetch is only submitted when the caller asks for the next batch, such that
+                # exactly `prefetch` batches are fetched ahead while the caller holds this one.
+                yield batch_results
+                pending.append(pool.submit(fetch_next))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_batch(
+        self,
+        client: CogniteClient,
+        select_step: QueryBuildStep,
+        reporter: QueryReporter,
+        remove_not_connected: bool,
+    ) -> QueryResultStepList:
         while True:
             self._update_expression_limits()
             start_query = time.time()
             try:
-                batch = client.data_modeling.instances.query(self._query)
+                if self.raw:
+                    batch = query_raw(client, self._query)
+                else:
+                    batch = client.data_modeling.instances.query(self._query)
             except CogniteAPIError as e:
-                if e.code == 408:
-                    # Too big query, try to reduce the limit
-                    if self._reduce_max_batch_limit():
-                        new_limit = status.max_retrieve_batch_limit
-                        warnings.warn(
-                            f"Query is too large, reducing batch size to {new_limit:,}, and trying again",
-                            QueryReducingBatchSize,
-                            stacklevel=2,
-                        )
-                        continue
-
+                if self._is_retryable(e, select_step, start_query, reporter):
+                    continue
                 raise e
+            break
 
-            self._fetch_reverse_direct_relation_of_lists(client, self._to_search, batch)
-            last_execution_time = time.time() - start_query
+        query_time = time.time() - start_query
+        self._resolve_aliases(batch)
+        start_search = time.time()
+        self._fetch_reverse_direct_relation_of_lists(client, self._to_search, batch, reporter)
+        search_time = time.time() - start_search
+        return self._process_batch(batch, select_step, reporter, remove_not_connected, query_time, search_time)
 
-            for name in self._temp_select:
-                batch.pop(name, None)
+    def _resolve_aliases(self, batch: dm.query.QueryResult) -> None:
+        for name, query_name in self._aliases.items():
+            if query_name in batch:
+                # The cursor is part of the result list, thus, the merged step paginates with the query step.
+                # Each step gets its own list, such that cleaning the results of one step does not change
+                # the results of the other.
+                results = batch[query_name]
+                batch[name] = type(results)(list(results), cursor=results.cursor)
 
-            self._update_pagination_status(batch)
-            batch_results = self._as_results(batch)
-            if remove_not_connected and len(batch_results) > 1:
-                removed = QueryResultCleaner(batch_results).clean()
-                for step in batch_results:
-                    self._status_by_name[step.name].total_retrieved -= removed.get(step.name, 0)
+    def _is_retryable(
+        self, error: CogniteAPIError, select_step: QueryBuildStep, start_query: float, reporter: QueryReporter
+    ) -> bool:
+        if error.code not in (408, 429):
+            return False
+        # Too big query (408) or too many requests (429), try to reduce the limit.
+        # Note that the SDK has already retried the 429 with backoff before raising.
+        reporter.on_event(QueryRetried(status_code=error.code, failed_after=time.time() - start_query))
+        if not self._reduce_max_batch_limit("timeout" if error.code == 408 else "throttled", reporter):
+            return False
+        new_limit = self._status_by_name[select_step.name].max_retrieve_batch_limit
+        reason = "too large" if error.code == 408 else "throttled"
+        warnings.warn(
+            f"Query is {reason}, reducing batch size to {new_limit:,}, and trying again",
+            QueryReducingBatchSize,
+            stacklevel=2,
+        )
+        return True
 
-            yield batch_results
+    def _process_batch(
+        self,
+        batch: dm.query.QueryResult,
+        select_step: QueryBuildStep,
+        reporter: QueryReporter,
+        remove_not_connected: bool,
+        query_time: float,
+        search_time: float,
+    ) -> QueryResultStepList:
+        status = self._status_by_name[select_step.name]
+        self._stable_batch_limits = self.batch_limits
+        self._adapt_batch_limits(query_time + search_time, reporter)
 
-            if status.is_finished:
-                break
+        for name in self._temp_select:
+            batch.pop(name, None)
 
-            progress.log(len(batch[select_step.name]), last_execution_time, status.total_retrieved)
+        self._update_pagination_status(batch)
+        batch_results = self._as_results(batch)
+        if remove_not_connected and len(batch_results) > 1:
+            removed = QueryResultCleaner(batch_results).clean()
+            for step in batch_results:
+                self._status_by_name[step.name].total_retrieved -= removed.get(step.name, 0)
 
+        self._batch_count += 1
+        reporter.on_event(
+            BatchRetrieved(
+                batch_no=self._batch_count,
+                root_count=len(batch[select_step.name]),
+                instance_count_by_step={step.name: len(step.results) for step in batch_results},
+                query_time=query_time,
+                search_time=search_time,
+                total_retrieved=status.total_retrieved,
+                estimated_total=self._estimated_total(),
+                batch_limits=self._stable_batch_limits,
+                is_finished=status.is_finished,
+            )
+        )
+        if not status.is_finished:
             self._query.cursors = self._cursors
+        return batch_results
+
+    def _estimated_total(self) -> float | None:
+        if isinstance(self._total, Future | asyncio.Future):
+            if not self._total.done():
+                return None
+            self._total = None if self._total.exception() else self._total.result()
+        return self._total
 
     def _update_expression_limits(self) -> None:
         for name, status in self._status_by_name.items():
@@ -212,22 +568,106 @@ def _update_expression_limits(self) -> None:
                     min(status.max_retrieve_batch_limit, status.max_retrieve_limit - status.total_retrieved), 0
                 )
 
+    @property
+    def batch_limits(self) -> dict[str, int]:
+        """The current batch limit of each query step. These are adapted during the execution."""
+        return {
+            name: status.max_retrieve_batch_limit
+            for name, status in self._status_by_name.items()
+            if status.is_queryable
+        }
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether all instances of the select step have been retrieved."""
+        return self._status_by_name[self._get_select_step().name].is_finished
+
+    def _get_select_step(self) -> QueryBuildStep:
+        select_step = next((step for step in self._steps if step.select is not None), None)
+        if select_step is None:
+            raise ValueError("No select step found in the query")
+        return select_step
+
     @property
     def _cursors(self) -> dict[str, str | None]:
-        return {name: status.cursor for name, status in self._status_by_name.items() if status.is_queryable}
+        return {
+            name: status.cursor
+            for name, status in self._status_by_name.items()
+            if status.is_queryable and name not in self._aliases
+        }
 
-    def _reduce_max_batch_limit(self) -> bool:
-        for status in self._status_by_name.values():
-            status.max_retrieve_batch_limit = max(1, status.max_retrieve_batch_limit // 2)
+    def _reduce_max_batch_limit(
+        self, reason: Literal["timeout", "throttled"] = "timeout", reporter: QueryReporter | None = None
+    ) -> bool:
+        for name, status in self._status_by_name.items():
+            old_limit = status.max_retrieve_batch_limit
+            status.decrease_batch_limit()
+            self._report_batch_limit_change(reporter, name, old_limit, status, reason)
             if status.max_retrieve_batch_limit <= 1:
                 return False
         return True
 
+    @staticmethod
+    def _report_batch_limit_change(
+        reporter: QueryReporter | None,
+        name: str,
+        old_limit: int,
+        status: PaginationStatus,
+        reason: Literal["timeout", "throttled", "slow", "fast"],
+    ) -> None:
+        if reporter is not None and status.is_queryable and status.max_retrieve_batch_limit != old_limit:
+            reporter.on_event(BatchLimitChanged(name, old_limit, status.max_retrieve_batch_limit, reason))
+
+    def _adapt_batch_limits(self, last_execution_time: float, reporter: QueryReporter | None = None) -> None:
+        """Adapts the batch limits to the latency of the last successful query.
+
+        Slow queries reduce the batch limits proportionally to how much the target latency was exceeded,
+        but at most by half. Fast queries increase the batch limits additively, up to the max batch limit.
+        """
+        decrease_factor: float | None = None
+        if self._target_latency is not None and last_execution_time > self._target_latency:
+            decrease_factor = max(0.5, self._target_latency / last_execution_time)
+        for name, status in self._status_by_name.items():
+            if not status.is_queryable:
+                continue
+            old_limit = status.max_retrieve_batch_limit
+            if decrease_factor is None:
+                status.increase_batch_limit()
+            else:
+                status.decrease_batch_limit(decrease_factor)
+            self._report_batch_limit_change(
+                reporter, name, old_limit, status, "fast" if decrease_factor is None else "slow"
+            )
+
+    def _save_batch_limits(self) -> None:
+        if self._batch_limit_store is None or not self._stable_batch_limits:
+            return
+        for step in self._steps:
+            if step.name in self._stable_batch_limits:
+                self._batch_limit_store.set(step, self._stable_batch_limits[step.name])
+        self._batch_limit_store.save()
+
     def _fetch_reverse_direct_relation_of_lists(
-        self, client: CogniteClient, to_search: Sequence[QueryBuildStep], batch: dm.query.QueryResult
+        self,
+        client: CogniteClient,
+        to_search: Sequence[QueryBuildStep],
+        batch: dm.query.QueryResult,
+        reporter: QueryReporter | None = None,
     ) -> None:
         """Reverse direct relations for lists are not supported by the query API.
         This method fetches them separately."""
+        for step, view_id, through, item_ids, limit in self._iterate_search_steps(to_search, batch):
+            start_search = time.time()
+            step_result, call_count = self._search_reverse_list(client, step, view_id, through, item_ids, limit)
+            batch[step.name] = dm.NodeListWithCursor(step_result, None)
+            if reporter is not None:
+                reporter.on_event(SearchExecuted(step.name, call_count, len(step_result), time.time() - start_search))
+        return None
+
+    @staticmethod
+    def _iterate_search_steps(
+        to_search: Sequence[QueryBuildStep], batch: dm.query.QueryResult
+    ) -> Iterator[tuple[QueryBuildStep, dm.ViewId, dm.PropertyId, list[dm.NodeId], int]]:
         for step in to_search:
             if step.from_ is None or step.from_ not in batch:
                 continue
@@ -244,31 +684,89 @@ def _fetch_reverse_direct_relation_of_lists(
             if expression.through is None:
                 raise ValueError("Missing through set in a reverse-list query")
             limit = SEARCH_LIMIT if step.is_unlimited else min(step.max_retrieve_limit, SEARCH_LIMIT)
+            yield step, view_id, expression.through, item_ids, limit
 
-            step_result = dm.NodeList[dm.Node]([])
-            seen: set[dm.NodeId] = set()
-            for item_ids_chunk in chunker(item_ids, self._in_filter_chunk_size):
-                if not step.is_unlimited and len(step_result) >= limit:
-                    break
-                api_limit = limit if step.is_unlimited else limit - len(step_result)
+    def _bound_raw_filter(self, step: QueryBuildStep) -> dm.Filter | None:
+        if step.name not in self._raw_filter_by_name:
+            self._raw_filter_by_name[step.name] = bind_parameters(step.raw_filter, self._query.parameters or {})
+        return self._raw_filter_by_name[step.name]
 
-                is_items = dm.filters.In(view_id.as_property_ref(expression.through.property), item_ids_chunk)
-                is_selected = is_items if step.raw_filter is None else dm.filters.And(is_items, step.raw_filter)
+    def _create_search_filter(
+        self, step: QueryBuildStep, view_id: dm.ViewId, through: dm.PropertyId, item_ids: Sequence[dm.NodeId]
+    ) -> dm.Filter:
+        is_items = dm.filters.In(view_id.as_property_ref(through.property), item_ids)
+        raw_filter = self._bound_raw_filter(step)
+        return is_items if raw_filter is None else dm.filters.And(is_items, raw_filter)
+
+    @staticmethod
+    def _add_search_result(
+        step_result: dm.NodeList[dm.Node], seen: set[dm.NodeId], chunk_result: dm.NodeList[dm.Node]
+    ) -> None:
+        for node in chunk_result:
+            node_id = node.as_id()
+            if node_id in seen:
+                # If the same node has direct relations to multiple nodes in the list,
+                # we only want to keep it once.
+                continue
+            seen.add(node_id)
+            step_result.append(node)
+
+    def _search_reverse_list(
+        self,
+        client: CogniteClient,
+        step: QueryBuildStep,
+        view_id: dm.ViewId,
+        through: dm.PropertyId,
+        item_ids: list[dm.NodeId],
+        limit: int,
+    ) -> tuple[dm.NodeList[dm.Node], int]:
+        """Searches for the nodes pointing to the item_ids in chunks.
 
-                chunk_result = client.data_modeling.instances.search(
-                    view=view_id, query=None, properties=None, filter=is_selected, limit=api_limit
+        The searches run concurrently, but the results are consumed in the order of the chunks. This keeps
+        the result deterministic and makes it possible to stop early when the limit is reached.
+
+        Returns:
+            The nodes found and the number of /search calls made.
+        """
+        step_result = dm.NodeList[dm.Node]([])
+        call_count = 0
+        seen: set[dm.NodeId] = set()
+        chunks = iter(chunker(item_ids, self._in_filter_chunk_size))
+        pending: deque[Future[dm.NodeList[dm.Node]]] = deque()
+        with create_executor(self._max_search_workers, thread_name_prefix="pygen-search") as pool:
+
+            def submit_next_chunk() -> None:
+                nonlocal call_count
+                item_ids_chunk = next(chunks, None)
+                if item_ids_chunk is None:
+                    return
+                call_count += 1
+                api_limit = limit if step.is_unlimited else limit - len(step_result)
+                pending.append(
+                    pool.submit(
+                        client.data_modeling.instances.search,
+                        view=view_id,
+                        query=None,
+                        properties=None,
+                        filter=self._create_search_filter(step, view_id, through, item_ids_chunk),
+                        limit=api_limit,
+                    )
                 )
-                for node in chunk_result:
-                    node_id = node.as_id()
-                    if node_id in seen:
-                        # If the same node has direct relations to multiple nodes in the list,
-                        # we only want to keep it once.
-                        continue
-                    seen.add(node_id)
-                    step_result.append(node)
 
-            batch[step.name] = dm.NodeListWithCursor(step_result, None)
-        return None
+            for _ in range(self._max_search_workers):
+                submit_next_chunk()
+            while pending:
+                self._add_search_result(step_result, seen, pending.popleft().result())
+                if not step.is_unlimited and len(step_result) >= limit:
+                    for future in pending:
+                        future.cancel()
+                    break
+                submit_next_chunk()
+
+        if not step.is_unlimited and len(step_result) > limit:
+            # Chunks searched concurrently can together exceed the limit.
+            return dm.NodeList[dm.Node](step_result[:limit]), call_count
+        return step_result, call_count
 
     def _update_pagination_status(self, batch: dm.query.QueryResult) -> None:
         for name, status in self._status_by_name.items():
@@ -286,14 +784,275 @@ def _as_results(self, batch: dm.query.QueryResult) -> QueryResultStepList:
             results.append(QueryResultStep.from_build(batch[step.name], step))
         return results
 
+    def _start_count_total(self, client: CogniteClient, step: QueryBuildStep) -> float | Future[float | None] | None:
+        """Starts counting the total number of instances of the step, used to estimate the progress.
+
+        The count runs concurrently with the first batches and is cached. It is skipped if the step
+        is retrieved in a single batch, as there is no progress to estimate.
+        """
+        if (key := self._count_key(client, step)) is None:
+            return None
+        if (cached := self._count_cache.get(key)) is not None:
+            return cached
+        pool = create_executor(max_workers=1, thread_name_prefix="pygen-count")
+        future = pool.submit(self._count_total_and_cache, client, step, key, self._query.parameters)
+        # Do not wait for the count to finish.
+        pool.shutdown(wait=False)
+        return future
+
+    def _count_key(self, client: CogniteClient | AsyncCogniteClient, step: QueryBuildStep) -> CountKey | None:
+        """Returns the key of the count cache, or None if the count is not needed."""
+        status = self._status_by_name[step.name]
+        if step.view_id is None or (
+            not status.is_unlimited and status.max_retrieve_limit <= status.max_retrieve_batch_limit
+        ):
+            return None
+        # Mocked clients, for example, from monkeypatch_cognite_client, do not have a project set.
+        project = getattr(client.config, "project", "")
+        return self._count_cache.create_key(project, step.view_id, self._bound_raw_filter(step))
+
+    @classmethod
+    def _count_total_and_cache(
+        cls,
+        client: CogniteClient,
+        step: QueryBuildStep,
+        key: CountKey,
+        parameters: Mapping[str, Any] | None = None,
+    ) -> float | None:
+        total = cls.count_total(client, step, parameters)
+        if total is not None:
+            cls._count_cache.set(key, total)
+        return total
+
     @staticmethod
-    def count_total(cognite_client: CogniteClient, step: QueryBuildStep) -> float | None:
+    def count_total(
+        cognite_client: CogniteClient, step: QueryBuildStep, parameters: Mapping[str, Any] | None = None
+    ) -> float | None:
+        """Counts the instances of the step, without the limits of the step.
+
+        Args:
+            cognite_client: The client to use for the aggregate call.
+            step: The step to count the instances of.
+            parameters: The values of the parameters used in the filter of the step.
+
+        Returns:
+            The count, or None if the step has no view, a parameter of the filter has no value,
+            or the aggregate call fails.
+        """
         if step.view_id is None:
             # Cannot count the total without a view
             return None
+        try:
+            filter_ = bind_parameters(step.raw_filter, parameters or {})
+        except ValueError:
+            return None
         try:
             return cognite_client.data_modeling.instances.aggregate(
-                step.view_id, Count("externalId"), filter=step.raw_filter
+                step.view_id, Count("externalId"), filter=filter_
             ).value
         except CogniteAPIError:
             return None
+
+
+class AsyncQueryExecutor:
+    """Executes the query of a query executor with an AsyncCogniteClient.
+
+    The pagination state, the adaptive batch limits, and the reporting are shared with the synchronous
+    executor, only the requests are awaited instead of blocking a thread. Thus, many queries can run
+    concurrently in a single event loop.
+
+    Args:
+        executor: The query executor holding the query and the pagination state.
+
+    """
+
+    def __init__(self, executor: QueryExecutor) -> None:
+        self._executor = executor
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether all instances of the select step have been retrieved."""
+        return self._executor.is_finished
+
+    async def execute_query(
+        self,
+        client: AsyncCogniteClient,
+        remove_not_connected: bool = False,
+        init_cursors: dict[str, str | None] | None = None,
+        reporter: QueryReporter | None = None,
+    ) -> list[QueryResultStep]:
+        results: dict[str, QueryResultStep] = {}
+        async for batch_results in self.iterate(client, remove_not_connected, init_cursors, reporter=reporter):
+            self._executor._merge_results(results, batch_results)
+        return list(results.values())
+
+    async def iterate_resolved(
+        self,
+        client: AsyncCogniteClient,
+        remove_not_connected: bool = False,
+        reporter: QueryReporter | None = None,
+    ) -> AsyncIterator[list[QueryResultStep]]:
+        """Iterate over the query results in groups of batches in which all connections are resolved.
+
+        See QueryExecutor.iterate_resolved for details.
+        """
+        results: dict[str, QueryResultStep] = {}
+        async for batch_results in self.iterate(client, remove_not_connected, reporter=reporter):
+            self._executor._merge_results(results, batch_results)
+            if self._executor._is_connections_resolved():
+                yield list(results.values())
+                results = {}
+        if results:
+            yield list(results.values())
+
+    async def iterate(
+        self,
+        client: AsyncCogniteClient,
+        remove_not_connected: bool = False,
+        init_cursors: dict[str, str | None] | None = None,
+        reporter: QueryReporter | None = None,
+    ) -> AsyncIterator[QueryResultStepList]:
+        """Iterate over the query results, one batch at a time.
+
+        Args:
+            client: The client to use for the queries.
+            remove_not_connected: Whether to remove nodes/edges that are not connected through the entire query.
+            init_cursors: The cursors to start the iteration from.
+            reporter: Receives the events of the execution. Defaults to printing the progress of large queries.
+
+        Returns:
+            An asynchronous iterator over the batches of results.
+
+        """
+        executor = self._executor
+        select_step = executor._get_select_step()
+        reporter = reporter or Progress()
+        executor._total = self._start_count_total(client, select_step)
+        executor._query.cursors = init_cursors or executor._cursors
+        status = executor._status_by_name[select_step.name]
+        try:
+            while True:
+                yield await self._fetch_batch(client, select_step, reporter, remove_not_connected)
+
+                if status.is_finished:
+                    break
+        finally:
+            if isinstance(executor._total, asyncio.Future):
+                # The count is only used for progress, it must not outlive the iteration.
+                executor._total.cancel()
+            executor._save_batch_limits()
+
+    async def _fetch_batch(
+        self,
+        client: AsyncCogniteClient,
+        select_step: QueryBuildStep,
+        reporter: QueryReporter,
+        remove_not_connected: bool,
+    ) -> QueryResultStepList:
+        executor = self._executor
+        while True:
+            executor._update_expression_limits()
+            start_query = time.time()
+            try:
+                if executor.raw:
+                    batch = await query_raw_async(client, executor._query)
+                else:
+                    batch = await client.data_modeling.instances.query(executor._query)
+            except CogniteAPIError as e:
+                if executor._is_retryable(e, select_step, start_query, reporter):
+                    continue
+                raise e
+            break
+
+        query_time = time.time() - start_query
+        executor._resolve_aliases(batch)
+        start_search = time.time()
+        await self._fetch_reverse_direct_relation_of_lists(client, batch, reporter)
+        search_time = time.time() - start_search
+        return executor._process_batch(batch, select_step, reporter, remove_not_connected, query_time, search_time)
+
+    async def _fetch_reverse_direct_relation_of_lists(
+        self, client: AsyncCogniteClient, batch: dm.query.QueryResult, reporter: QueryReporter
+    ) -> None:
+        for step, view_id, through, item_ids, limit in self._executor._iterate_search_steps(
+            self._executor._to_search, batch
+        ):
+            start_search = time.time()
+            step_result, call_count = await self._search_reverse_list(client, step, view_id, through, item_ids, limit)
+            batch[step.name] = dm.NodeListWithCursor(step_result, None)
+            reporter.on_event(SearchExecuted(step.name, call_count, len(step_result), time.time() - start_search))
+
+    async def _search_reverse_list(
+        self,
+        client: AsyncCogniteClient,
+        step: QueryBuildStep,
+        view_id: dm.ViewId,
+        through: dm.PropertyId,
+        item_ids: list[dm.NodeId],
+        limit: int,
+    ) -> tuple[dm.NodeList[dm.Node], int]:
+        """Searches for the nodes pointing to the item_ids in chunks, see QueryExecutor._search_reverse_list."""
+        executor = self._executor
+        step_result = dm.NodeList[dm.Node]([])
+        call_count = 0
+        seen: set[dm.NodeId] = set()
+        chunks = iter(chunker(item_ids, executor._in_filter_chunk_size))
+        pending: deque[asyncio.Future[dm.NodeList[dm.Node]]] = deque()
+
+        def submit_next_chunk() -> None:
+            nonlocal call_count
+            item_ids_chunk = next(chunks, None)
+            if item_ids_chunk is None:
+                return
+            call_count += 1
+            api_limit = limit if step.is_unlimited else limit - len(step_result)
+            search = client.data_modeling.instances.search(
+                view=view_id,
+                query=None,
+                properties=None,
+                filter=executor._create_search_filter(step, view_id, through, item_ids_chunk),
+                limit=api_limit,
+            )
+            pending.append(asyncio.ensure_future(search))
+
+        try:
+            for _ in range(executor._max_search_workers):
+                submit_next_chunk()
+            while pending:
+                executor._add_search_result(step_result, seen, await pending.popleft())
+                if not step.is_unlimited and len(step_result) >= limit:
+                    break
+                submit_next_chunk()
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if not step.is_unlimited and len(step_result) > limit:
+            return dm.NodeList[dm.Node](step_result[:limit]), call_count
+        return step_result, call_count
+
+    def _start_count_total(
+        self, client: AsyncCogniteClient, step: QueryBuildStep
+    ) -> float | asyncio.Future[float | None] | None:
+        executor = self._executor
+        if (key := executor._count_key(client, step)) is None:
+            return None
+        if (cached := executor._count_cache.get(key)) is not None:
+            return cached
+        # The count runs concurrently with the first batches.
+        return asyncio.ensure_future(self._count_total_and_cache(client, step, key))
+
+    async def _count_total_and_cache(
+        self, client: AsyncCogniteClient, step: QueryBuildStep, key: CountKey
+    ) -> float | None:
+        if step.view_id is None:
+            return None
+        try:
+            result = await client.data_modeling.instances.aggregate(
+                step.view_id, Count("externalId"), filter=self._executor._bound_raw_filter(step)
+            )
+        except CogniteAPIError:
+            return None
+        if result.value is not None:
+            self._executor._count_cache.set(key, result.value)
+        return result.value
@@ -0,0 +1,144 @@
+import json
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.query import NodeOrEdgeResultSetExpression
+
+from omni.data_classes._core.query.constants import NODE_PROPERTIES
+from omni.data_classes._core.query.step import QueryBuildStep
+
+OptimizationRule = Callable[["QueryOptimizer", dm.query.Query], None]
+
+
+class QueryOptimizer:
+    """Rewrites a built query into an equivalent query that is cheaper to execute.
+
+    The rules only change the query sent to the API, the steps are never modified, as they are shared
+    between executions of prepared queries. The result of each step, as seen by the unpacker, is the
+    same with and without the optimization.
+
+    Args:
+        steps: The steps the query was built from.
+        temporary_select: The steps that are only selected to find the parents of searched steps.
+        rules: The rules to apply, in order. Defaults to narrowing the selects, and then merging
+            equivalent result set expressions.
+
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[QueryBuildStep],
+        temporary_select: set[str],
+        rules: Sequence[OptimizationRule] | None = None,
+    ) -> None:
+        self._steps = steps
+        self._temporary_select = temporary_select
+        self._rules = list(rules) if rules is not None else [type(self).narrow_selects, type(self).merge_equivalent]
+        # The name of a merged step -> the name of the result set it is read from.
+        self.aliases: dict[str, str] = {}
+
+    def optimize(self, query: dm.query.Query) -> dict[str, str]:
+        """Optimize the query in place.
+
+        Args:
+            query: The query to optimize. The expressions must be owned by the query, i.e., copies of the
+                step expressions.
+
+        Returns:
+            The merged steps, mapping the name of each merged step to the result set it is read from.
+
+        """
+        for rule in self._rules:
+            rule(self, query)
+        return self.aliases
+
+    def narrow_selects(self, query: dm.query.Query) -> None:
+        """Narrows '*' selects to the properties the unpacker reads.
+
+        These are the user selected properties, and the direct relations used to connect the step to its
+        parent and children. If none of these are view properties, the properties of the step are not
+        retrieved at all.
+        """
+        children_by_name: dict[str, list[QueryBuildStep]] = defaultdict(list)
+        for step in self._steps:
+            if step.from_ is not None:
+                children_by_name[step.from_].append(step)
+
+        for step in self._steps:
+            select = query.select.get(step.name)
+            if (
+                select is None
+                or step.view_id is None
+                or step.name in self._temporary_select
+                or step.selected_properties is None
+                or "*" in step.selected_properties
+                or not any(self._is_select_all(source, step.view_id) for source in select.sources)
+            ):
+                continue
+            required: list[str] = []
+            if (expression := step.node_expression) and expression.through and expression.direction == "inwards":
+                required.append(expression.through.property)
+            skip = set(NODE_PROPERTIES)
+            for child in children_by_name[step.name]:
+                child_expression = child.node_expression
+                if child_expression and child_expression.through and child_expression.direction == "outwards":
+                    required.append(child_expression.through.property)
+                elif child.connection_property is not None:
+                    # Edges and reverse direct relations are not properties of this view.
+                    skip.add(child.connection_property.property)
+            properties = list(
+                dict.fromkeys(
+                    [prop for prop in step.selected_properties if isinstance(prop, str) and prop not in skip] + required
+                )
+            )
+            sources: list[dm.query.SourceSelector] = []
+            for source in select.sources:
+                if not self._is_select_all(source, step.view_id):
+                    sources.append(source)
+                elif properties:
+                    sources.append(dm.query.SourceSelector(source.source, properties))
+            query.select[step.name] = dm.query.Select(sources, select.sort, select.limit)
+
+    def merge_equivalent(self, query: dm.query.Query) -> None:
+        """Merges result set expressions that are identical, including the result set they are from.
+
+        The merged step reads the result of the step it is merged into. The steps are visited in order,
+        such that the children of merged steps are compared after their parents are merged.
+        """
+        step_by_name = {step.name: step for step in self._steps}
+        kept_by_signature: dict[str, str] = {}
+        for name in list(query.with_):
+            expression = query.with_[name]
+            if not isinstance(expression, NodeOrEdgeResultSetExpression):
+                continue
+            if expression.from_ in self.aliases:
+                expression.from_ = self.aliases[expression.from_]
+            signature = self._signature(step_by_name[name], expression, query.select.get(name))
+            if (kept := kept_by_signature.get(signature)) is None:
+                kept_by_signature[signature] = name
+                continue
+            self.aliases[name] = kept
+            del query.with_[name]
+            query.select.pop(name, None)
+
+    @staticmethod
+    def _signature(
+        step: QueryBuildStep, expression: NodeOrEdgeResultSetExpression, select: dm.query.Select | None
+    ) -> str:
+        # The limits are included, as the pagination of the merged step follows the step it is merged into.
+        return json.dumps(
+            [
+                type(expression).__name__,
+                expression.dump(camel_case=True),
+                select.dump(camel_case=True) if select is not None else None,
+                step.max_retrieve_limit,
+                step.max_retrieve_batch_limit,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    @staticmethod
+    def _is_select_all(source: dm.query.SourceSelector, view_id: dm.ViewId) -> bool:
+        return source.source == view_id and list(source.properties or []) == ["*"]
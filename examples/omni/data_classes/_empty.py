@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,9 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_timestamp,
+    parse_date,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -144,6 +147,19 @@ class Empty(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "Empty", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "boolean",
+            "date",
+            "float32",
+            "float64",
+            "int32",
+            "int64",
+            "json",
+            "text",
+            "timestamp",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference("sp_pygen_models", "Empty")
@@ -157,6 +173,32 @@ class Empty(DomainModel):
     text: Optional[str] = None
     timestamp: Optional[datetime.datetime] = None
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "boolean" in properties:
+            args["boolean"] = properties["boolean"]
+        if "date" in properties:
+            args["date"] = parse_date(properties["date"])
+        if "float32" in properties:
+            args["float_32"] = properties["float32"]
+        if "float64" in properties:
+            args["float_64"] = properties["float64"]
+        if "int32" in properties:
+            args["int_32"] = properties["int32"]
+        if "int64" in properties:
+            args["int_64"] = properties["int64"]
+        if "json" in properties:
+            args["json_"] = properties["json"]
+        if "text" in properties:
+            args["text"] = properties["text"]
+        if "timestamp" in properties:
+            args["timestamp"] = parse_timestamp(properties["timestamp"])
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> EmptyWrite:
         """Convert this read version of empty to the writing version."""
         return EmptyWrite.model_validate(as_write_args(self))
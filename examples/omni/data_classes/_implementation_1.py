@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -117,6 +118,14 @@ class Implementation1(SubInterface):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "Implementation1", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "mainValue",
+            "subValue",
+            "value1",
+            "value2",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
         "sp_pygen_models", "Implementation1"
@@ -124,6 +133,22 @@ class Implementation1(SubInterface):
     value_1: Optional[str] = Field(None, alias="value1")
     value_2: str = Field(alias="value2")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "mainValue" in properties:
+            args["main_value"] = properties["mainValue"]
+        if "subValue" in properties:
+            args["sub_value"] = properties["subValue"]
+        if "value1" in properties:
+            args["value_1"] = properties["value1"]
+        if "value2" in properties:
+            args["value_2"] = properties["value2"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Implementation1Write:
         """Convert this read version of implementation 1 to the writing version."""
         return Implementation1Write.model_validate(as_write_args(self))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -129,6 +130,14 @@ class Implementation1NonWriteable(SubInterface):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "Implementation1NonWriteable", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "connectionValue",
+            "mainValue",
+            "subValue",
+            "value1",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
         "sp_pygen_models", "Implementation1"
@@ -143,6 +152,22 @@ class Implementation1NonWriteable(SubInterface):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "connectionValue" in properties:
+            args["connection_value"] = parse_single_connection(properties["connectionValue"], "connection_value")
+        if "mainValue" in properties:
+            args["main_value"] = properties["mainValue"]
+        if "subValue" in properties:
+            args["sub_value"] = properties["subValue"]
+        if "value1" in properties:
+            args["value_1"] = properties["value1"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
 
 class Implementation1NonWriteableList(DomainModelList[Implementation1NonWriteable]):
     """List of implementation 1 non writeables in the read version."""
@@ -248,7 +273,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _Implementation1Query not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _Implementation1Query not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.connection_value = _Implementation1Query(
                 created_types.copy(),
                 self._creation_path,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -109,11 +110,29 @@ class Implementation2(SubInterface):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "Implementation2", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "mainValue",
+            "subValue",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference(
         "sp_pygen_models", "Implementation2"
     )
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "mainValue" in properties:
+            args["main_value"] = properties["mainValue"]
+        if "subValue" in properties:
+            args["sub_value"] = properties["subValue"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Implementation2Write:
         """Convert this read version of implementation 2 to the writing version."""
         return Implementation2Write.model_validate(as_write_args(self))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni.config import global_config
+from omni import config
 from omni.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -125,6 +126,15 @@ class PrimitiveWithDefaults(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_models", "PrimitiveWithDefaults", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "autoIncrementInt32",
+            "defaultBoolean",
+            "defaultFloat32",
+            "defaultObject",
+            "defaultString",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -134,6 +144,24 @@ class PrimitiveWithDefaults(DomainModel):
     default_object: Optional[dict] = Field(None, alias="defaultObject")
     default_string: Optional[str] = Field(None, alias="defaultString")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "autoIncrementInt32" in properties:
+            args["auto_increment_int_32"] = properties["autoIncrementInt32"]
+        if "defaultBoolean" in properties:
+            args["default_boolean"] = properties["defaultBoolean"]
+        if "defaultFloat32" in properties:
+            args["default_float_32"] = properties["defaultFloat32"]
+        if "defaultObject" in properties:
+            args["default_object"] = properties["defaultObject"]
+        if "defaultString" in properties:
+            args["default_string"] = properties["defaultString"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> PrimitiveWithDefaultsWrite:
         """Convert this read version of primitive with default to the writing version."""
         return PrimitiveWithDefaultsWrite.model_validate(as_write_args(self))
@@ -1,3 +1,3 @@
-from omni_multi._api_client import OmniMultiClient
+from omni_multi._api_client import AsyncOmniMultiClient, OmniMultiClient
 
-__all__ = ["OmniMultiClient"]
+__all__ = ["AsyncOmniMultiClient", "OmniMultiClient"]
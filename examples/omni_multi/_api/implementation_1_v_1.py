@@ -16,6 +16,7 @@
     NodeAPI,
     SequenceNotStr,
 )
+from omni_multi.config import global_config
 from omni_multi.data_classes._core import (
     DEFAULT_QUERY_LIMIT,
     QueryBuildStepFactory,
@@ -407,7 +408,11 @@ def _build(
                 has_container_fields=True,
             )
         )
-        return builder.build()
+        return builder.build(
+            raw=global_config.raw_read,
+            batch_limit_store=global_config.batch_limit_store,
+            target_latency=global_config.target_query_latency,
+        )
 
     def iterate(
         self,
@@ -423,6 +428,8 @@ def iterate(
         filter: dm.Filter | None = None,
         limit: int | None = None,
         cursors: dict[str, str | None] | None = None,
+        prefetch: int = 0,
+        partitions: int = 1,
     ) -> Iterator[Implementation1v1List]:
         """Iterate over implementation 1 v 1
 
@@ -441,6 +448,11 @@ def iterate(
             limit: Maximum number of implementation 1 v 1 to return. Defaults to None, which will return all items.
             cursors: (Advanced) Cursor to use for pagination. This can be used to resume an iteration from a
                 specific point. See example below for more details.
+            prefetch: The number of chunks to fetch ahead in the background while the current chunk is being
+                processed. Defaults to 0, which disables prefetching. Not supported together with partitions.
+            partitions: The number of partitions to split the implementation 1 v 1 into by external ID.
+                Each partition is retrieved concurrently, and the chunks are returned in the order they are
+                retrieved. Defaults to 1, which retrieves all implementation 1 v 1 in order.
 
         Returns:
             Iteration of implementation 1 v 1
@@ -498,7 +510,9 @@ def iterate(
             space,
             filter,
         )
-        yield from self._iterate(chunk_size, filter_, limit, "skip", cursors=cursors)
+        yield from self._iterate(
+            chunk_size, filter_, limit, "skip", cursors=cursors, prefetch=prefetch, partitions=partitions
+        )
 
     def list(
         self,
@@ -5,7 +5,7 @@
 from pathlib import Path
 from typing import Any
 
-from cognite.client import ClientConfig, CogniteClient
+from cognite.client import AsyncCogniteClient, ClientConfig, CogniteClient
 from cognite.client import data_modeling as dm
 from cognite.client.credentials import OAuthClientCredentials
 from cognite.client.data_classes import FileMetadataList, SequenceList, TimeSeriesList
@@ -17,7 +17,14 @@
     MainInterfaceAPI,
     SubInterfaceAPI,
 )
-from omni_multi._api._core import GraphQLQueryResponse, SequenceNotStr
+from omni_multi._api._core import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    AsyncNodeReadAPI,
+    GraphQLQueryResponse,
+    InstanceCache,
+    SequenceNotStr,
+)
 from omni_multi.data_classes._core import GraphQLList
 
 
@@ -141,6 +148,7 @@ def __init__(self, config_or_client: CogniteClient | ClientConfig):
         self.omni_multi_c = OmniMultiCAPIs(client)
 
         self._client = client
+        self._instance_cache: InstanceCache | None = None
 
     def upsert(
         self,
@@ -174,6 +182,7 @@ def upsert(
             auto_create_end_nodes=True,
             replace=replace,
         )
+        self._invalidate_cache(result.nodes.as_ids())
         time_series = TimeSeriesList([])
         if instances.time_series:
             time_series = self._client.time_series.upsert(instances.time_series, mode="patch")
@@ -244,12 +253,12 @@ def delete(
         ):
             raise ValueError("Expected space to be set when deleting by external_id")
         if isinstance(external_id, str) and space is not None:
-            return self._client.data_modeling.instances.delete(nodes=(space, external_id))
+            result = self._client.data_modeling.instances.delete(nodes=(space, external_id))
         elif isinstance(external_id, dm.NodeId):
-            return self._client.data_modeling.instances.delete(nodes=external_id)
+            result = self._client.data_modeling.instances.delete(nodes=external_id)
         elif isinstance(external_id, data_classes.DomainModelWrite):
             resources = self._create_instances(external_id, False)
-            return self._client.data_modeling.instances.delete(
+            result = self._client.data_modeling.instances.delete(
                 nodes=resources.nodes.as_ids(),
                 edges=resources.edges.as_ids(),
             )
@@ -269,11 +278,54 @@ def delete(
                     raise ValueError(
                         f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
                     )
-            return self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
+            result = self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
         else:
             raise ValueError(
                 f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
             )
+        self._invalidate_cache(result.nodes)
+        return result
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared by all APIs of the client, and the nodes are invalidated by upsert and delete
+        through this client. Changes made by other clients are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        cache = InstanceCache(maxsize, ttl, ttl_by_view)
+        self._set_instance_cache(cache)
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._set_instance_cache(None)
+
+    def _set_instance_cache(self, cache: InstanceCache | None) -> None:
+        self._instance_cache = cache
+        self.omni_multi_a.main_interface._instance_cache = cache
+        self.omni_multi_a.sub_interface._instance_cache = cache
+        self.omni_multi_b.implementation_1_v_2._instance_cache = cache
+        self.omni_multi_b.main_interface._instance_cache = cache
+        self.omni_multi_b.sub_interface._instance_cache = cache
+        self.omni_multi_c.implementation_1_v_1._instance_cache = cache
+
+    def _invalidate_cache(self, node_ids: Sequence[dm.NodeId]) -> None:
+        if self._instance_cache is not None:
+            self._instance_cache.invalidate(node_ids)
 
     @classmethod
     def azure_project(
@@ -296,3 +348,152 @@ def from_toml(cls, file_path: Path | str, section: str | None = "cognite") -> Om
                 raise ValueError(f"Could not find section '{section}' in {file_path}") from e
 
         return cls.azure_project(**toml_content)
+
+
+class AsyncOmniMultiAAPIs:
+    """
+    AsyncOmniMultiAAPIs
+
+    Data Model:
+        space: pygen-models
+        externalId: OmniMultiA
+        version: 1
+
+    """
+
+    def __init__(self, api: OmniMultiAAPIs, client: AsyncCogniteClient):
+        self._client = client
+
+        self.main_interface = AsyncNodeReadAPI(api.main_interface, client)
+        self.sub_interface = AsyncNodeReadAPI(api.sub_interface, client)
+
+    async def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
+        """Execute a GraphQl query against the OmniMultiA data model.
+
+        Args:
+            query (str): The GraphQL query to issue.
+            variables (dict[str, Any] | None): An optional dict of variables to pass to the query.
+        """
+        data_model_id = dm.DataModelId("pygen-models", "OmniMultiA", "1")
+        result = await self._client.data_modeling.graphql.query(data_model_id, query, variables)
+        return GraphQLQueryResponse(data_model_id).parse(result)
+
+
+class AsyncOmniMultiBAPIs:
+    """
+    AsyncOmniMultiBAPIs
+
+    Data Model:
+        space: pygen-models
+        externalId: OmniMultiB
+        version: 1
+
+    """
+
+    def __init__(self, api: OmniMultiBAPIs, client: AsyncCogniteClient):
+        self._client = client
+
+        self.implementation_1_v_2 = AsyncNodeReadAPI(api.implementation_1_v_2, client)
+        self.main_interface = AsyncNodeReadAPI(api.main_interface, client)
+        self.sub_interface = AsyncNodeReadAPI(api.sub_interface, client)
+
+    async def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
+        """Execute a GraphQl query against the OmniMultiB data model.
+
+        Args:
+            query (str): The GraphQL query to issue.
+            variables (dict[str, Any] | None): An optional dict of variables to pass to the query.
+        """
+        data_model_id = dm.DataModelId("pygen-models", "OmniMultiB", "1")
+        result = await self._client.data_modeling.graphql.query(data_model_id, query, variables)
+        return GraphQLQueryResponse(data_model_id).parse(result)
+
+
+class AsyncOmniMultiCAPIs:
+    """
+    AsyncOmniMultiCAPIs
+
+    Data Model:
+        space: pygen-models
+        externalId: OmniMultiC
+        version: 1
+
+    """
+
+    def __init__(self, api: OmniMultiCAPIs, client: AsyncCogniteClient):
+        self._client = client
+
+        self.implementation_1_v_1 = AsyncNodeReadAPI(api.implementation_1_v_1, client)
+
+    async def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
+        """Execute a GraphQl query against the OmniMultiC data model.
+
+        Args:
+            query (str): The GraphQL query to issue.
+            variables (dict[str, Any] | None): An optional dict of variables to pass to the query.
+        """
+        data_model_id = dm.DataModelId("pygen-models", "OmniMultiC", "1")
+        result = await self._client.data_modeling.graphql.query(data_model_id, query, variables)
+        return GraphQLQueryResponse(data_model_id).parse(result)
+
+
+class AsyncOmniMultiClient:
+    """
+    AsyncOmniMultiClient
+
+    The asynchronous version of OmniMultiClient. The requests are awaited using the AsyncCogniteClient,
+    such that many list, retrieve, search, and aggregate calls can run concurrently in a single event loop.
+
+    Generated with:
+        pygen = 0.0.0
+        cognite-sdk = 8.0.5
+        pydantic = 2.12.5
+
+    """
+
+    def __init__(self, config_or_client: AsyncCogniteClient | CogniteClient | ClientConfig):
+        if isinstance(config_or_client, AsyncCogniteClient):
+            client, cognite_client = config_or_client, config_or_client.get_sync_client()
+        elif isinstance(config_or_client, CogniteClient):
+            client, cognite_client = config_or_client.get_async_client(), config_or_client
+        elif isinstance(config_or_client, ClientConfig):
+            client = AsyncCogniteClient(config_or_client)
+            cognite_client = client.get_sync_client()
+        else:
+            raise ValueError(
+                f"Expected AsyncCogniteClient, CogniteClient or ClientConfig, got {type(config_or_client)}"
+            )
+        # The synchronous client builds the queries and unpacks the results, it does not make any requests.
+        sync_client = OmniMultiClient(cognite_client)
+        self._client = client
+        self._sync_client = sync_client
+
+        self.omni_multi_a = AsyncOmniMultiAAPIs(sync_client.omni_multi_a, client)
+        self.omni_multi_b = AsyncOmniMultiBAPIs(sync_client.omni_multi_b, client)
+        self.omni_multi_c = AsyncOmniMultiCAPIs(sync_client.omni_multi_c, client)
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared with the synchronous client used to unpack the results. This client does not
+        write, thus, changes are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        return self._sync_client.enable_cache(maxsize, ttl, ttl_by_view)
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._sync_client.disable_cache()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import warnings
 from typing import Any, Literal, overload, TYPE_CHECKING
 
@@ -103,3 +104,35 @@ def parse_single_connection(value: Any, field_name: str | None) -> Any:
     if isinstance(value, dict) and len(value) == 2 and "space" in value and "externalId" in value:
         return dm.NodeId(space=value["space"], external_id=value["externalId"])
     return value
+
+
+def parse_connection_list(value: Any, field_name: str | None) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [parse_single_connection(item, field_name) for item in value]
+
+
+def parse_timestamp(value: Any) -> Any:
+    """Parses a timestamp, or a list of timestamps, as returned by the API. Invalid values are returned
+    as is, such that they are reported by the validation, or kept if validation is turned off."""
+    if isinstance(value, list):
+        return [parse_timestamp(item) for item in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        # Python 3.10 does not support the 'Z' suffix.
+        return datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return value
+
+
+def parse_date(value: Any) -> Any:
+    """Parses a date, or a list of dates, as returned by the API, see parse_timestamp."""
+    if isinstance(value, list):
+        return [parse_date(item) for item in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return value
@@ -0,0 +1,357 @@
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from typing import Any, Literal, TypeAlias, TypeVar, overload
+
+from cognite.client import AsyncCogniteClient, CogniteClient
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Properties
+from cognite.client.data_classes.data_modeling.query import QueryResult
+
+from omni_multi.data_classes._core.query.constants import INSTANCE_QUERY_LIMIT, SEARCH_LIMIT
+
+RawInstance: TypeAlias = dict[str, Any]
+T_Item = TypeVar("T_Item")
+
+_INSTANCES_PATH = "/models/instances"
+_SNAKE_CASE_KEYS = {
+    "externalId": "external_id",
+    "lastUpdatedTime": "last_updated_time",
+    "createdTime": "created_time",
+    "deletedTime": "deleted_time",
+    "instanceType": "instance_type",
+    "startNode": "start_node",
+    "endNode": "end_node",
+}
+
+
+@cache
+def _get_decoder() -> Any:
+    # msgspec is an optional dependency, it decodes the responses faster than the standard library.
+    # Imported on the first raw read, such that importing the SDK does not import msgspec.
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return msgspec.json.Decoder()
+
+
+def _decode(response: Any) -> dict[str, Any]:
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes) and (decoder := _get_decoder()) is not None:
+        return decoder.decode(content)
+    return response.json()
+
+
+def _load_properties(raw: dict[str, dict[str, dict[str, Any]]]) -> Properties:
+    # The property values are shared with the response, only the view identifiers are created.
+    return Properties(
+        {
+            dm.ViewId(space, *view_key.split("/", maxsplit=1)): values
+            for space, values_by_view in raw.items()
+            for view_key, values in values_by_view.items()
+        }
+    )
+
+
+def _dump_raw(data: RawInstance, camel_case: bool) -> dict[str, Any]:
+    if camel_case:
+        return dict(data)
+    output: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and "externalId" in value and key != "properties":
+            # The type, start node and end node are direct relation references.
+            value = {"space": value["space"], "external_id": value["externalId"]}
+        output[_SNAKE_CASE_KEYS.get(key, key)] = value
+    return output
+
+
+class RawNode(dm.Node):
+    """A node that keeps the JSON of the API response.
+
+    The property values are shared with the response, the type is only loaded into a cognite-sdk object
+    when it is accessed, and dumping the node returns a copy of the response. Thus, unpacking the node does
+    not go through the cognite-sdk objects.
+
+    Args:
+        data: The node as returned by the API.
+
+    """
+
+    def __init__(self, data: RawInstance) -> None:
+        self._raw = data
+        self._type: dm.DirectRelationReference | None = None
+        super().__init__(
+            space=data["space"],
+            external_id=data["externalId"],
+            version=data["version"],
+            last_updated_time=data["lastUpdatedTime"],
+            created_time=data["createdTime"],
+            deleted_time=data.get("deletedTime"),
+            properties=_load_properties(data.get("properties", {})),
+            # The type is loaded when it is accessed.
+            type=None,
+        )
+
+    @property  # type: ignore[override]
+    def type(self) -> dm.DirectRelationReference | None:
+        if self._type is None and (raw_type := self._raw.get("type")):
+            self._type = dm.DirectRelationReference.load(raw_type)
+        return self._type
+
+    @type.setter
+    def type(self, value: dm.DirectRelationReference | None) -> None:
+        self._type = value
+
+    def dump(self, camel_case: bool = True) -> dict[str, Any]:
+        return _dump_raw(self._raw, camel_case)
+
+
+class RawEdge(dm.Edge):
+    """An edge that keeps the JSON of the API response, see RawNode.
+
+    Args:
+        data: The edge as returned by the API.
+
+    """
+
+    def __init__(self, data: RawInstance) -> None:
+        self._raw = data
+        super().__init__(
+            space=data["space"],
+            external_id=data["externalId"],
+            version=data["version"],
+            type=data["type"],
+            last_updated_time=data["lastUpdatedTime"],
+            created_time=data["createdTime"],
+            start_node=data["startNode"],
+            end_node=data["endNode"],
+            deleted_time=data.get("deletedTime"),
+            properties=_load_properties(data.get("properties", {})),
+        )
+
+    def dump(self, camel_case: bool = True) -> dict[str, Any]:
+        return _dump_raw(self._raw, camel_case)
+
+
+def _load_query_result(query: dm.query.Query, body: dict[str, Any]) -> QueryResult:
+    list_cls_by_name = query.instance_type_by_result_expression()
+    cursors = body.get("nextCursor") or {}
+    result = QueryResult()
+    for name, items in body["items"].items():
+        if list_cls_by_name.get(name) is dm.EdgeListWithCursor:
+            result[name] = dm.EdgeListWithCursor([RawEdge(item) for item in items], cursor=cursors.get(name))
+        else:
+            result[name] = dm.NodeListWithCursor([RawNode(item) for item in items], cursor=cursors.get(name))
+    return result
+
+
+def query_raw(client: CogniteClient, query: dm.query.Query) -> QueryResult:
+    """Executes the query, loading the instances as RawNode and RawEdge.
+
+    Args:
+        client: The client to use for the query.
+        query: The query to execute.
+
+    Returns:
+        The result of the query, in the same shape as `client.data_modeling.instances.query`.
+
+    """
+    response = client.post(f"{_INSTANCES_PATH}/query", json=query.dump(camel_case=True))
+    return _load_query_result(query, _decode(response))
+
+
+async def query_raw_async(client: AsyncCogniteClient, query: dm.query.Query) -> QueryResult:
+    """Executes the query with an async client, see query_raw."""
+    response = await client.post(f"{_INSTANCES_PATH}/query", json=query.dump(camel_case=True))
+    return _load_query_result(query, _decode(response))
+
+
+@overload
+def list_raw(
+    client: CogniteClient,
+    instance_type: Literal["node"],
+    sources: dm.ViewId | None,
+    limit: int | None,
+    filter: dm.Filter | None = None,
+    sort: Sequence[dm.InstanceSort] | None = None,
+) -> list[RawNode]: ...
+
+
+@overload
+def list_raw(
+    client: CogniteClient,
+    instance_type: Literal["edge"],
+    sources: dm.ViewId | None,
+    limit: int | None,
+    filter: dm.Filter | None = None,
+    sort: Sequence[dm.InstanceSort] | None = None,
+) -> list[RawEdge]: ...
+
+
+def list_raw(
+    client: CogniteClient,
+    instance_type: Literal["node", "edge"],
+    sources: dm.ViewId | None,
+    limit: int | None,
+    filter: dm.Filter | None = None,
+    sort: Sequence[dm.InstanceSort] | None = None,
+) -> list[RawNode] | list[RawEdge]:
+    """Lists instances, loading them as RawNode and RawEdge.
+
+    Args:
+        client: The client to use.
+        instance_type: Whether to list nodes or edges.
+        sources: The view to retrieve the properties from.
+        limit: The maximum number of instances. None or -1 for all instances.
+        filter: The filter to apply.
+        sort: The sort order.
+
+    Returns:
+        The listed instances.
+
+    """
+    body = _create_list_body(instance_type, sources, filter, sort)
+
+    def load_page(response: Any) -> tuple[list[Any], str | None]:
+        page = _decode(response)
+        items = [RawNode(item) if instance_type == "node" else RawEdge(item) for item in page["items"]]
+        return items, page.get("nextCursor")
+
+    return _list_pages(client, body, limit, load_page)
+
+
+def list_typed(
+    client: CogniteClient,
+    sources: dm.ViewId,
+    limit: int | None,
+    load_page: Callable[[bytes], tuple[list[T_Item], str | None]],
+    filter: dm.Filter | None = None,
+    sort: Sequence[dm.InstanceSort] | None = None,
+) -> list[T_Item]:
+    """Lists nodes, decoding each response body with the given function.
+
+    This is used to decode the JSON of the API response directly into typed objects, for example,
+    msgspec Structs, without going through dictionaries or the cognite-sdk objects.
+
+    Args:
+        client: The client to use.
+        sources: The view to retrieve the properties from.
+        limit: The maximum number of nodes. None or -1 for all nodes.
+        load_page: Decodes a response body into the items and the cursor of the next page.
+        filter: The filter to apply.
+        sort: The sort order.
+
+    Returns:
+        The listed nodes as returned by load_page.
+
+    """
+    body = _create_list_body("node", sources, filter, sort)
+    return _list_pages(client, body, limit, lambda response: load_page(response.content))
+
+
+def _create_list_body(
+    instance_type: Literal["node", "edge"],
+    sources: dm.ViewId | None,
+    filter: dm.Filter | None,
+    sort: Sequence[dm.InstanceSort] | None,
+) -> dict[str, Any]:
+    body: dict[str, Any] = {"instanceType": instance_type}
+    if sources is not None:
+        body["sources"] = [{"source": sources.dump(camel_case=True, include_type=True)}]
+    if filter is not None:
+        body["filter"] = filter.dump(camel_case_property=False)
+    if sort:
+        body["sort"] = [item.dump(camel_case=True) for item in sort]
+    return body
+
+
+def _list_pages(
+    client: CogniteClient,
+    body: dict[str, Any],
+    limit: int | None,
+    load_page: Callable[[Any], tuple[list[T_Item], str | None]],
+) -> list[T_Item]:
+    is_unlimited = limit is None or limit == -1
+    output: list[T_Item] = []
+    cursor: str | None = None
+    while True:
+        remaining = INSTANCE_QUERY_LIMIT if is_unlimited else limit - len(output)  # type: ignore[operator]
+        if remaining <= 0:
+            break
+        body["limit"] = min(remaining, INSTANCE_QUERY_LIMIT)
+        if cursor is not None:
+            body["cursor"] = cursor
+        items, cursor = load_page(client.post(f"{_INSTANCES_PATH}/list", json=body))
+        output.extend(items)
+        if cursor is None or not items:
+            break
+    return output
+
+
+def search_raw(
+    client: CogniteClient,
+    view: dm.ViewId,
+    query: str | None,
+    properties: list[str] | None = None,
+    filter: dm.Filter | None = None,
+    limit: int | None = None,
+    sort: Sequence[dm.InstanceSort] | None = None,
+) -> list[RawNode]:
+    """Searches for nodes, loading them as RawNode. The arguments are the same as
+    `client.data_modeling.instances.search`."""
+    body: dict[str, Any] = {
+        "view": view.dump(camel_case=True),
+        "instanceType": "node",
+        "limit": SEARCH_LIMIT if limit is None or limit == -1 else limit,
+    }
+    if query is not None:
+        body["query"] = query
+    if properties:
+        body["properties"] = properties
+    if filter is not None:
+        body["filter"] = filter.dump(camel_case_property=False)
+    if sort:
+        body["sort"] = [item.dump(camel_case=True) for item in sort]
+    response = _decode(client.post(f"{_INSTANCES_PATH}/search", json=body))
+    return [RawNode(item) for item in response["items"]]
+
+
+def retrieve_raw(client: CogniteClient, node_ids: Sequence[dm.NodeId], sources: dm.ViewId) -> list[RawNode]:
+    """Retrieves nodes by id, loading them as RawNode.
+
+    Args:
+        client: The client to use.
+        node_ids: The nodes to retrieve.
+        sources: The view to retrieve the properties from.
+
+    Returns:
+        The nodes that exist.
+
+    """
+    output: list[RawNode] = []
+    for body in _create_retrieve_bodies(node_ids, sources):
+        response = _decode(client.post(f"{_INSTANCES_PATH}/byids", json=body))
+        output.extend(RawNode(item) for item in response["items"])
+    return output
+
+
+async def retrieve_raw_async(
+    client: AsyncCogniteClient, node_ids: Sequence[dm.NodeId], sources: dm.ViewId
+) -> list[RawNode]:
+    """Retrieves nodes by id with an async client, see retrieve_raw."""
+    output: list[RawNode] = []
+    for body in _create_retrieve_bodies(node_ids, sources):
+        response = _decode(await client.post(f"{_INSTANCES_PATH}/byids", json=body))
+        output.extend(RawNode(item) for item in response["items"])
+    return output
+
+
+def _create_retrieve_bodies(node_ids: Sequence[dm.NodeId], sources: dm.ViewId) -> Iterator[dict[str, Any]]:
+    for start in range(0, len(node_ids), INSTANCE_QUERY_LIMIT):
+        yield {
+            "items": [
+                {"instanceType": "node", "space": node_id.space, "externalId": node_id.external_id}
+                for node_id in node_ids[start : start + INSTANCE_QUERY_LIMIT]
+            ],
+            "sources": [{"source": sources.dump(camel_case=True, include_type=True)}],
+        }
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
+import datetime
 import difflib
 import warnings
+from collections.abc import Hashable
 from typing import (
     cast,
     ClassVar,
@@ -10,12 +13,13 @@
     TypeVar,
     Union,
     Literal,
+    overload,
 )
 
 from cognite.client import CogniteClient
 from cognite.client import data_modeling as dm
 
-from omni_multi.config import global_config
+from omni_multi import config
 from omni_multi.data_classes._core.query.filter_classes import Filtering
 from omni_multi.data_classes._core.base import (
     DomainModelList,
@@ -27,11 +31,113 @@
     DomainModel,
 )
 from omni_multi.data_classes._core.constants import DEFAULT_QUERY_LIMIT
-from omni_multi.data_classes._core.query.builder import QueryBuilder
+from omni_multi.data_classes._core.query.builder import CompiledQuery, CompiledQueryCache, QueryBuilder
+from omni_multi.data_classes._core.query.planning import QueryPlan
 from omni_multi.data_classes._core.query.processing import QueryUnpacker
 from omni_multi.data_classes._core.query.step import QueryBuildStep, ViewPropertyId
 
 T_DomainListEnd = TypeVar("T_DomainListEnd", bound=Union[DomainModelList, DomainRelationList], covariant=True)
+T_DomainListResult = TypeVar("T_DomainListResult", bound=Union[DomainModelList, DomainRelationList])
+
+_prepared_query_cache = CompiledQueryCache()
+
+
+class PreparedQuery(Generic[T_DomainListResult]):
+    """A select query that is compiled and optimized once and can be executed any number of times.
+
+    Filter values that change between executions are set to a `dm.filters.ParameterValue` when selecting,
+    and bound to a value when executing.
+
+    Args:
+        compiled: The compiled query. This is only read, thus, it can be shared between prepared queries.
+        client: The client used to execute the query.
+        result_cls: The class of the returned items.
+        result_list_cls: The class of the returned list.
+        return_step: Whether to return the items of the first or the last step of the query.
+
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledQuery,
+        client: CogniteClient,
+        result_cls: type[DomainModelCore],
+        result_list_cls: type[T_DomainListResult],
+        return_step: Literal["first", "last"],
+    ) -> None:
+        self._compiled = compiled
+        self._client = client
+        self._result_cls = result_cls
+        self._result_list_cls = result_list_cls
+        self._return_step = return_step
+
+    def execute(self, **parameters: Any) -> T_DomainListResult:
+        """Execute the query.
+
+        Args:
+            **parameters: The values of the parameters used in the filters of the query.
+
+        Returns:
+            The items of the first or last step of the query.
+
+        """
+        executor = self._compiled.create_executor(
+            parameters={name: _dump_parameter(value) for name, value in parameters.items()},
+            raw=config.global_config.raw_read,
+            batch_limit_store=config.global_config.batch_limit_store,
+            target_latency=config.global_config.target_query_latency,
+        )
+        items: list[Any] = []
+        for results in executor.iterate_resolved(
+            self._client, remove_not_connected=True, reporter=config.global_config.query_reporter
+        ):
+            unpacked = QueryUnpacker(results if self._return_step == "first" else results[-1:]).unpack()
+            items.extend(self._result_cls.model_validate(item) for item in unpacked)
+        return self._result_list_cls(items)
+
+    def explain(self, estimate: bool = True, **parameters: Any) -> QueryPlan:
+        """Explain how the query will be executed without executing it.
+
+        Args:
+            estimate: Whether to estimate the number of instances of each step with aggregate calls.
+            **parameters: The values of the parameters used in the filters of the query.
+
+        Returns:
+            The plan of the query.
+
+        """
+        return self._compiled.steps.explain(
+            self._client if estimate else None,
+            parameters={name: _dump_parameter(value) for name, value in parameters.items()},
+        )
+
+    def _dump_yaml(self) -> str:
+        return self._compiled.steps._dump_yaml()
+
+
+def _dump_parameter(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(timespec="milliseconds")
+    elif isinstance(value, datetime.date):
+        return value.isoformat()
+    elif isinstance(value, (dm.NodeId, dm.DirectRelationReference)):
+        return {"space": value.space, "externalId": value.external_id}
+    elif isinstance(value, list):
+        return [_dump_parameter(item) for item in value]
+    return value
+
+
+def _create_filter_key(value: Any) -> Hashable:
+    # A hashable key of the filter structure and values, which is cheaper than dumping the filter to JSON.
+    if isinstance(value, dm.filters.Filter):
+        return type(value), tuple(_create_filter_key(item) for item in vars(value).values())
+    elif isinstance(value, dm.filters.ParameterValue):
+        return type(value), value.parameter
+    elif isinstance(value, (list, tuple)):
+        return tuple(_create_filter_key(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple((key, _create_filter_key(item)) for key, item in value.items())
+    return value
 
 
 class QueryCore(Generic[T_DomainList, T_DomainListEnd]):
@@ -78,16 +184,16 @@ def __getattr__(self, item: str) -> Any:
             raise ValueError(f"Circular reference detected. Cannot query a circular reference: {nodes}")
         elif self._connection_type == "reverse-list":
             raise ValueError(f"Cannot query across a reverse-list connection.")
-        elif len(self._creation_path) >= global_config.max_select_depth:
+        elif len(self._creation_path) >= config.global_config.max_select_depth:
             hint = f"""You can increase the max_select_depth in the global config.
 ```
 from omni_multi.config import global_config
 
-global_config.max_select_depth = {global_config.max_select_depth+1}
+global_config.max_select_depth = {config.global_config.max_select_depth+1}
 ```
 """
             raise ValueError(
-                f"Max select depth reached. Cannot query deeper than {global_config.max_select_depth}.\n{hint}"
+                f"Max select depth reached. Cannot query deeper than {config.global_config.max_select_depth}.\n{hint}"
             )
         error_message = f"'{self.__class__.__name__}' object has no attribute '{item}'"
         attributes = [name for name in vars(self).keys() if not name.startswith("_")]
@@ -113,6 +219,15 @@ def _create_sort(self) -> list[dm.InstanceSort] | None:
     def _has_limit_1(self) -> bool:
         return any(filter_cls._has_limit_1 for filter_cls in self._filter_classes)
 
+    def _create_shape(self) -> Hashable:
+        return (
+            type(self),
+            self._connection_name,
+            self._has_limit_1(),
+            _create_filter_key(self._assemble_filter()),
+            tuple((tuple(sort.property), sort.direction, sort.nulls_first) for sort in self._create_sort() or []),
+        )
+
     def _repr_html_(self) -> str:
         nodes = [step._result_cls.__name__ for step in self._creation_path]
         edges = [step._connection_name or "missing" for step in self._creation_path[1:]]
@@ -170,21 +285,87 @@ class NodeQueryCore(QueryCore[T_DomainModelList, T_DomainListEnd]):
     _result_cls: ClassVar[type[DomainModel]]
 
     def list_full(self, limit: int = DEFAULT_QUERY_LIMIT) -> T_DomainModelList:
-        builder = self._create_query(limit, return_step="first", try_reverse=True)
-        executor = builder.build()
-        results = executor.execute_query(self._client, remove_not_connected=True)
-        unpacked = QueryUnpacker(results).unpack()
-        cls_ = self._creation_path[0]._result_cls
-        return self._result_list_cls([cls_.model_validate(item) for item in unpacked])
+        return self.prepare(limit, return_step="first").execute()
 
     def _list(self, limit: int = DEFAULT_QUERY_LIMIT) -> T_DomainListEnd:
-        builder = self._create_query(limit, return_step="last")
-        for step in builder[:-1]:
-            step.select = None
-        executor = builder.build()
-        results = executor.execute_query(self._client, remove_not_connected=True)
-        unpacked = QueryUnpacker(results[-1:]).unpack()
-        return self._result_list_cls_end([self._result_cls.model_validate(item) for item in unpacked])  # type: ignore[return-value]
+        return self.prepare(limit, return_step="last").execute()
+
+    @overload
+    def prepare(
+        self, limit: int = DEFAULT_QUERY_LIMIT, return_step: Literal["first"] = "first"
+    ) -> PreparedQuery[T_DomainModelList]: ...
+
+    @overload
+    def prepare(self, limit: int, return_step: Literal["last"]) -> PreparedQuery[T_DomainListEnd]: ...
+
+    def prepare(
+        self, limit: int = DEFAULT_QUERY_LIMIT, return_step: Literal["first", "last"] = "first"
+    ) -> PreparedQuery[T_DomainModelList] | PreparedQuery[T_DomainListEnd]:
+        """Compile the query such that it can be executed repeatedly without rebuilding it.
+
+        The compiled queries are cached by the shape of the query, i.e., the path of connections, filters,
+        and sorting. Use `dm.filters.ParameterValue` for the filter values that change between executions,
+        such that all executions share the same compiled query.
+
+        Args:
+            limit: The maximum number of items to return from the first or last step.
+            return_step: Whether to return the items of the first or the last step of the query.
+
+        Returns:
+            The prepared query.
+
+        Examples:
+
+            Retrieve items by name with the same compiled query:
+
+                >>> from cognite.client import data_modeling as dm
+                >>> query = client.my_view.select().name.equals(dm.filters.ParameterValue("name")).prepare()
+                >>> items = query.execute(name="my_name")
+
+        """
+        key = (limit, return_step, tuple(item._create_shape() for item in self._creation_path))
+        compiled = _prepared_query_cache.get_or_create(key, lambda: self._compile(limit, return_step).compile())
+        if return_step == "first":
+            return PreparedQuery(
+                compiled, self._client, self._creation_path[0]._result_cls, self._result_list_cls, return_step
+            )
+        return PreparedQuery(compiled, self._client, self._result_cls, self._result_list_cls_end, return_step)
+
+    def explain(
+        self, limit: int = DEFAULT_QUERY_LIMIT, return_step: Literal["first", "last"] = "first", estimate: bool = True
+    ) -> QueryPlan:
+        """Explain how the query will be executed without executing it.
+
+        The plan shows, for each step, whether it is retrieved with the query endpoint or with the slower
+        /search fallback, the batch limits, and the estimated number of instances and round trips.
+
+        Args:
+            limit: The maximum number of items to return from the first or last step.
+            return_step: Whether to return the items of the first or the last step of the query.
+            estimate: Whether to estimate the number of instances of each step with aggregate calls.
+
+        Returns:
+            The plan of the query.
+
+        Examples:
+
+            Check the cost of a query before executing it:
+
+                >>> plan = client.my_view.select().my_reverse_list.explain()
+                >>> print(plan)
+
+        """
+        return self.prepare(limit, return_step).explain(estimate)
+
+    def _compile(self, limit: int, return_step: Literal["first", "last"]) -> QueryBuilder:
+        builder = self._create_query(limit, return_step, try_reverse=return_step == "first")
+        for step in builder:
+            # The expressions are owned by the query classes, which can get more filters after the query is compiled.
+            step.expression = copy.copy(step.expression)
+        if return_step == "last":
+            for step in builder[:-1]:
+                step.select = None
+        return builder
 
     def _dump_yaml(self, return_step: Literal["first", "last"] = "first") -> str:
         return self._create_query(DEFAULT_QUERY_LIMIT, return_step)._dump_yaml()
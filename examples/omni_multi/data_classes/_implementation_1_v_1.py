@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from omni_multi.config import global_config
+from omni_multi import config
 from omni_multi.data_classes._core import (
     DEFAULT_QUERY_LIMIT,
     DataRecord,
@@ -28,6 +28,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -111,6 +112,13 @@ class Implementation1v1(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("pygen-models-other", "Implementation1", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "mainValue",
+            "value1",
+            "value2",
+        }
+    )
 
     space: str
     node_type: Union[dm.DirectRelationReference, None] = dm.DirectRelationReference("pygen-models", "Implementation1")
@@ -118,6 +126,20 @@ class Implementation1v1(DomainModel):
     value_1: Optional[str] = Field(None, alias="value1")
     value_2: str = Field(alias="value2")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "mainValue" in properties:
+            args["main_value"] = properties["mainValue"]
+        if "value1" in properties:
+            args["value_1"] = properties["value1"]
+        if "value2" in properties:
+            args["value_2"] = properties["value2"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> Implementation1v1Write:
         """Convert this read version of implementation 1 v 1 to the writing version."""
         return Implementation1v1Write.model_validate(as_write_args(self))
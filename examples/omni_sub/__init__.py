@@ -1,3 +1,3 @@
-from omni_sub._api_client import OmniSubClient
+from omni_sub._api_client import AsyncOmniSubClient, OmniSubClient
 
-__all__ = ["OmniSubClient"]
+__all__ = ["AsyncOmniSubClient", "OmniSubClient"]
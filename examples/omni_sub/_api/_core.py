@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+import time
 from abc import ABC
-from collections import defaultdict
-from collections.abc import Sequence
+from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 from itertools import groupby
+from pathlib import Path
 from typing import (
     Generic,
     Literal,
@@ -14,9 +20,10 @@
     TypeVar,
     overload,
     ClassVar,
+    TYPE_CHECKING,
 )
 
-from cognite.client import CogniteClient
+from cognite.client import AsyncCogniteClient, CogniteClient
 from cognite.client import data_modeling as dm
 from cognite.client.data_classes import TimeSeriesList
 from cognite.client.data_classes.data_modeling.instances import InstanceSort, InstanceAggregationResultList
@@ -41,14 +48,37 @@
     T_DomainRelationWrite,
     T_DomainRelationList,
     QueryBuilder,
+    AsyncQueryExecutor,
     QueryExecutor,
     QueryUnpacker,
+    ColumnarTable,
+    ColumnarUnpacker,
+    concat_tables,
+    PartitionedQueryExecutor,
+    QueryResultStep,
+    QueryResultStepList,
+    create_executor,
+    create_external_id_boundaries,
+    list_raw,
+    retrieve_raw,
+    retrieve_raw_async,
+    search_raw,
 )
 
+if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+
 DEFAULT_LIMIT_READ = 25
 DEFAULT_CHUNK_SIZE = 100
 DEFAULT_QUERY_LIMIT = 3
+DEFAULT_RETRIEVE_BATCH_WINDOW = 0.005
+DEFAULT_RETRIEVE_BATCH_TIMEOUT = 60.0
+DEFAULT_CACHE_SIZE = 10_000
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_SYNC_CHUNK_SIZE = 1_000
 IN_FILTER_LIMIT = 5_000
+# The maximum number of concurrent queries used to retrieve nodes with their connections.
+RETRIEVE_MAX_WORKERS = 4
 INSTANCE_QUERY_LIMIT = 1_000
 NODE_PROPERTIES = {"externalId", "space"}
 
@@ -75,6 +105,381 @@ def _as_node_id(value: str | dm.NodeId | tuple[str, str], space: str) -> dm.Node
     raise TypeError(f"Expected str, NodeId or tuple, got {type(value)}")
 
 
+def _as_node_ids(
+    external_id: str | dm.NodeId | tuple[str, str] | SequenceNotStr[str | dm.NodeId | tuple[str, str]],
+    space: str,
+) -> tuple[list[dm.NodeId], bool]:
+    """Returns the node IDs and whether multiple nodes were requested."""
+    if isinstance(external_id, str | dm.NodeId) or (
+        isinstance(external_id, tuple) and len(external_id) == 2 and all(isinstance(i, str) for i in external_id)
+    ):
+        return [_as_node_id(external_id, space)], False
+    return [_as_node_id(ext_id, space) for ext_id in external_id], True
+
+
+def _create_retrieve_filters(node_ids: Sequence[dm.NodeId]) -> Iterator[tuple[dm.Filter, int]]:
+    """Yields the filters selecting the nodes in chunks, together with the number of nodes in each chunk."""
+    for space_key, external_ids in groupby(sorted((node_id.as_tuple() for node_id in node_ids)), key=lambda x: x[0]):
+        external_id_list = [ext_id[1] for ext_id in external_ids]
+        for ext_id_chunk in chunker(external_id_list, IN_FILTER_LIMIT):
+            filter_ = dm.filters.Equals(["node", "space"], space_key) & dm.filters.In(
+                ["node", "externalId"], ext_id_chunk
+            )
+            yield filter_, len(ext_id_chunk)
+
+
+class _RetrieveBatch:
+    def __init__(self) -> None:
+        # Used as an ordered set.
+        self.node_ids: dict[dm.NodeId, None] = {}
+        self.is_full = threading.Event()
+        self.is_done = threading.Event()
+        self.items_by_id: dict[dm.NodeId, DomainModel] = {}
+        self.error: BaseException | None = None
+
+
+class RetrieveBatcher:
+    """Coalesces the retrieve calls from multiple threads into batched requests.
+
+    The calls with the same retrieve_connections that arrive within the window, or until the batch is full,
+    are loaded in a single call to load. The first call of a batch makes the request, the other calls wait
+    for it to complete. A call that waits longer than the timeout makes its own request instead.
+
+    Args:
+        load: Retrieves the nodes with the given IDs.
+        window: The number of seconds to wait for other calls before the request is made.
+        max_batch_size: The maximum number of nodes in a batch.
+        timeout: The maximum number of seconds to wait for the request of another call.
+
+    """
+
+    def __init__(
+        self,
+        load: Callable[[list[dm.NodeId], Literal["skip", "identifier", "full"]], Sequence[DomainModel]],
+        window: float = DEFAULT_RETRIEVE_BATCH_WINDOW,
+        max_batch_size: int = IN_FILTER_CHUNK_SIZE,
+        timeout: float = DEFAULT_RETRIEVE_BATCH_TIMEOUT,
+    ) -> None:
+        self._load = load
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: dict[str, _RetrieveBatch] = {}
+
+    def retrieve(
+        self, node_ids: Sequence[dm.NodeId], retrieve_connections: Literal["skip", "identifier", "full"]
+    ) -> list[DomainModel]:
+        with self._lock:
+            batch = self._pending.get(retrieve_connections)
+            is_leader = batch is None
+            if batch is None:
+                batch = self._pending[retrieve_connections] = _RetrieveBatch()
+            batch.node_ids.update(dict.fromkeys(node_ids))
+            if len(batch.node_ids) >= self._max_batch_size:
+                # Later calls start a new batch.
+                del self._pending[retrieve_connections]
+                batch.is_full.set()
+
+        if is_leader:
+            # The waiting calls are released whatever happens to the leader, for example, if it is interrupted.
+            try:
+                batch.is_full.wait(self._window)
+                self._close(batch, retrieve_connections)
+                loaded = self._load(list(batch.node_ids), retrieve_connections)
+                batch.items_by_id = {item.as_id(): item for item in loaded}
+            except BaseException as e:
+                batch.error = e
+            finally:
+                self._close(batch, retrieve_connections)
+                batch.is_done.set()
+        elif not batch.is_done.wait(self._timeout):
+            # The leader is stuck, thus, the nodes are retrieved without it.
+            loaded = self._load(list(dict.fromkeys(node_ids)), retrieve_connections)
+            item_by_id = {item.as_id(): item for item in loaded}
+            return [item_by_id[node_id] for node_id in node_ids if node_id in item_by_id]
+
+        if batch.error is not None:
+            raise batch.error
+        return [batch.items_by_id[node_id] for node_id in node_ids if node_id in batch.items_by_id]
+
+    def _close(self, batch: _RetrieveBatch, retrieve_connections: str) -> None:
+        # Later calls start a new batch.
+        with self._lock:
+            if self._pending.get(retrieve_connections) is batch:
+                del self._pending[retrieve_connections]
+
+
+class InstanceCache:
+    """A read-through cache of the retrieved nodes, shared by all APIs of a client.
+
+    The nodes are cached by view, node ID, and retrieve_connections. The least recently used nodes are evicted
+    when the cache is full, and the nodes expire after the time to live of their view. Upserting or deleting
+    nodes through the client invalidates them. Nodes retrieved with connections are invalidated by any upsert
+    or delete, as the changed nodes can be among their connections.
+
+    The cached objects are shared by all callers, so they should not be modified.
+
+    Args:
+        maxsize: The maximum number of nodes in the cache.
+        ttl: The number of seconds a node is cached.
+        ttl_by_view: The time to live of the nodes of specific views, overriding ttl. Set to 0 to not cache a view.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._ttl_by_view = ttl_by_view or {}
+        self._lock = threading.Lock()
+        # The values are the expiry time and the node.
+        self._items: OrderedDict[tuple[dm.ViewId, dm.NodeId, str], tuple[float, DomainModel]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of nodes found in the cache."""
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of nodes not found in the cache, or expired."""
+        with self._lock:
+            return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = self._hits + self._misses
+            return self._hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def get(
+        self, view_id: dm.ViewId, node_ids: Sequence[dm.NodeId], retrieve_connections: str
+    ) -> dict[dm.NodeId, DomainModel]:
+        """Returns the cached nodes by ID, the nodes that are not cached are left out."""
+        now = time.monotonic()
+        found: dict[dm.NodeId, DomainModel] = {}
+        with self._lock:
+            for node_id in node_ids:
+                key = (view_id, node_id, retrieve_connections)
+                entry = self._items.get(key)
+                if entry is None or entry[0] <= now:
+                    self._items.pop(key, None)
+                    self._misses += 1
+                    continue
+                self._items.move_to_end(key)
+                self._hits += 1
+                found[node_id] = entry[1]
+        return found
+
+    def set(self, view_id: dm.ViewId, items: Sequence[DomainModel], retrieve_connections: str) -> None:
+        ttl = self._ttl_by_view.get(view_id, self._ttl)
+        if ttl <= 0 or self._maxsize <= 0:
+            return
+        expires = time.monotonic() + ttl
+        with self._lock:
+            for item in items:
+                key = (view_id, item.as_id(), retrieve_connections)
+                self._items[key] = (expires, item)
+                self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def invalidate(self, node_ids: Iterable[dm.NodeId]) -> None:
+        """Removes the written nodes from the cache.
+
+        Nodes retrieved without connections are only removed if they are among the given nodes. All nodes
+        retrieved with connections are removed on every write, regardless of the given nodes, as the written
+        nodes and edges can be among, or become, their connections.
+
+        Args:
+            node_ids: The upserted or deleted nodes.
+
+        """
+        invalid = set(node_ids)
+        with self._lock:
+            for key in [key for key in self._items if key[1] in invalid or key[2] != "skip"]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+@dataclass
+class SyncBatch(Generic[T_DomainModelList]):
+    """The changes to the nodes of a view since the previous cursor.
+
+    Args:
+        items: The created and updated nodes.
+        deleted: The IDs of the deleted nodes.
+        cursor: Pass this to sync to get the changes after this batch.
+
+    """
+
+    items: T_DomainModelList
+    deleted: list[dm.NodeId]
+    cursor: str | None
+
+
+class LocalMirror:
+    """A local copy of the nodes of one or more views, stored in SQLite.
+
+    The mirror is filled incrementally with the sync of each view, such that a refresh only transfers
+    the changes since the previous refresh. The direct relations are indexed in both directions, such
+    that the nodes pointing to a node are found without scanning the view.
+
+    Args:
+        path: The SQLite database file. Defaults to ':memory:', which keeps the mirror in memory.
+
+    Examples:
+
+        Mirror a view and read from it:
+
+            >>> mirror = LocalMirror("mirror.db")
+            >>> mirror.refresh(client.equipment)
+            >>> client.equipment.use_mirror(mirror)
+            >>> equipment = client.equipment.retrieve("my_equipment")
+
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        # Imported here as sqlite3 is not available in all environments, e.g., Pyodide.
+        import sqlite3
+
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_MIRROR_SCHEMA)
+
+    @staticmethod
+    def _view_key(view_id: dm.ViewId) -> str:
+        return f"{view_id.space}:{view_id.external_id}/{view_id.version}"
+
+    def refresh(self, api: NodeReadAPI, chunk_size: int = DEFAULT_SYNC_CHUNK_SIZE) -> int:
+        """Apply the changes to the nodes of the view since the last refresh.
+
+        Args:
+            api: The API of the view to mirror.
+            chunk_size: The maximum number of nodes in each sync request, the changes of each are stored
+                in one transaction.
+
+        Returns:
+            The number of created, updated, and deleted nodes.
+
+        """
+        view = self._view_key(api._view_id)
+        with self._lock:
+            row = self._connection.execute("SELECT cursor FROM cursors WHERE view = ?", (view,)).fetchone()
+        change_count = 0
+        for nodes in api._sync_nodes(row[0] if row else None, chunk_size=chunk_size):
+            with self._lock, self._connection:
+                for node in nodes:
+                    key = (view, node.space, node.external_id)
+                    self._connection.execute(
+                        "DELETE FROM direct_relations WHERE view = ? AND space = ? AND external_id = ?", key
+                    )
+                    if node.deleted_time is not None:
+                        self._connection.execute(
+                            "DELETE FROM nodes WHERE view = ? AND space = ? AND external_id = ?", key
+                        )
+                        continue
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?)", (*key, json.dumps(node.dump()))
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO direct_relations VALUES (?, ?, ?, ?, ?, ?)",
+                        [(*key, *relation) for relation in self._direct_relations(node, api._view_id)],
+                    )
+                self._connection.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", (view, nodes.cursor))
+            change_count += len(nodes)
+        return change_count
+
+    @staticmethod
+    def _direct_relations(node: dm.Node, view_id: dm.ViewId) -> Iterator[tuple[str, str, str]]:
+        for prop, value in node.properties.get(view_id, {}).items():
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict) and "space" in item and "externalId" in item:
+                    yield prop, item["space"], item["externalId"]
+
+    def retrieve(self, view_id: dm.ViewId, node_ids: Sequence[dm.NodeId]) -> list[dm.Node]:
+        nodes: list[dm.Node] = []
+        view = self._view_key(view_id)
+        with self._lock:
+            for node_id in node_ids:
+                row = self._connection.execute(
+                    "SELECT data FROM nodes WHERE view = ? AND space = ? AND external_id = ?",
+                    (view, node_id.space, node_id.external_id),
+                ).fetchone()
+                if row is not None:
+                    nodes.append(dm.Node.load(json.loads(row[0])))
+        return nodes
+
+    def list_referencing(self, view_id: dm.ViewId, property: str, targets: Sequence[dm.NodeId]) -> list[dm.Node]:
+        """Returns the nodes of the view with the direct relation property pointing to any of the targets."""
+        nodes: dict[tuple[str, str], dm.Node] = {}
+        view = self._view_key(view_id)
+        with self._lock:
+            for target in targets:
+                rows = self._connection.execute(
+                    "SELECT nodes.space, nodes.external_id, nodes.data FROM direct_relations "
+                    "JOIN nodes USING (view, space, external_id) "
+                    "WHERE view = ? AND property = ? AND target_space = ? AND target_external_id = ?",
+                    (view, property, target.space, target.external_id),
+                ).fetchall()
+                for space, external_id, data in rows:
+                    if (space, external_id) not in nodes:
+                        nodes[(space, external_id)] = dm.Node.load(json.loads(data))
+        return list(nodes.values())
+
+    def list(self, view_id: dm.ViewId, limit: int | None = None) -> list[dm.Node]:
+        # A negative limit is no limit in SQLite.
+        sql_limit = -1 if limit is None or limit < 0 or limit == float("inf") else limit
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM nodes WHERE view = ? ORDER BY space, external_id LIMIT ?",
+                (self._view_key(view_id), sql_limit),
+            ).fetchall()
+        return [dm.Node.load(json.loads(row[0])) for row in rows]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+_MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    view TEXT NOT NULL,
+    space TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (view, space, external_id)
+);
+CREATE TABLE IF NOT EXISTS direct_relations (
+    view TEXT NOT NULL,
+    space TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    property TEXT NOT NULL,
+    target_space TEXT NOT NULL,
+    target_external_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS direct_relations_source ON direct_relations (view, space, external_id);
+CREATE INDEX IF NOT EXISTS direct_relations_target
+    ON direct_relations (view, property, target_space, target_external_id);
+CREATE TABLE IF NOT EXISTS cursors (view TEXT PRIMARY KEY, cursor TEXT);
+"""
+
+
 # Source from https://github.com/python/typing/issues/256#issuecomment-1442633430
 # This works because str.__contains__ does not accept an object (either in typeshed or at runtime)
 class SequenceNotStr(Protocol[_T_co]):
@@ -107,14 +512,21 @@ class NodeReadAPI(Generic[T_DomainModel, T_DomainModelList], ABC):
     def __init__(self, client: CogniteClient):
         self._client = client
         self._last_cursors: dict[str, str | None] | None = None
+        self._retrieve_batcher: RetrieveBatcher | None = None
+        # Set by the client, such that the cache is shared by all APIs.
+        self._instance_cache: InstanceCache | None = None
+        self._mirror: LocalMirror | None = None
 
     def _delete(self, external_id: str | SequenceNotStr[str], space: str) -> dm.InstancesDeleteResult:
         if isinstance(external_id, str):
-            return self._client.data_modeling.instances.delete(nodes=(space, external_id))
+            result = self._client.data_modeling.instances.delete(nodes=(space, external_id))
         else:
-            return self._client.data_modeling.instances.delete(
+            result = self._client.data_modeling.instances.delete(
                 nodes=[(space, id) for id in external_id],
             )
+        if self._instance_cache is not None:
+            self._instance_cache.invalidate(result.nodes)
+        return result
 
     def _retrieve(
         self,
@@ -123,15 +535,41 @@ def _retrieve(
         retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
         as_child_class: SequenceNotStr[str] | None = None,
     ) -> T_DomainModel | T_DomainModelList | None:
-        if isinstance(external_id, str | dm.NodeId) or (
-            isinstance(external_id, tuple) and len(external_id) == 2 and all(isinstance(i, str) for i in external_id)
-        ):
-            node_ids = [_as_node_id(external_id, space)]
-            is_multiple = False
+        node_ids, is_multiple = _as_node_ids(external_id, space)
+        cache = None if as_child_class else self._instance_cache
+        cached = cache.get(self._view_id, node_ids, retrieve_connections) if cache is not None else {}
+        missing = [node_id for node_id in node_ids if node_id not in cached]
+
+        items: Sequence[DomainModel] = []
+        if not missing:
+            pass
+        elif self._retrieve_batcher is not None and not as_child_class:
+            items = self._retrieve_batcher.retrieve(missing, retrieve_connections)
+        else:
+            items = self._retrieve_items(missing, retrieve_connections, as_child_class)
+
+        if cache is not None:
+            cache.set(self._view_id, items, retrieve_connections)
+        if cached:
+            item_by_id = {item.as_id(): item for item in items}
+            item_by_id.update(cached)
+            items = [item_by_id[node_id] for node_id in dict.fromkeys(node_ids) if node_id in item_by_id]
+
+        nodes = self._class_list(items)
+
+        if is_multiple:
+            return nodes
+        elif not nodes:
+            return None
         else:
-            is_multiple = True
-            node_ids = [_as_node_id(ext_id, space) for ext_id in external_id]
+            return nodes[0]
 
+    def _retrieve_items(
+        self,
+        node_ids: list[dm.NodeId],
+        retrieve_connections: Literal["skip", "identifier", "full"],
+        as_child_class: SequenceNotStr[str] | None = None,
+    ) -> list[DomainModel]:
         items: list[DomainModel] = []
         if as_child_class and retrieve_connections == "skip":
             if not hasattr(self, "_direct_children_by_external_id"):
@@ -140,38 +578,111 @@ def _retrieve(
                 child_cls = self._direct_children_by_external_id.get(child_class_external_id)
                 if child_cls is None:
                     raise ValueError(f"Could not find child class with external_id {child_class_external_id}")
-                instances = self._client.data_modeling.instances.retrieve(nodes=node_ids, sources=child_cls._view_id)
-                items.extend(
-                    instantiate_classes(child_cls, [child_cls._to_dict(node) for node in instances.nodes], "retrieve")
-                )
+                nodes = self._retrieve_nodes(node_ids, child_cls._view_id)
+                items.extend(instantiate_nodes(child_cls, nodes, "retrieve"))
         elif as_child_class:
             raise ValueError("Cannot retrieve as child classes and include connections")
+        elif retrieve_connections == "skip" and self._mirror is not None:
+            items.extend(self._to_class_list(self._mirror.retrieve(self._view_id, node_ids), "retrieve"))
         elif retrieve_connections == "skip":
-            instances = self._client.data_modeling.instances.retrieve(nodes=node_ids, sources=self._view_id)
-            items.extend(
-                instantiate_classes(
-                    self._class_type, [self._class_type._to_dict(node) for node in instances.nodes], "retrieve"
-                )
-            )
+            items.extend(self._to_class_list(self._retrieve_nodes(node_ids, self._view_id), "retrieve"))
         else:
-            for space_key, external_ids in groupby(
-                sorted((node_id.as_tuple() for node_id in node_ids)), key=lambda x: x[0]
-            ):
-                external_id_list = [ext_id[1] for ext_id in external_ids]
-                for ext_id_chunk in chunker(external_id_list, IN_FILTER_CHUNK_SIZE):
-                    filter_ = dm.filters.Equals(["node", "space"], space_key) & dm.filters.In(
-                        ["node", "externalId"], ext_id_chunk
-                    )
-                    items.extend(self._query(filter_, len(ext_id_chunk), retrieve_connections, None, "retrieve"))
+            items.extend(self._retrieve_with_connections(node_ids, retrieve_connections))
+        return items
+
+    def _retrieve_nodes(self, node_ids: list[dm.NodeId], view_id: dm.ViewId) -> Sequence[dm.Node]:
+        if global_config.raw_read:
+            return retrieve_raw(self._client, node_ids, view_id)
+        return self._client.data_modeling.instances.retrieve(nodes=node_ids, sources=view_id).nodes
+
+    def _retrieve_with_connections(
+        self, node_ids: list[dm.NodeId], retrieve_connections: Literal["skip", "identifier", "full"]
+    ) -> list[T_DomainModel]:
+        filters = list(_create_retrieve_filters(node_ids))
+
+        def execute(filter_and_limit: tuple[dm.Filter, int]) -> list[QueryResultStep]:
+            filter_, limit = filter_and_limit
+            executor = self._build(filter_, limit, retrieve_connections)
+            return executor.execute_query(
+                self._client, remove_not_connected=False, reporter=global_config.query_reporter
+            )
 
-        nodes = self._class_list(items)
+        if len(filters) <= 1:
+            return self._unpack_retrieved([execute(filter_and_limit) for filter_and_limit in filters])
+        pool = create_executor(max_workers=min(len(filters), RETRIEVE_MAX_WORKERS), thread_name_prefix="pygen-retrieve")
+        try:
+            return self._unpack_retrieved(list(pool.map(execute, filters)))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _unpack_retrieved(self, chunk_results: Sequence[list[QueryResultStep]]) -> list[T_DomainModel]:
+        # The results of the chunks are merged, such that the nodes are unpacked and instantiated once.
+        results: dict[str, QueryResultStep] = {}
+        for chunk_result in chunk_results:
+            for step_result in chunk_result:
+                if step_result.name in results:
+                    results[step_result.name].results.extend(step_result.results)
+                else:
+                    results[step_result.name] = step_result
+        unpacked = QueryUnpacker(list(results.values()), edges="skip").unpack()
+        return instantiate_classes(self._class_type, unpacked, "retrieve")
 
-        if is_multiple:
-            return nodes
-        elif not nodes:
-            return None
-        else:
-            return nodes[0]
+    def enable_retrieve_batching(
+        self, window: float = DEFAULT_RETRIEVE_BATCH_WINDOW, max_batch_size: int = IN_FILTER_CHUNK_SIZE
+    ) -> None:
+        """Coalesce concurrent calls to retrieve into batched requests.
+
+        This is useful when many threads retrieve a few nodes each, for example, in the resolvers of a
+        GraphQL server. The first call waits for the window to collect the calls from the other threads, and
+        a single request is made for all of them. Calls retrieving the same node get the same object.
+
+        Args:
+            window: The number of seconds to wait for other calls before the request is made.
+            max_batch_size: The maximum number of nodes in a batch, the request is made as soon as it is reached.
+
+        """
+        self._retrieve_batcher = RetrieveBatcher(self._retrieve_items, window, max_batch_size)
+
+    def disable_retrieve_batching(self) -> None:
+        """Make a request for each call to retrieve, this is the default."""
+        self._retrieve_batcher = None
+
+    def use_mirror(self, mirror: LocalMirror | None) -> None:
+        """Read from a local mirror instead of CDF, pass None to read from CDF again.
+
+        Retrieve without connections and list without filters or sorting read from the mirror, all other
+        calls still read from CDF. The mirror is only as fresh as its last refresh.
+
+        Args:
+            mirror: The mirror, refreshed with this API.
+
+        """
+        self._mirror = mirror
+
+    def list_referencing(
+        self,
+        property: str,
+        target: str | dm.NodeId | tuple[str, str] | SequenceNotStr[str | dm.NodeId | tuple[str, str]],
+        space: str,
+    ) -> T_DomainModelList:
+        """List the nodes in the local mirror with a direct relation to any of the target nodes.
+
+        Args:
+            property: The direct relation field.
+            target: The external id(s) or ID(s) of the target nodes.
+            space: The space of the target nodes given by external id.
+
+        Returns:
+            The nodes pointing to the targets.
+
+        """
+        if self._mirror is None:
+            raise ValueError("No mirror is used, call use_mirror first")
+        targets, _ = _as_node_ids(target, space)
+        # Direct relations are not in the properties by field, their aliases are the property identifiers.
+        field = self._class_type.model_fields.get(property)
+        property_ = field.alias if field is not None and field.alias else property
+        return self._to_class_list(self._mirror.list_referencing(self._view_id, property_, targets), "list")
 
     def _build(
         self,
@@ -192,9 +703,13 @@ def _query(
         context: Literal["query", "list", "retrieve"] = "query",
     ) -> T_DomainModelList:
         executor = self._build(filter_, limit, retrieve_connections, sort)
-        results = executor.execute_query(self._client, remove_not_connected=False)
-        unpacked = QueryUnpacker(results, edges="skip").unpack()
-        item_list = instantiate_classes(self._class_type, unpacked, context)
+        item_list: list[T_DomainModel] = []
+        # Unpacking group by group releases the raw instances as soon as their connections are resolved.
+        for results in executor.iterate_resolved(
+            self._client, remove_not_connected=False, reporter=global_config.query_reporter
+        ):
+            unpacked = QueryUnpacker(results, edges="skip").unpack()
+            item_list.extend(instantiate_classes(self._class_type, unpacked, context))
         return self._class_list(item_list)
 
     def _iterate(
@@ -205,6 +720,8 @@ def _iterate(
         retrieve_connections: Literal["skip", "identifier", "full"],
         sort: list[InstanceSort] | None = None,
         cursors: dict[str, str | None] | None = None,
+        prefetch: int = 0,
+        partitions: int = 1,
     ) -> Iterator[T_DomainModelList]:
         if cursors is not None and self._last_cursors is not None:
             raise ValueError(
@@ -212,13 +729,176 @@ def _iterate(
                 "This is to avoid accidental infinite loops."
             )
         self._last_cursors = cursors
-        executor = self._build(filter_, limit, retrieve_connections, sort, chunk_size)
-        for batch_results in executor.iterate(self._client, remove_not_connected=False, init_cursors=cursors):
+        if partitions > 1 or PartitionedQueryExecutor.load_boundaries(cursors) is not None:
+            iterator = self._iterate_partitioned(
+                chunk_size, filter_, limit, retrieve_connections, cursors, prefetch, partitions
+            )
+        else:
+            executor = self._build(filter_, limit, retrieve_connections, sort, chunk_size)
+            iterator = executor.iterate(
+                self._client,
+                remove_not_connected=False,
+                init_cursors=cursors,
+                prefetch=prefetch,
+                reporter=global_config.query_reporter,
+            )
+        for batch_results in iterator:
             unpacked = QueryUnpacker(batch_results, edges="skip").unpack()
             yield self._class_list(
                 instantiate_classes(self._class_type, unpacked, "iterate"), cursors=batch_results._cursors
             )
 
+    def _iterate_partitioned(
+        self,
+        chunk_size: int,
+        filter_: dm.Filter | None,
+        limit: int | None,
+        retrieve_connections: Literal["skip", "identifier", "full"],
+        cursors: dict[str, str | None] | None,
+        prefetch: int,
+        partitions: int,
+    ) -> Iterator[QueryResultStepList]:
+        if limit is not None:
+            raise ValueError("The limit is not supported when iterating over partitions")
+        if prefetch:
+            # Each partition is retrieved by its own worker, which already fetches ahead of the caller.
+            raise ValueError("The prefetch is not supported when iterating over partitions")
+        boundaries = PartitionedQueryExecutor.load_boundaries(cursors)
+        if boundaries is None:
+            boundaries = create_external_id_boundaries(self._client, self._view_id, filter_, partitions)
+
+        def build(partition_filter: dm.Filter | None) -> QueryExecutor:
+            if filter_ is not None and partition_filter is not None:
+                partition_filter = dm.filters.And(filter_, partition_filter)
+            return self._build(partition_filter or filter_, None, retrieve_connections, None, chunk_size)
+
+        executor = PartitionedQueryExecutor(build, boundaries)
+        yield from executor.iterate(
+            self._client,
+            remove_not_connected=False,
+            init_cursors=cursors,
+            reporter=global_config.query_reporter,
+        )
+
+    def to_arrow(
+        self,
+        filter: dm.Filter | None = None,
+        limit: int | None = None,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+    ) -> dict[str, pa.Table]:
+        """List the nodes as Arrow tables.
+
+        The properties are read directly into columns, without creating a dictionary or an object per node.
+        This requires pyarrow to be installed.
+
+        Args:
+            filter: The filter to apply.
+            limit: Maximum number of nodes to return. Defaults to None, which returns all nodes.
+            retrieve_connections: Whether to retrieve the connected nodes and edges as separate tables.
+
+        Returns:
+            One table per connection, by the path of connection properties. The nodes are in the table ''.
+            The connected tables have a '_parentIndex' column with the rows in the parent table each row
+            is connected to.
+
+        """
+        executor = self._build(filter, limit, retrieve_connections)
+        tables: dict[str, ColumnarTable] = {}
+        for results in executor.iterate_resolved(
+            self._client, remove_not_connected=False, reporter=global_config.query_reporter
+        ):
+            concat_tables(tables, ColumnarUnpacker(results).unpack())
+        return {name: table.to_arrow() for name, table in tables.items()}
+
+    def iterate_arrow(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        filter: dm.Filter | None = None,
+        limit: int | None = None,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+        cursors: dict[str, str | None] | None = None,
+    ) -> Iterator[dict[str, pa.Table]]:
+        """Iterate over the nodes as Arrow tables, see `to_arrow` for the format of the tables.
+
+        Args:
+            chunk_size: The number of nodes to return in each chunk. Defaults to 100.
+            filter: The filter to apply.
+            limit: Maximum number of nodes to return. Defaults to None, which returns all nodes.
+            retrieve_connections: Whether to retrieve the connected nodes and edges as separate tables.
+            cursors: (Advanced) Cursor to use for pagination. This can be used to resume an iteration from a
+                specific point. The cursors of a chunk are stored as JSON under the 'cursors' key in the schema
+                metadata of its tables.
+
+        Returns:
+            Iteration of the tables of each chunk.
+
+        """
+        executor = self._build(filter, limit, retrieve_connections, None, chunk_size)
+        for batch_results in executor.iterate(
+            self._client,
+            remove_not_connected=False,
+            init_cursors=cursors,
+            reporter=global_config.query_reporter,
+        ):
+            metadata = {"cursors": json.dumps(batch_results._cursors)}
+            yield {
+                name: table.to_arrow().replace_schema_metadata(metadata)
+                for name, table in ColumnarUnpacker(batch_results).unpack().items()
+            }
+
+    def sync(
+        self,
+        cursor: str | None = None,
+        filter: dm.Filter | None = None,
+        chunk_size: int = DEFAULT_SYNC_CHUNK_SIZE,
+    ) -> Iterator[SyncBatch[T_DomainModelList]]:
+        """Iterate over the nodes created, updated, or deleted since the cursor.
+
+        The first sync, without a cursor, returns all nodes. Store the cursor of the last batch,
+        and pass it to the next sync to only get the changes since then. Cursors expire after three days.
+
+        Args:
+            cursor: The cursor of the last batch of a previous sync.
+            filter: The filter to apply.
+            chunk_size: The maximum number of nodes in each batch. Defaults to 1000.
+
+        Returns:
+            Iteration of the batches of changes. There is always at least one batch, such that there
+            is a cursor to continue from, even when there are no changes.
+
+        """
+        for nodes in self._sync_nodes(cursor, filter, chunk_size):
+            deleted = [node.as_id() for node in nodes if node.deleted_time is not None]
+            items = self._to_class_list([node for node in nodes if node.deleted_time is None], "sync")
+            yield SyncBatch(items, deleted, nodes.cursor)
+
+    def _sync_nodes(
+        self, cursor: str | None, filter: dm.Filter | None = None, chunk_size: int = DEFAULT_SYNC_CHUNK_SIZE
+    ) -> Iterator[dm.NodeListWithCursor]:
+        has_data = dm.filters.HasData(views=[self._view_id])
+        query = dm.query.QuerySync(
+            with_={
+                "nodes": dm.query.NodeResultSetExpressionSync(
+                    filter=has_data if filter is None else dm.filters.And(has_data, filter),
+                    limit=chunk_size,
+                )
+            },
+            select={"nodes": dm.query.SelectSync([dm.query.SourceSelector(self._view_id, ["*"])])},
+            cursors={"nodes": cursor},
+        )
+        while True:
+            result = self._client.data_modeling.instances.sync(query)
+            nodes = result.get_nodes("nodes")
+            if self._instance_cache is not None:
+                self._instance_cache.invalidate(nodes.as_ids())
+            # The empty page is yielded as well, such that there is always a cursor to continue from.
+            yield nodes
+            # A page can be shorter than the chunk size while there are more changes, thus, the sync is
+            # only caught up when a page is empty.
+            if not nodes:
+                break
+            query.cursors = {"nodes": nodes.cursor}
+
     def _search(
         self,
         query: str,
@@ -229,21 +909,33 @@ def _search(
         direction: Literal["ascending", "descending"] = "ascending",
         sort: InstanceSort | list[InstanceSort] | None = None,
     ) -> T_DomainModelList:
-        properties_input = self._to_input_properties(properties)
+        nodes: Sequence[dm.Node]
+        if global_config.raw_read:
+            nodes = search_raw(
+                self._client,
+                self._view_id,
+                query,
+                properties=self._to_input_properties(properties),
+                filter=filter_,
+                limit=limit,
+                sort=self._create_sort(sort_by, direction, sort),
+            )
+        else:
+            nodes = self._client.data_modeling.instances.search(
+                view=self._view_id,
+                query=query,
+                instance_type="node",
+                properties=self._to_input_properties(properties),
+                filter=filter_,
+                limit=limit,
+                sort=self._create_sort(sort_by, direction, sort),
+            )
+        return self._to_class_list(nodes, "search")
 
-        sort_input = self._create_sort(sort_by, direction, sort)
-        nodes = self._client.data_modeling.instances.search(
-            view=self._view_id,
-            query=query,
-            instance_type="node",
-            properties=properties_input,
-            filter=filter_,
-            limit=limit,
-            sort=sort_input,
-        )
-        return self._class_list(
-            instantiate_classes(self._class_type, [self._class_type._to_dict(node) for node in nodes], "search")
-        )
+    def _to_class_list(
+        self, nodes: Sequence[dm.Node], context: Literal["query", "list", "retrieve", "search", "iterate", "sync"]
+    ) -> T_DomainModelList:
+        return self._class_list(instantiate_nodes(self._class_type, nodes, context))
 
     def _to_input_properties(self, properties: str | SequenceNotStr[str] | None) -> list[str] | None:
         properties_input: list[str] | None = None
@@ -273,6 +965,24 @@ def _aggregate(
         | list[dm.aggregations.AggregatedNumberedValue]
         | InstanceAggregationResultList
     ):
+        return self._client.data_modeling.instances.aggregate(
+            **self._create_aggregate_arguments(aggregate, group_by, properties, query, search_properties, limit, filter)
+        )
+
+    def _create_aggregate_arguments(
+        self,
+        aggregate: (
+            Aggregations
+            | dm.aggregations.MetricAggregation
+            | SequenceNotStr[Aggregations | dm.aggregations.MetricAggregation]
+        ),
+        group_by: str | SequenceNotStr[str] | None,
+        properties: str | SequenceNotStr[str] | None,
+        query: str | None,
+        search_properties: str | SequenceNotStr[str] | None,
+        limit: int,
+        filter: dm.Filter | None,
+    ) -> dict[str, Any]:
         if isinstance(group_by, str):
             group_by = [group_by]
 
@@ -310,7 +1020,7 @@ def _aggregate(
             else:
                 raise TypeError(f"Expected str or MetricAggregation, got {type(agg)}")
 
-        return self._client.data_modeling.instances.aggregate(
+        return dict(
             view=self._view_id,
             aggregates=aggregates[0] if is_single_aggregate else aggregates,
             group_by=group_by,
@@ -348,16 +1058,25 @@ def _histogram(
         )
 
     def _list(self, limit: int, filter: dm.Filter | None, sort: list[InstanceSort] | None = None) -> T_DomainModelList:
-        nodes = self._client.data_modeling.instances.list(
+        if self._mirror is not None and filter is None and sort is None:
+            return self._to_class_list(self._mirror.list(self._view_id, limit), "list")
+        items = self._to_class_list(self._list_nodes(limit, filter, sort), "list")
+        if self._instance_cache is not None:
+            self._instance_cache.set(self._view_id, items, "skip")
+        return items
+
+    def _list_nodes(
+        self, limit: int, filter: dm.Filter | None, sort: list[InstanceSort] | None = None
+    ) -> Sequence[dm.Node]:
+        if global_config.raw_read:
+            return list_raw(self._client, "node", self._view_id, limit, filter, sort)
+        return self._client.data_modeling.instances.list(
             instance_type="node",
             sources=self._view_id,
             limit=limit,
             filter=filter,
             sort=sort,
         )
-        return self._class_list(
-            instantiate_classes(self._class_type, [self._class_type._to_dict(node) for node in nodes], "list")
-        )
 
     def _create_sort(
         self,
@@ -411,6 +1130,8 @@ def _apply(
             auto_create_end_nodes=True,
             replace=replace,
         )
+        if self._instance_cache is not None:
+            self._instance_cache.invalidate(result.nodes.as_ids())
         time_series = TimeSeriesList([])
         if instances.time_series:
             time_series = self._client.time_series.upsert(instances.time_series, mode="patch")
@@ -418,6 +1139,297 @@ def _apply(
         return ResourcesWriteResult(result.nodes, result.edges, time_series)
 
 
+class AsyncNodeReadAPI(Generic[T_DomainModel, T_DomainModelList]):
+    """Asynchronous access to the nodes of a view.
+
+    The queries are built and the results unpacked by the synchronous API, only the requests
+    are awaited using the AsyncCogniteClient. Thus, many calls can run concurrently in a single event loop.
+
+    Args:
+        api: The synchronous API of the view.
+        client: The asynchronous client used for the requests.
+
+    """
+
+    def __init__(self, api: NodeReadAPI[T_DomainModel, T_DomainModelList], client: AsyncCogniteClient):
+        self._api = api
+        self._client = client
+
+    def use_mirror(self, mirror: LocalMirror | None) -> None:
+        """Read from a local mirror instead of CDF, pass None to read from CDF again.
+
+        Retrieve without connections and list without filters or sorting read from the mirror, all other
+        calls still read from CDF. The mirror is shared with the synchronous API used to unpack the results.
+
+        Args:
+            mirror: The mirror.
+
+        """
+        self._api.use_mirror(mirror)
+
+    @overload
+    async def retrieve(
+        self,
+        external_id: str | dm.NodeId | tuple[str, str],
+        space: str,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+    ) -> T_DomainModel | None: ...
+
+    @overload
+    async def retrieve(
+        self,
+        external_id: SequenceNotStr[str | dm.NodeId | tuple[str, str]],
+        space: str,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+    ) -> T_DomainModelList: ...
+
+    async def retrieve(
+        self,
+        external_id: str | dm.NodeId | tuple[str, str] | SequenceNotStr[str | dm.NodeId | tuple[str, str]],
+        space: str,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+    ) -> T_DomainModel | T_DomainModelList | None:
+        """Retrieve one or more nodes by id(s).
+
+        Args:
+            external_id: External id or list of external ids of the nodes.
+            space: The space where all the nodes are located.
+            retrieve_connections: Whether to retrieve the connections of the nodes. Defaults to 'skip'.
+
+        Returns:
+            The requested node(s).
+
+        """
+        node_ids, is_multiple = _as_node_ids(external_id, space)
+        view_id = self._api._view_id
+        # The instance cache and the local mirror are shared with the synchronous API.
+        cache = self._api._instance_cache
+        cached = cache.get(view_id, node_ids, retrieve_connections) if cache is not None else {}
+        missing = [node_id for node_id in node_ids if node_id not in cached]
+
+        items: Sequence[DomainModel] = []
+        if not missing:
+            pass
+        elif retrieve_connections == "skip" and self._api._mirror is not None:
+            items = self._api._to_class_list(self._api._mirror.retrieve(view_id, missing), "retrieve")
+        elif retrieve_connections == "skip":
+            items = self._api._to_class_list(await self._retrieve_nodes(missing), "retrieve")
+        else:
+            semaphore = asyncio.Semaphore(RETRIEVE_MAX_WORKERS)
+
+            async def execute(filter_: dm.Filter, limit: int) -> list[QueryResultStep]:
+                async with semaphore:
+                    executor = AsyncQueryExecutor(self._api._build(filter_, limit, retrieve_connections))
+                    return await executor.execute_query(
+                        self._client, remove_not_connected=False, reporter=global_config.query_reporter
+                    )
+
+            chunk_results = await asyncio.gather(
+                *(execute(filter_, limit) for filter_, limit in _create_retrieve_filters(missing))
+            )
+            items = self._api._unpack_retrieved(chunk_results)
+
+        if cache is not None:
+            cache.set(view_id, items, retrieve_connections)
+        if cached:
+            item_by_id = {item.as_id(): item for item in items}
+            item_by_id.update(cached)
+            items = [item_by_id[node_id] for node_id in dict.fromkeys(node_ids) if node_id in item_by_id]
+
+        nodes = self._api._class_list(items)
+        if is_multiple:
+            return nodes
+        elif not nodes:
+            return None
+        else:
+            return nodes[0]
+
+    async def _retrieve_nodes(self, node_ids: list[dm.NodeId]) -> Sequence[dm.Node]:
+        if global_config.raw_read:
+            return await retrieve_raw_async(self._client, node_ids, self._api._view_id)
+        instances = await self._client.data_modeling.instances.retrieve(nodes=node_ids, sources=self._api._view_id)
+        return instances.nodes
+
+    async def search(
+        self,
+        query: str,
+        properties: str | SequenceNotStr[str] | None = None,
+        filter: dm.Filter | None = None,
+        limit: int = DEFAULT_LIMIT_READ,
+        sort_by: str | list[str] | None = None,
+        direction: Literal["ascending", "descending"] = "ascending",
+        sort: InstanceSort | list[InstanceSort] | None = None,
+    ) -> T_DomainModelList:
+        """Search nodes.
+
+        Args:
+            query: The search query.
+            properties: The property to search, if nothing is passed all text fields will be searched.
+            filter: The filter to apply.
+            limit: Maximum number of nodes to return. Defaults to 25.
+            sort_by: The property to sort by.
+            direction: The direction to sort by, either 'ascending' or 'descending'.
+            sort: Advanced sort, this takes precedence over sort_by and direction.
+
+        Returns:
+            Search results of the nodes matching the query.
+
+        """
+        if global_config.raw_read:
+            # There is no asynchronous raw search, thus, the synchronous one is run in a thread.
+            return await asyncio.to_thread(
+                self._api._search, query, properties, filter, limit, sort_by, direction, sort
+            )
+        nodes = await self._client.data_modeling.instances.search(
+            view=self._api._view_id,
+            query=query,
+            instance_type="node",
+            properties=self._api._to_input_properties(properties),
+            filter=filter,
+            limit=limit,
+            sort=self._api._create_sort(sort_by, direction, sort),
+        )
+        return self._api._to_class_list(nodes, "search")
+
+    async def aggregate(
+        self,
+        aggregate: (
+            Aggregations
+            | dm.aggregations.MetricAggregation
+            | SequenceNotStr[Aggregations | dm.aggregations.MetricAggregation]
+        ),
+        group_by: str | SequenceNotStr[str] | None = None,
+        properties: str | SequenceNotStr[str] | None = None,
+        query: str | None = None,
+        search_properties: str | SequenceNotStr[str] | None = None,
+        limit: int = DEFAULT_LIMIT_READ,
+        filter: dm.Filter | None = None,
+    ) -> (
+        dm.aggregations.AggregatedNumberedValue
+        | list[dm.aggregations.AggregatedNumberedValue]
+        | InstanceAggregationResultList
+    ):
+        """Aggregate data across nodes.
+
+        Args:
+            aggregate: The aggregation to perform.
+            group_by: The property to group by when doing the aggregation.
+            properties: The property to perform aggregation on.
+            query: The query to search for in the text field.
+            search_properties: The text field to search in.
+            limit: Maximum number of nodes to return. Defaults to 25.
+            filter: The filter to apply.
+
+        Returns:
+            Aggregation results.
+
+        """
+        return await self._client.data_modeling.instances.aggregate(
+            **self._api._create_aggregate_arguments(
+                aggregate, group_by, properties, query, search_properties, limit, filter
+            )
+        )
+
+    async def iterate(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        filter: dm.Filter | None = None,
+        limit: int | None = None,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+        cursors: dict[str, str | None] | None = None,
+    ) -> AsyncIterator[T_DomainModelList]:
+        """Iterate over nodes.
+
+        Args:
+            chunk_size: The number of nodes to return in each chunk. Defaults to 100.
+            filter: The filter to apply.
+            limit: Maximum number of nodes to return. Defaults to None, which returns all nodes.
+            retrieve_connections: Whether to retrieve the connections of the nodes. Defaults to 'skip'.
+            cursors: The cursors to start the iteration from, see the cursors of the returned chunks.
+
+        Returns:
+            Iteration of the chunks of nodes.
+
+        """
+        executor = AsyncQueryExecutor(self._api._build(filter, limit, retrieve_connections, None, chunk_size))
+        async for batch_results in executor.iterate(
+            self._client,
+            remove_not_connected=False,
+            init_cursors=cursors,
+            reporter=global_config.query_reporter,
+        ):
+            unpacked = QueryUnpacker(batch_results, edges="skip").unpack()
+            yield self._api._class_list(
+                instantiate_classes(self._api._class_type, unpacked, "iterate"), cursors=batch_results._cursors
+            )
+
+    async def _query(
+        self,
+        filter_: dm.Filter | None,
+        limit: int,
+        retrieve_connections: Literal["skip", "identifier", "full"],
+        sort: list[InstanceSort] | None = None,
+        context: Literal["query", "list", "retrieve"] = "query",
+    ) -> T_DomainModelList:
+        executor = AsyncQueryExecutor(self._api._build(filter_, limit, retrieve_connections, sort))
+        item_list: list[T_DomainModel] = []
+        async for results in executor.iterate_resolved(
+            self._client, remove_not_connected=False, reporter=global_config.query_reporter
+        ):
+            unpacked = QueryUnpacker(results, edges="skip").unpack()
+            item_list.extend(instantiate_classes(self._api._class_type, unpacked, context))
+        return self._api._class_list(item_list)
+
+    async def _list_nodes(
+        self, limit: int, filter: dm.Filter | None, sort: list[InstanceSort] | None = None
+    ) -> Sequence[dm.Node]:
+        if global_config.raw_read:
+            # There is no asynchronous raw list, thus, the synchronous one is run in a thread.
+            return await asyncio.to_thread(self._api._list_nodes, limit, filter, sort)
+        return await self._client.data_modeling.instances.list(
+            instance_type="node",
+            sources=self._api._view_id,
+            limit=limit,
+            filter=filter,
+            sort=sort,
+        )
+
+    async def list(
+        self,
+        filter: dm.Filter | None = None,
+        limit: int = DEFAULT_LIMIT_READ,
+        sort_by: str | list[str] | None = None,
+        direction: Literal["ascending", "descending"] = "ascending",
+        sort: InstanceSort | list[InstanceSort] | None = None,
+        retrieve_connections: Literal["skip", "identifier", "full"] = "skip",
+    ) -> T_DomainModelList:
+        """List nodes.
+
+        Args:
+            filter: The filter to apply.
+            limit: Maximum number of nodes to return. Defaults to 25. Set to -1, float("inf") or None to return all.
+            sort_by: The property to sort by.
+            direction: The direction to sort by, either 'ascending' or 'descending'.
+            sort: Advanced sort, this takes precedence over sort_by and direction.
+            retrieve_connections: Whether to retrieve the connections of the nodes. Defaults to 'skip'.
+
+        Returns:
+            The listed nodes.
+
+        """
+        sort_input = self._api._create_sort(sort_by, direction, sort)
+        if retrieve_connections != "skip":
+            return await self._query(filter, limit, retrieve_connections, sort_input, "list")
+        view_id = self._api._view_id
+        # The instance cache and the local mirror are shared with the synchronous API.
+        if self._api._mirror is not None and filter is None and sort_input is None:
+            return self._api._to_class_list(self._api._mirror.list(view_id, limit), "list")
+        items = self._api._to_class_list(await self._list_nodes(limit, filter, sort_input), "list")
+        if self._api._instance_cache is not None:
+            self._api._instance_cache.set(view_id, items, "skip")
+        return items
+
+
 class EdgeAPI:
     def __init__(self, client: CogniteClient):
         self._client = client
@@ -461,10 +1473,17 @@ def __init__(
         self._result_list_cls = result_list_cls
 
     def _query(self) -> T_DomainModelList:
-        executor = self._builder.build()
-        results = executor.execute_query(self._client, remove_not_connected=True)
-        unpacked = QueryUnpacker(results).unpack()
-        item_list = instantiate_classes(self._result_cls, unpacked, "query")
+        executor = self._builder.build(
+            raw=global_config.raw_read,
+            batch_limit_store=global_config.batch_limit_store,
+            target_latency=global_config.target_query_latency,
+        )
+        item_list: list[T_DomainModel] = []
+        for results in executor.iterate_resolved(
+            self._client, remove_not_connected=True, reporter=global_config.query_reporter
+        ):
+            unpacked = QueryUnpacker(results).unpack()
+            item_list.extend(instantiate_classes(self._result_cls, unpacked, "query"))
         return self._result_list_cls(item_list)
 
 
@@ -573,6 +1592,12 @@ def instantiate_classes(cls_: type[T_BaseModel], data: list[dict[str, Any]], con
         raise PygenValidationError(msg, e) from e
 
 
+def instantiate_nodes(cls_: type[T_DomainModel], nodes: Sequence[dm.Node], context: str) -> list[T_DomainModel]:
+    if global_config.validate_retrieve is False:
+        return [cls_._from_raw(node) for node in nodes]
+    return instantiate_classes(cls_, [cls_._raw_args(node) for node in nodes], context)
+
+
 class PygenValidationError(ValueError):
     def __init__(self, message, pydantic_error: ValidationError) -> None:
         super().__init__(message)
@@ -5,3 +5,10 @@
 from omni_sub.data_classes._core.query.filter_classes import *  # noqa
 from omni_sub.data_classes._core.query.select import *  # noqa
 from omni_sub.data_classes._core.query.executor import *  # noqa
+from omni_sub.data_classes._core.query.tuning import *  # noqa
+from omni_sub.data_classes._core.query.reporting import *  # noqa
+from omni_sub.data_classes._core.query.columnar import *  # noqa
+from omni_sub.data_classes._core.query.partitioning import *  # noqa
+from omni_sub.data_classes._core.query.planning import *  # noqa
+from omni_sub.data_classes._core.query.optimizer import *  # noqa
+from omni_sub.data_classes._core.query.raw import *  # noqa
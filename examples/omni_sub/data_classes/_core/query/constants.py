@@ -7,10 +7,24 @@
 # The actual instance query limit is 10_000, but we set it to 5_000 such that is matches the In filter
 # which we use in /search for reverse of list direct relations.
 ACTUAL_INSTANCE_QUERY_LIMIT = 5_000
+# The batch limit of a query is adapted during the execution. A timeout (408) or throttling (429) halves
+# the batch limit, while successful queries increase it in steps of 1/BATCH_LIMIT_INCREASE_STEPS of the
+# maximum batch limit. If a target latency is set, queries slower than it also reduce the batch limit.
+BATCH_LIMIT_INCREASE_STEPS = 10
 # The minimum estimated seconds before print progress on a query
 MINIMUM_ESTIMATED_SECONDS_BEFORE_PRINT_PROGRESS = 30
 PRINT_PROGRESS_PER_N_NODES = 10_000
+# The total count of a view and filter, used to estimate progress, is cached for this long.
+COUNT_CACHE_TTL_SECONDS = 300
+# The number of cached counts, the least recently used are evicted first.
+COUNT_CACHE_SIZE = 1_000
+# The number of compiled select queries kept, the least recently used are evicted first.
+PREPARED_QUERY_CACHE_SIZE = 128
 SEARCH_LIMIT = 1_000
+# The maximum number of concurrent /search calls used to look up reverse direct relations of lists.
+SEARCH_MAX_WORKERS = 4
+# The maximum number of concurrent aggregate calls used to split a view into partitions.
+PARTITION_COUNT_MAX_WORKERS = 8
 AGGREGATION_LIMIT = 1_000
 
 NODE_PROPERTIES = frozenset({"externalId", "space", "version", "lastUpdatedTime", "createdTime", "deletedTime", "type"})
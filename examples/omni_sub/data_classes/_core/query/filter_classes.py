@@ -61,50 +61,58 @@ def sort_descending(self) -> T_QueryCore:
 
 
 class StringFilter(Filtering[T_QueryCore]):
-    def equals(self, value: str) -> T_QueryCore:
+    def equals(self, value: str | dm.filters.ParameterValue) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Equals(self._prop_path, value)
         return self._query
 
-    def prefix(self, prefix: str) -> T_QueryCore:
+    def prefix(self, prefix: str | dm.filters.ParameterValue) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Prefix(self._prop_path, prefix)
         return self._query
 
-    def in_(self, values: list[str]) -> T_QueryCore:
+    def in_(self, values: list[str] | dm.filters.ParameterValue) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.In(self._prop_path, values)
         return self._query
 
 
 class BooleanFilter(Filtering[T_QueryCore]):
-    def equals(self, value: bool) -> T_QueryCore:
+    def equals(self, value: bool | dm.filters.ParameterValue) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Equals(self._prop_path, value)
         return self._query
 
 
 class IntFilter(Filtering[T_QueryCore]):
-    def range(self, gte: int | None, lte: int | None) -> T_QueryCore:
+    def range(
+        self, gte: int | dm.filters.ParameterValue | None, lte: int | dm.filters.ParameterValue | None
+    ) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Range(self._prop_path, gte=gte, lte=lte)
         return self._query
 
 
 class FloatFilter(Filtering[T_QueryCore]):
-    def range(self, gte: float | None, lte: float | None) -> T_QueryCore:
+    def range(
+        self, gte: float | dm.filters.ParameterValue | None, lte: float | dm.filters.ParameterValue | None
+    ) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Range(self._prop_path, gte=gte, lte=lte)
         return self._query
 
 
 class TimestampFilter(Filtering[T_QueryCore]):
-    def range(self, gte: datetime.datetime | None, lte: datetime.datetime | None) -> T_QueryCore:
+    def range(
+        self,
+        gte: datetime.datetime | dm.filters.ParameterValue | None,
+        lte: datetime.datetime | dm.filters.ParameterValue | None,
+    ) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Range(
             self._prop_path,
-            gte=gte.isoformat(timespec="milliseconds") if gte else None,
-            lte=lte.isoformat(timespec="milliseconds") if lte else None,
+            gte=gte.isoformat(timespec="milliseconds") if isinstance(gte, datetime.datetime) else gte,
+            lte=lte.isoformat(timespec="milliseconds") if isinstance(lte, datetime.datetime) else lte,
         )
         return self._query
 
@@ -124,12 +132,16 @@ def latest(self) -> T_QueryCore:
 
 
 class DateFilter(Filtering[T_QueryCore]):
-    def range(self, gte: datetime.date | None, lte: datetime.date | None) -> T_QueryCore:
+    def range(
+        self,
+        gte: datetime.date | dm.filters.ParameterValue | None,
+        lte: datetime.date | dm.filters.ParameterValue | None,
+    ) -> T_QueryCore:
         self._raise_if_filter_set()
         self._filter = dm.filters.Range(
             self._prop_path,
-            gte=gte.isoformat() if gte else None,
-            lte=lte.isoformat() if lte else None,
+            gte=gte.isoformat() if isinstance(gte, datetime.date) else gte,
+            lte=lte.isoformat() if isinstance(lte, datetime.date) else lte,
         )
         return self._query
 
@@ -151,10 +163,19 @@ def latest(self) -> T_QueryCore:
 class DirectRelationFilter(Filtering[T_QueryCore]):
     def equals(self, value: dm.NodeId | tuple[str, str] | dm.DirectRelationReference | Any) -> T_QueryCore:
         self._raise_if_filter_set()
-        self._filter = dm.filters.Equals(self._prop_path, as_instance_dict_id(value))
+        if isinstance(value, dm.filters.ParameterValue):
+            self._filter = dm.filters.Equals(self._prop_path, value)
+        else:
+            self._filter = dm.filters.Equals(self._prop_path, as_instance_dict_id(value))
         return self._query
 
-    def in_(self, values: Sequence[dm.NodeId | tuple[str, str] | dm.DirectRelationReference | Any]) -> T_QueryCore:
+    def in_(
+        self,
+        values: Sequence[dm.NodeId | tuple[str, str] | dm.DirectRelationReference | Any] | dm.filters.ParameterValue,
+    ) -> T_QueryCore:
         self._raise_if_filter_set()
-        self._filter = dm.filters.In(self._prop_path, [as_instance_dict_id(value) for value in values])
+        if isinstance(values, dm.filters.ParameterValue):
+            self._filter = dm.filters.In(self._prop_path, values)
+        else:
+            self._filter = dm.filters.In(self._prop_path, [as_instance_dict_id(value) for value in values])
         return self._query
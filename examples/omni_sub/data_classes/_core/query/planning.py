@@ -0,0 +1,186 @@
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+from cognite.client import CogniteClient
+from cognite.client.data_classes import data_modeling as dm
+
+from omni_sub.data_classes._core.query.constants import IN_FILTER_CHUNK_SIZE, SEARCH_LIMIT
+from omni_sub.data_classes._core.query.executor import QueryExecutor
+from omni_sub.data_classes._core.query.step import QueryBuildStep
+
+
+@dataclass(frozen=True)
+class StepPlan:
+    """The plan of a single step of a query.
+
+    Args:
+        name: The name of the step.
+        from_: The name of the step this step is connected from. None for the root step.
+        view_id: The view of the instances in the step.
+        instance_type: Whether the step retrieves nodes or edges.
+        method: 'query' if the step is retrieved with the query endpoint, 'search' if it is retrieved with
+            chunked /search calls, which is the fallback for reverse direct relations of lists.
+        max_retrieve_limit: The maximum number of instances to retrieve. None if unlimited.
+        batch_limit: The maximum number of instances in each call. For search steps, this is the maximum
+            number of instances for each batch of the parent step.
+        estimated_count: The estimated upper bound of the number of instances. None if it cannot be estimated.
+        estimated_calls: The estimated number of calls needed for this step. For query steps, the calls
+            are shared with the other query steps. None if it cannot be estimated.
+
+    """
+
+    name: str
+    from_: str | None
+    view_id: dm.ViewId | None
+    instance_type: Literal["node", "edge"]
+    method: Literal["query", "search"]
+    max_retrieve_limit: int | None
+    batch_limit: int
+    estimated_count: int | None
+    estimated_calls: int | None
+
+    def dump(self) -> dict[str, Any]:
+        output = asdict(self)
+        output["view_id"] = self.view_id.dump(include_type=False) if self.view_id else None
+        return output
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """The plan of a query, as returned by explain.
+
+    Args:
+        steps: The plan of each step, in the order they are built.
+
+    """
+
+    steps: list[StepPlan]
+
+    @property
+    def query_calls(self) -> int | None:
+        """The estimated number of query calls. All query steps are retrieved by the same calls,
+        thus, this is the maximum of the calls of the query steps."""
+        calls = [step.estimated_calls for step in self.steps if step.method == "query"]
+        if any(call is None for call in calls):
+            return None
+        return max((call for call in calls if call is not None), default=0)
+
+    @property
+    def search_calls(self) -> int | None:
+        """The estimated number of /search calls."""
+        calls = [step.estimated_calls for step in self.steps if step.method == "search"]
+        if any(call is None for call in calls):
+            return None
+        return sum(call for call in calls if call is not None)
+
+    @property
+    def estimated_round_trips(self) -> int | None:
+        """The estimated total number of calls, None if any step cannot be estimated."""
+        if self.query_calls is None or self.search_calls is None:
+            return None
+        return self.query_calls + self.search_calls
+
+    @property
+    def estimated_instances(self) -> int | None:
+        """The estimated upper bound of the number of instances in all steps."""
+        counts = [step.estimated_count for step in self.steps]
+        if any(count is None for count in counts):
+            return None
+        return sum(count for count in counts if count is not None)
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "steps": [step.dump() for step in self.steps],
+            "queryCalls": self.query_calls,
+            "searchCalls": self.search_calls,
+            "estimatedRoundTrips": self.estimated_round_trips,
+            "estimatedInstances": self.estimated_instances,
+        }
+
+    def __str__(self) -> str:
+        lines = [f"{'step':<12}{'from':<12}{'view':<40}{'method':<8}{'limit':>8}{'batch':>8}{'count':>10}{'calls':>8}"]
+        for step in self.steps:
+            view = step.view_id.external_id if step.view_id else f"({step.instance_type}s)"
+            lines.append(
+                f"{step.name:<12}{step.from_ or '':<12}{view:<40}{step.method:<8}"
+                f"{_format(step.max_retrieve_limit):>8}{step.batch_limit:>8}"
+                f"{_format(step.estimated_count):>10}{_format(step.estimated_calls):>8}"
+            )
+        lines.append(
+            f"Estimated round trips: {_format(self.estimated_round_trips)} "
+            f"({_format(self.query_calls)} query, {_format(self.search_calls)} search)"
+        )
+        return "\n".join(lines)
+
+
+def _format(value: int | None) -> str:
+    return "-" if value is None else str(value)
+
+
+def create_query_plan(
+    steps: Sequence[QueryBuildStep],
+    client: CogniteClient | None = None,
+    parameters: Mapping[str, Any] | None = None,
+) -> QueryPlan:
+    """Creates the plan of the query steps.
+
+    Args:
+        steps: The query steps.
+        client: If passed, the number of instances of each node step is estimated with an aggregate call
+            on the view of the step. Otherwise, only the limits are used.
+        parameters: The values of the parameters used in the filters of the steps.
+
+    Returns:
+        The query plan.
+
+    """
+    step_plans: list[StepPlan] = []
+    plan_by_name: dict[str, StepPlan] = {}
+    for step in steps:
+        parent = plan_by_name.get(step.from_) if step.from_ is not None else None
+        estimated_count = _estimate_count(step, parent, client, parameters)
+        if step.is_queryable:
+            method: Literal["query", "search"] = "query"
+            batch_limit = step.max_retrieve_batch_limit
+            estimated_calls = None if estimated_count is None else max(1, math.ceil(estimated_count / batch_limit))
+        else:
+            method = "search"
+            batch_limit = SEARCH_LIMIT if step.is_unlimited else min(step.max_retrieve_limit, SEARCH_LIMIT)
+            parent_count = parent.estimated_count if parent else None
+            estimated_calls = None if parent_count is None else math.ceil(parent_count / IN_FILTER_CHUNK_SIZE)
+            if estimated_count is not None and parent is not None and parent.estimated_calls is not None:
+                # The search results are truncated for each batch of the parent step.
+                estimated_count = min(estimated_count, batch_limit * max(1, parent.estimated_calls))
+        plan = StepPlan(
+            name=step.name,
+            from_=step.from_,
+            view_id=step.view_id,
+            instance_type="edge" if step.edge_expression is not None else "node",
+            method=method,
+            max_retrieve_limit=None if step.is_unlimited else step.max_retrieve_limit,
+            batch_limit=batch_limit,
+            estimated_count=estimated_count,
+            estimated_calls=estimated_calls,
+        )
+        step_plans.append(plan)
+        plan_by_name[step.name] = plan
+    return QueryPlan(step_plans)
+
+
+def _estimate_count(
+    step: QueryBuildStep,
+    parent: StepPlan | None,
+    client: CogniteClient | None,
+    parameters: Mapping[str, Any] | None,
+) -> int | None:
+    count: float | None = None
+    if client is not None and step.node_expression is not None:
+        count = QueryExecutor.count_total(client, step, parameters)
+    if not step.is_unlimited:
+        count = step.max_retrieve_limit if count is None else min(count, step.max_retrieve_limit)
+    if step.is_single_direct_relation and parent is not None and parent.estimated_count is not None:
+        # Each parent points to at most one node.
+        count = parent.estimated_count if count is None else min(count, parent.estimated_count)
+    return None if count is None else int(count)
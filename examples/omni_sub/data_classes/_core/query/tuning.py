@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from omni_sub.data_classes._core.query.step import QueryBuildStep
+
+
+class BatchLimitStore:
+    """Persists the last stable batch limit of query steps across runs.
+
+    The batch limits are stored in a small JSON file, keyed by the view, the selected properties and the shape
+    of the step. This enables a query executor to start from the batch limit that worked in the previous run,
+    instead of rediscovering it through timeouts.
+
+    Args:
+        path: The JSON file to store the batch limits in. Defaults to 'cognite-pygen/batch_limits.json' in
+            the user cache directory.
+
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or self._default_path()
+        self._lock = threading.Lock()
+        self._batch_limits: dict[str, int] | None = None
+        # The batch limits set in this process, these take precedence over the ones in the file when saving.
+        self._updated: dict[str, int] = {}
+
+    @staticmethod
+    def _default_path() -> Path:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return cache_dir / "cognite-pygen" / "batch_limits.json"
+
+    @property
+    def _limits(self) -> dict[str, int]:
+        if self._batch_limits is None:
+            self._batch_limits = self._load()
+        return self._batch_limits
+
+    def _load(self) -> dict[str, int]:
+        try:
+            content = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Missing or corrupt file, we start from scratch.
+            return {}
+        if not isinstance(content, dict):
+            return {}
+        return {key: value for key, value in content.items() if isinstance(value, int) and value > 0}
+
+    def get(self, step: QueryBuildStep) -> int | None:
+        with self._lock:
+            return self._limits.get(self.create_key(step))
+
+    def set(self, step: QueryBuildStep, batch_limit: int) -> None:
+        with self._lock:
+            key = self.create_key(step)
+            self._limits[key] = batch_limit
+            self._updated[key] = batch_limit
+
+    def save(self) -> None:
+        with self._lock:
+            # Other processes may have stored batch limits since this store was loaded, so we merge with the
+            # current content of the file to avoid overwriting their batch limits.
+            self._batch_limits = {**self._load(), **self._updated}
+            content = json.dumps(self._batch_limits, indent=2, sort_keys=True)
+            tmp_path: Path | None = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file and replace to avoid a partially written file
+                # if multiple processes are saving at the same time.
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.path.parent, suffix=".tmp", delete=False
+                ) as file:
+                    tmp_path = Path(file.name)
+                    file.write(content)
+                tmp_path.replace(self.path)
+            except OSError:
+                # The batch limits are only an optimization, failing to store them should not fail the query.
+                if tmp_path is not None:
+                    tmp_path.unlink(missing_ok=True)
+                return
+
+    @staticmethod
+    def create_key(step: QueryBuildStep) -> str:
+        """Creates the key of a step from the view, the selected properties, and the shape of the step."""
+        view = "" if step.view_id is None else f"{step.view_id.space}:{step.view_id.external_id}/{step.view_id.version}"
+        properties = sorted(
+            prop for source in (step.select.sources if step.select else []) for prop in source.properties or []
+        )
+        expression = step.expression
+        shape: list[str] = [
+            "edge" if step.edge_expression else "node",
+            "root" if step.from_ is None else getattr(expression, "direction", None) or "",
+        ]
+        if (through := getattr(expression, "through", None)) is not None:
+            shape.append(through.property)
+        return "|".join([view, ",".join(properties), ":".join(shape)])
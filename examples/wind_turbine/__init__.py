@@ -1,3 +1,3 @@
-from wind_turbine._api_client import WindTurbineClient
+from wind_turbine._api_client import AsyncWindTurbineClient, WindTurbineClient
 
-__all__ = ["WindTurbineClient"]
+__all__ = ["AsyncWindTurbineClient", "WindTurbineClient"]
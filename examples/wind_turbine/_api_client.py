@@ -5,7 +5,7 @@
 from pathlib import Path
 from typing import Any
 
-from cognite.client import ClientConfig, CogniteClient
+from cognite.client import AsyncCogniteClient, ClientConfig, CogniteClient
 from cognite.client import data_modeling as dm
 from cognite.client.credentials import OAuthClientCredentials
 from cognite.client.data_classes import FileMetadataList, SequenceList, TimeSeriesList
@@ -28,7 +28,14 @@
     SolarPanelAPI,
     WindTurbineAPI,
 )
-from wind_turbine._api._core import GraphQLQueryResponse, SequenceNotStr
+from wind_turbine._api._core import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    AsyncNodeReadAPI,
+    GraphQLQueryResponse,
+    InstanceCache,
+    SequenceNotStr,
+)
 from wind_turbine.data_classes._core import DEFAULT_INSTANCE_SPACE, GraphQLList
 
 
@@ -61,6 +68,7 @@ def __init__(self, config_or_client: CogniteClient | ClientConfig):
             client.config.client_name = f"CognitePygen:0.0.0:SDK:{client.config.client_name}"
 
         self._client = client
+        self._instance_cache: InstanceCache | None = None
 
         self.blade = BladeAPI(client)
         self.data_sheet = DataSheetAPI(client)
@@ -110,6 +118,7 @@ def upsert(
             auto_create_end_nodes=True,
             replace=replace,
         )
+        self._invalidate_cache(result.nodes.as_ids())
         time_series = TimeSeriesList([])
         if instances.time_series:
             time_series = self._client.time_series.upsert(instances.time_series, mode="patch")
@@ -175,12 +184,12 @@ def delete(
                 >>> client.delete("my_node_external_id")
         """
         if isinstance(external_id, str):
-            return self._client.data_modeling.instances.delete(nodes=(space, external_id))
+            result = self._client.data_modeling.instances.delete(nodes=(space, external_id))
         elif isinstance(external_id, dm.NodeId):
-            return self._client.data_modeling.instances.delete(nodes=external_id)
+            result = self._client.data_modeling.instances.delete(nodes=external_id)
         elif isinstance(external_id, data_classes.DomainModelWrite):
             resources = self._create_instances(external_id, False)
-            return self._client.data_modeling.instances.delete(
+            result = self._client.data_modeling.instances.delete(
                 nodes=resources.nodes.as_ids(),
                 edges=resources.edges.as_ids(),
             )
@@ -200,11 +209,63 @@ def delete(
                     raise ValueError(
                         f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
                     )
-            return self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
+            result = self._client.data_modeling.instances.delete(nodes=node_ids, edges=edge_ids)
         else:
             raise ValueError(
                 f"Expected str, NodeId, or DomainModelWrite, Sequence of these types. Got {type(external_id)}"
             )
+        self._invalidate_cache(result.nodes)
+        return result
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared by all APIs of the client, and the nodes are invalidated by upsert and delete
+        through this client. Changes made by other clients are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        cache = InstanceCache(maxsize, ttl, ttl_by_view)
+        self._set_instance_cache(cache)
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._set_instance_cache(None)
+
+    def _set_instance_cache(self, cache: InstanceCache | None) -> None:
+        self._instance_cache = cache
+        self.blade._instance_cache = cache
+        self.data_sheet._instance_cache = cache
+        self.gearbox._instance_cache = cache
+        self.generating_unit._instance_cache = cache
+        self.generator._instance_cache = cache
+        self.high_speed_shaft._instance_cache = cache
+        self.main_shaft._instance_cache = cache
+        self.metmast._instance_cache = cache
+        self.nacelle._instance_cache = cache
+        self.power_inverter._instance_cache = cache
+        self.rotor._instance_cache = cache
+        self.sensor_position._instance_cache = cache
+        self.sensor_time_series._instance_cache = cache
+        self.solar_panel._instance_cache = cache
+        self.wind_turbine._instance_cache = cache
+
+    def _invalidate_cache(self, node_ids: Sequence[dm.NodeId]) -> None:
+        if self._instance_cache is not None:
+            self._instance_cache.invalidate(node_ids)
 
     def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
         """Execute a GraphQl query against the WindTurbine data model.
@@ -263,3 +324,94 @@ def _repr_html_(self) -> str:
 &nbsp;&nbsp;&nbsp;&nbsp;.upsert - Create or update any instance.<br />
 &nbsp;&nbsp;&nbsp;&nbsp;.delete - Delete instances.<br />
 """
+
+
+class AsyncWindTurbineClient:
+    """
+    AsyncWindTurbineClient
+
+    The asynchronous version of WindTurbineClient. The requests are awaited using the AsyncCogniteClient,
+    such that many list, retrieve, search, and aggregate calls can run concurrently in a single event loop.
+
+    Generated with:
+        pygen = 0.0.0
+        cognite-sdk = 8.0.5
+        pydantic = 2.12.5
+
+    Data Model:
+        space: sp_pygen_power
+        externalId: WindTurbine
+        version: 1
+    """
+
+    _data_model_id = dm.DataModelId("sp_pygen_power", "WindTurbine", "1")
+
+    def __init__(self, config_or_client: AsyncCogniteClient | CogniteClient | ClientConfig):
+        if isinstance(config_or_client, AsyncCogniteClient):
+            client, cognite_client = config_or_client, config_or_client.get_sync_client()
+        elif isinstance(config_or_client, CogniteClient):
+            client, cognite_client = config_or_client.get_async_client(), config_or_client
+        elif isinstance(config_or_client, ClientConfig):
+            client = AsyncCogniteClient(config_or_client)
+            cognite_client = client.get_sync_client()
+        else:
+            raise ValueError(
+                f"Expected AsyncCogniteClient, CogniteClient or ClientConfig, got {type(config_or_client)}"
+            )
+        # The synchronous client builds the queries and unpacks the results, it does not make any requests.
+        sync_client = WindTurbineClient(cognite_client)
+        self._client = client
+        self._sync_client = sync_client
+
+        self.blade = AsyncNodeReadAPI(sync_client.blade, client)
+        self.data_sheet = AsyncNodeReadAPI(sync_client.data_sheet, client)
+        self.gearbox = AsyncNodeReadAPI(sync_client.gearbox, client)
+        self.generating_unit = AsyncNodeReadAPI(sync_client.generating_unit, client)
+        self.generator = AsyncNodeReadAPI(sync_client.generator, client)
+        self.high_speed_shaft = AsyncNodeReadAPI(sync_client.high_speed_shaft, client)
+        self.main_shaft = AsyncNodeReadAPI(sync_client.main_shaft, client)
+        self.metmast = AsyncNodeReadAPI(sync_client.metmast, client)
+        self.nacelle = AsyncNodeReadAPI(sync_client.nacelle, client)
+        self.power_inverter = AsyncNodeReadAPI(sync_client.power_inverter, client)
+        self.rotor = AsyncNodeReadAPI(sync_client.rotor, client)
+        self.sensor_position = AsyncNodeReadAPI(sync_client.sensor_position, client)
+        self.sensor_time_series = AsyncNodeReadAPI(sync_client.sensor_time_series, client)
+        self.solar_panel = AsyncNodeReadAPI(sync_client.solar_panel, client)
+        self.wind_turbine = AsyncNodeReadAPI(sync_client.wind_turbine, client)
+
+    def enable_cache(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_by_view: dict[dm.ViewId, float] | None = None,
+    ) -> InstanceCache:
+        """Cache the retrieved nodes, such that repeated retrieves do not make a request.
+
+        The cache is shared with the synchronous client used to unpack the results. This client does not
+        write, thus, changes are visible after the time to live.
+
+        Args:
+            maxsize: The maximum number of nodes in the cache, the least recently used are evicted first.
+            ttl: The number of seconds a node is cached.
+            ttl_by_view: The time to live of the nodes of specific views, overriding ttl.
+
+        Returns:
+            The cache, which has the hit and miss statistics.
+
+        """
+        return self._sync_client.enable_cache(maxsize, ttl, ttl_by_view)
+
+    def disable_cache(self) -> None:
+        """Stop caching the retrieved nodes, this is the default."""
+        self._sync_client.disable_cache()
+
+    async def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> GraphQLList:
+        """Execute a GraphQl query against the WindTurbine data model.
+
+        Args:
+            query (str): The GraphQL query to issue.
+            variables (dict[str, Any] | None): An optional dict of variables to pass to the query.
+        """
+        data_model_id = dm.DataModelId("sp_pygen_power", "WindTurbine", "1")
+        result = await self._client.data_modeling.graphql.query(data_model_id, query, variables)
+        return GraphQLQueryResponse(data_model_id).parse(result)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -130,6 +131,12 @@ class Blade(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Blade", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "is_damaged",
+            "name",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -144,6 +151,18 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "is_damaged" in properties:
+            args["is_damaged"] = properties["is_damaged"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> BladeWrite:
         """Convert this read version of blade to the writing version."""
         return BladeWrite.model_validate(as_write_args(self))
@@ -260,7 +279,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorPositionQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _SensorPositionQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.sensor_positions = _SensorPositionQuery(
                 created_types.copy(),
                 self._creation_path,
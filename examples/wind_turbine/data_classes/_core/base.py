@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import json
 import sys
 import warnings
 from abc import ABC, abstractmethod
@@ -8,6 +9,7 @@
 from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import (
+    TYPE_CHECKING,
     Callable,
     cast,
     ClassVar,
@@ -20,6 +22,7 @@
     overload,
     Union,
     SupportsIndex,
+    get_args,
 )
 
 import pandas as pd
@@ -50,13 +53,15 @@
 from wind_turbine.data_classes._core.constants import DEFAULT_INSTANCE_SPACE
 from wind_turbine.data_classes._core.cdf_external import GraphQLExternal
 from wind_turbine.data_classes._core.helpers import as_direct_relation_reference, parse_single_connection
-from wind_turbine.config import global_config
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
+if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore[import-not-found, import-untyped]
+
 
 @dataclass
 class ResourcesWrite:
@@ -224,6 +229,16 @@ def parse_ms(cls, v: Any) -> Any:
             return ms_to_datetime(v)
         return v
 
+    @classmethod
+    def _from_instance(cls, instance: Instance) -> DataRecord:
+        # The timestamps of an instance are always set, thus, validation is not needed.
+        return cls.model_construct(
+            version=instance.version,
+            last_updated_time=ms_to_datetime(instance.last_updated_time),
+            created_time=ms_to_datetime(instance.created_time),
+            deleted_time=None if instance.deleted_time is None else ms_to_datetime(instance.deleted_time),
+        )
+
 
 class DomainModel(DomainModelCore, ABC, extra="allow"):
     data_record: DataRecord
@@ -251,6 +266,34 @@ def _to_dict(cls, instance: Instance) -> dict[str, Any]:
             **unpack_properties(instance.properties),
         )
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        """The arguments created from the properties of the view of the domain model.
+
+        The generated classes overwrite this with a direct mapping from the properties to the fields,
+        only converting the values that need it.
+        """
+        return unpack_view_properties(properties)
+
+    @classmethod
+    def _raw_args(cls, instance: dm.Node) -> dict[str, Any]:
+        """The arguments to create the domain model from the node."""
+        properties = instance.properties.get(cls._view_id)
+        if properties is None:
+            return cls._to_dict(instance)
+        return {
+            "space": instance.space,
+            "external_id": instance.external_id,
+            "data_record": DataRecord._from_instance(instance),
+            "node_type": instance.type,
+            **cls._raw_properties(properties),
+        }
+
+    @classmethod
+    def _from_raw(cls, instance: dm.Node) -> Self:
+        """Creates the domain model from the node without validation."""
+        return cls.model_construct(**cls._raw_args(instance))  # type: ignore[return-value]
+
     @classmethod
     def from_instance(cls, instance: Instance) -> Self:
         return parse_pydantic(cls, cls._to_dict(instance))
@@ -481,6 +524,74 @@ def data_records(self) -> DataRecordList:
     def as_node_ids(self) -> list[dm.NodeId]:
         return [dm.NodeId(space=node.space, external_id=node.external_id) for node in self.data]
 
+    def to_pandas(self, dropna_columns: bool = False, columnar: bool = False) -> pd.DataFrame:
+        """
+        Convert the list of nodes to a pandas.DataFrame.
+
+        Args:
+            dropna_columns: Whether to drop columns that are all NaN.
+            columnar: Whether to read the fields column by column from the nodes, instead of dumping each
+                node. This is faster and uses less memory for large lists. The columns are typed, timestamps
+                and dates are datetime64, integers and booleans are nullable, the node type is a category
+                of the external ID of the type, and the connections are NodeIds. The data record is flattened
+                into the version, last_updated_time, created_time, and deleted_time columns.
+
+        Returns:
+            A pandas.DataFrame with the nodes as rows.
+        """
+        if not columnar:
+            return super().to_pandas(dropna_columns)
+        df = pd.DataFrame(self._to_columns(), copy=False)
+        if dropna_columns:
+            df.dropna(how="all", axis=1, inplace=True)
+        return df
+
+    def to_arrow(self) -> pa.Table:
+        """Convert the list of nodes to a pyarrow.Table with the same columns as `to_pandas(columnar=True)`.
+
+        The connections are structs with space and external_id. Values Arrow cannot represent as one type,
+        for example, JSON objects with different types for the same key, are stored as JSON strings.
+
+        Returns:
+            A pyarrow.Table with the nodes as rows.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow is required for to_arrow. Install it with 'pip install pyarrow'") from e
+        return pa.table({name: _as_arrow_array(pa, column) for name, column in self._to_columns().items()})
+
+    def _to_columns(self) -> dict[str, Any]:
+        nodes = self.data
+        model_fields: dict[str, Any] = dict(self._INSTANCE.model_fields)
+        for cls_ in dict.fromkeys(type(node) for node in nodes):
+            # The list can contain subclasses, for example, the implementations of an interface.
+            model_fields.update(cls_.model_fields)
+        extra_names = dict.fromkeys(name for node in nodes if node.model_extra for name in node.model_extra)
+        property_names = [
+            name
+            for name in [*model_fields, *extra_names]
+            if name not in ("space", "external_id", "node_type", "data_record")
+        ]
+        columns: dict[str, Any] = {
+            "space": _as_typed_column([node.space for node in nodes]),
+            "external_id": _as_typed_column([node.external_id for node in nodes]),
+        }
+        for name in property_names:
+            values = [getattr(node, name, None) for node in nodes]
+            if name in model_fields and _is_connection_annotation(model_fields[name].annotation):
+                values = [_as_node_id(value) for value in values]
+            columns[name] = _as_typed_column(values)
+        node_types = [None if node.node_type is None else node.node_type.external_id for node in nodes]
+        # The categories are given explicitly to keep them as strings when there are no node types.
+        categories = pd.Index(dict.fromkeys(type_ for type_ in node_types if type_ is not None), dtype=object)
+        columns["node_type"] = pd.Categorical(node_types, categories=categories)
+        records = [node.data_record for node in nodes]
+        columns["version"] = _as_typed_column([record.version for record in records])
+        for name in ("last_updated_time", "created_time", "deleted_time"):
+            columns[name] = _as_utc_timestamps([getattr(record, name) for record in records])
+        return columns
+
 
 T_DomainModelList = TypeVar("T_DomainModelList", bound=DomainModelList, covariant=True)
 
@@ -738,25 +849,31 @@ def as_edge_ids(self) -> list[dm.EdgeId]:
 def unpack_properties(properties: Properties) -> Mapping[str, PropertyValue | dm.NodeId]:
     unpacked: dict[str, PropertyValue | dm.NodeId] = {}
     for view_properties in properties.values():
-        for prop_name, prop_value in view_properties.items():
-            if isinstance(prop_value, dict) and "externalId" in prop_value and "space" in prop_value:
-                if prop_value["space"] == DEFAULT_INSTANCE_SPACE:
-                    unpacked[prop_name] = prop_value["externalId"]
-                else:
-                    unpacked[prop_name] = dm.NodeId(space=prop_value["space"], external_id=prop_value["externalId"])
-            elif isinstance(prop_value, list):
-                values: list[Any] = []
-                for value in prop_value:
-                    if isinstance(value, dict) and "externalId" in value and "space" in value:
-                        if value["space"] == DEFAULT_INSTANCE_SPACE:
-                            values.append(value["externalId"])
-                        else:
-                            values.append(dm.NodeId(space=value["space"], external_id=value["externalId"]))
-                    else:
-                        values.append(value)
-                unpacked[prop_name] = values
+        unpacked.update(unpack_view_properties(view_properties))
+    return unpacked
+
+
+def unpack_view_properties(view_properties: Mapping[str, Any]) -> dict[str, PropertyValue | dm.NodeId]:
+    unpacked: dict[str, PropertyValue | dm.NodeId] = {}
+    for prop_name, prop_value in view_properties.items():
+        if isinstance(prop_value, dict) and "externalId" in prop_value and "space" in prop_value:
+            if prop_value["space"] == DEFAULT_INSTANCE_SPACE:
+                unpacked[prop_name] = prop_value["externalId"]
             else:
-                unpacked[prop_name] = prop_value
+                unpacked[prop_name] = dm.NodeId(space=prop_value["space"], external_id=prop_value["externalId"])
+        elif isinstance(prop_value, list):
+            values: list[Any] = []
+            for value in prop_value:
+                if isinstance(value, dict) and "externalId" in value and "space" in value:
+                    if value["space"] == DEFAULT_INSTANCE_SPACE:
+                        values.append(value["externalId"])
+                    else:
+                        values.append(dm.NodeId(space=value["space"], external_id=value["externalId"]))
+                else:
+                    values.append(value)
+            unpacked[prop_name] = values
+        else:
+            unpacked[prop_name] = prop_value
     return unpacked
 
 
@@ -928,7 +1045,85 @@ def as_write_value(value: Any) -> Any:
     return value
 
 
+def _as_typed_column(values: list[Any]) -> Any:
+    # The set of types is faster to check than the values.
+    types = {type(value) for value in values}
+    types.discard(type(None))
+    if types == {bool}:
+        return pd.array(values, dtype="boolean")
+    elif types == {int}:
+        return pd.array(values, dtype="Int64")
+    elif types and types <= {int, float}:
+        return pd.array(values, dtype="Float64")
+    elif types and all(issubclass(type_, datetime.datetime) for type_ in types):
+        return _as_utc_timestamps(values)
+    elif types == {datetime.date}:
+        return pd.to_datetime(values)
+    # Assigning into an empty array avoids pandas turning lists into extra dimensions.
+    column = pd.array([None] * len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _as_utc_timestamps(values: list[datetime.datetime | None]) -> Any:
+    # Converting through epoch milliseconds is faster than letting pandas parse the datetime objects.
+    milliseconds: list[int | None] = []
+    for value in values:
+        if value is None:
+            milliseconds.append(None)
+        elif value.tzinfo is None:
+            # Naive timestamps are in UTC, as with pandas.to_datetime(..., utc=True).
+            milliseconds.append(round(value.replace(tzinfo=datetime.timezone.utc).timestamp() * 1000))
+        else:
+            milliseconds.append(round(value.timestamp() * 1000))
+    return pd.to_datetime(pd.array(milliseconds, dtype="Int64"), unit="ms", utc=True)
+
+
+def _is_connection_annotation(annotation: Any) -> bool:
+    if annotation is dm.NodeId:
+        return True
+    return any(_is_connection_annotation(arg) for arg in get_args(annotation))
+
+
+def _as_node_id(value: Any) -> Any:
+    if isinstance(value, DomainModelCore | dm.NodeId):
+        return dm.NodeId(value.space, value.external_id)
+    elif isinstance(value, str):
+        return dm.NodeId(DEFAULT_INSTANCE_SPACE, value)
+    elif isinstance(value, list):
+        return [_as_node_id(item) for item in value]
+    return value
+
+
+def _as_arrow_array(pa: Any, column: Any) -> Any:
+    if not pd.api.types.is_object_dtype(column.dtype):
+        return pa.array(column)
+    values = [_as_arrow_value(value) for value in column]
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else json.dumps(value, default=str) for value in values])
+
+
+def _as_arrow_value(value: Any) -> Any:
+    if isinstance(value, dm.NodeId | dm.DirectRelationReference):
+        return {"space": value.space, "external_id": value.external_id}
+    elif isinstance(value, BaseModel):
+        return _as_arrow_value(value.model_dump())
+    elif isinstance(value, list):
+        return [_as_arrow_value(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: _as_arrow_value(item) for key, item in value.items()}
+    elif hasattr(value, "dump"):
+        # For example, TimeSeries and FileMetadata from the cognite-sdk.
+        return value.dump(camel_case=False)
+    return value
+
+
 def parse_pydantic(cls: type[T_Core], data: dict[str, Any]) -> T_Core:
+    # Imported here as the config imports the query classes, which depend on this module.
+    from wind_turbine.config import global_config
+
     if global_config.validate_retrieve:
         return cls.model_validate(data)
     else:
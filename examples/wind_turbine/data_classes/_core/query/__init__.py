@@ -5,3 +5,10 @@
 from wind_turbine.data_classes._core.query.filter_classes import *  # noqa
 from wind_turbine.data_classes._core.query.select import *  # noqa
 from wind_turbine.data_classes._core.query.executor import *  # noqa
+from wind_turbine.data_classes._core.query.tuning import *  # noqa
+from wind_turbine.data_classes._core.query.reporting import *  # noqa
+from wind_turbine.data_classes._core.query.columnar import *  # noqa
+from wind_turbine.data_classes._core.query.partitioning import *  # noqa
+from wind_turbine.data_classes._core.query.planning import *  # noqa
+from wind_turbine.data_classes._core.query.optimizer import *  # noqa
+from wind_turbine.data_classes._core.query.raw import *  # noqa
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -31,6 +31,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_timestamp,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -132,6 +134,16 @@ class DataSheet(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "DataSheet", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "description",
+            "directory",
+            "isUploaded",
+            "mimeType",
+            "name",
+            "uploadedTime",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -142,6 +154,26 @@ class DataSheet(DomainModel):
     name: Optional[str] = None
     uploaded_time: Optional[datetime.datetime] = Field(None, alias="uploadedTime")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "directory" in properties:
+            args["directory"] = properties["directory"]
+        if "isUploaded" in properties:
+            args["is_uploaded"] = properties["isUploaded"]
+        if "mimeType" in properties:
+            args["mime_type"] = properties["mimeType"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "uploadedTime" in properties:
+            args["uploaded_time"] = parse_timestamp(properties["uploadedTime"])
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> DataSheetWrite:
         """Convert this read version of data sheet to the writing version."""
         return DataSheetWrite.model_validate(as_write_args(self))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -130,6 +131,13 @@ class Gearbox(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Gearbox", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "displacement_x",
+            "displacement_y",
+            "displacement_z",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -143,6 +151,20 @@ class Gearbox(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "displacement_x" in properties:
+            args["displacement_x"] = parse_single_connection(properties["displacement_x"], "displacement_x")
+        if "displacement_y" in properties:
+            args["displacement_y"] = parse_single_connection(properties["displacement_y"], "displacement_y")
+        if "displacement_z" in properties:
+            args["displacement_z"] = parse_single_connection(properties["displacement_z"], "displacement_z")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> GearboxWrite:
         """Convert this read version of gearbox to the writing version."""
         return GearboxWrite.model_validate(as_write_args(self))
@@ -382,7 +404,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.displacement_x = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -396,7 +421,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "displacement_x"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.displacement_y = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -410,7 +438,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "displacement_y"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.displacement_z = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -424,7 +455,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "displacement_z"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
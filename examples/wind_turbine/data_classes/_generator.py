@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -127,6 +128,12 @@ class Generator(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Generator", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "generator_speed_controller",
+            "generator_speed_controller_reference",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -141,6 +148,22 @@ class Generator(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "generator_speed_controller" in properties:
+            args["generator_speed_controller"] = parse_single_connection(
+                properties["generator_speed_controller"], "generator_speed_controller"
+            )
+        if "generator_speed_controller_reference" in properties:
+            args["generator_speed_controller_reference"] = parse_single_connection(
+                properties["generator_speed_controller_reference"], "generator_speed_controller_reference"
+            )
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> GeneratorWrite:
         """Convert this read version of generator to the writing version."""
         return GeneratorWrite.model_validate(as_write_args(self))
@@ -367,7 +390,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.generator_speed_controller = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -381,7 +407,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "generator_speed_controller"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.generator_speed_controller_reference = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -395,7 +424,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "generator_speed_controller_reference"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -130,6 +131,13 @@ class HighSpeedShaft(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "HighSpeedShaft", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "bending_moment_y",
+            "bending_monent_x",
+            "torque",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -143,6 +151,20 @@ class HighSpeedShaft(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "bending_moment_y" in properties:
+            args["bending_moment_y"] = parse_single_connection(properties["bending_moment_y"], "bending_moment_y")
+        if "bending_monent_x" in properties:
+            args["bending_monent_x"] = parse_single_connection(properties["bending_monent_x"], "bending_monent_x")
+        if "torque" in properties:
+            args["torque"] = parse_single_connection(properties["torque"], "torque")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> HighSpeedShaftWrite:
         """Convert this read version of high speed shaft to the writing version."""
         return HighSpeedShaftWrite.model_validate(as_write_args(self))
@@ -373,7 +395,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.bending_moment_y = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -387,7 +412,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "bending_moment_y"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.bending_monent_x = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -401,7 +429,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "bending_monent_x"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -415,7 +443,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "nacelle"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.torque = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
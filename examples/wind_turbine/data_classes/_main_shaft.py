@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -138,6 +139,15 @@ class MainShaft(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "MainShaft", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "bending_x",
+            "bending_y",
+            "calculated_tilt_moment",
+            "calculated_yaw_moment",
+            "torque",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -155,6 +165,28 @@ class MainShaft(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "bending_x" in properties:
+            args["bending_x"] = parse_single_connection(properties["bending_x"], "bending_x")
+        if "bending_y" in properties:
+            args["bending_y"] = parse_single_connection(properties["bending_y"], "bending_y")
+        if "calculated_tilt_moment" in properties:
+            args["calculated_tilt_moment"] = parse_single_connection(
+                properties["calculated_tilt_moment"], "calculated_tilt_moment"
+            )
+        if "calculated_yaw_moment" in properties:
+            args["calculated_yaw_moment"] = parse_single_connection(
+                properties["calculated_yaw_moment"], "calculated_yaw_moment"
+            )
+        if "torque" in properties:
+            args["torque"] = parse_single_connection(properties["torque"], "torque")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> MainShaftWrite:
         """Convert this read version of main shaft to the writing version."""
         return MainShaftWrite.model_validate(as_write_args(self))
@@ -483,7 +515,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.bending_x = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -497,7 +532,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "bending_x"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.bending_y = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -511,7 +549,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "bending_y"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.calculated_tilt_moment = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -525,7 +566,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "calculated_tilt_moment"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.calculated_yaw_moment = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -539,7 +583,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "calculated_yaw_moment"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -553,7 +597,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "nacelle"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.torque = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
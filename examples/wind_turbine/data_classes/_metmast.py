@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
@@ -11,7 +11,7 @@
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -40,6 +40,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -149,6 +150,14 @@ class Metmast(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Metmast", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "position",
+            "temperature",
+            "tilt_angle",
+            "wind_speed",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -165,6 +174,22 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "position" in properties:
+            args["position"] = properties["position"]
+        if "temperature" in properties:
+            args["temperature"] = properties["temperature"]
+        if "tilt_angle" in properties:
+            args["tilt_angle"] = properties["tilt_angle"]
+        if "wind_speed" in properties:
+            args["wind_speed"] = properties["wind_speed"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> MetmastWrite:
         """Convert this read version of metmast to the writing version."""
         return MetmastWrite.model_validate(as_write_args(self))
@@ -304,7 +329,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _DistanceQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _DistanceQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.wind_turbines = _DistanceQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -199,6 +200,20 @@ class Nacelle(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Nacelle", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "acc_from_back_side_x",
+            "acc_from_back_side_y",
+            "acc_from_back_side_z",
+            "gearbox",
+            "generator",
+            "high_speed_shaft",
+            "main_shaft",
+            "power_inverter",
+            "yaw_direction",
+            "yaw_error",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -232,6 +247,40 @@ class Nacelle(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "acc_from_back_side_x" in properties:
+            args["acc_from_back_side_x"] = parse_single_connection(
+                properties["acc_from_back_side_x"], "acc_from_back_side_x"
+            )
+        if "acc_from_back_side_y" in properties:
+            args["acc_from_back_side_y"] = parse_single_connection(
+                properties["acc_from_back_side_y"], "acc_from_back_side_y"
+            )
+        if "acc_from_back_side_z" in properties:
+            args["acc_from_back_side_z"] = parse_single_connection(
+                properties["acc_from_back_side_z"], "acc_from_back_side_z"
+            )
+        if "gearbox" in properties:
+            args["gearbox"] = parse_single_connection(properties["gearbox"], "gearbox")
+        if "generator" in properties:
+            args["generator"] = parse_single_connection(properties["generator"], "generator")
+        if "high_speed_shaft" in properties:
+            args["high_speed_shaft"] = parse_single_connection(properties["high_speed_shaft"], "high_speed_shaft")
+        if "main_shaft" in properties:
+            args["main_shaft"] = parse_single_connection(properties["main_shaft"], "main_shaft")
+        if "power_inverter" in properties:
+            args["power_inverter"] = parse_single_connection(properties["power_inverter"], "power_inverter")
+        if "yaw_direction" in properties:
+            args["yaw_direction"] = parse_single_connection(properties["yaw_direction"], "yaw_direction")
+        if "yaw_error" in properties:
+            args["yaw_error"] = parse_single_connection(properties["yaw_error"], "yaw_error")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> NacelleWrite:
         """Convert this read version of nacelle to the writing version."""
         return NacelleWrite.model_validate(as_write_args(self))
@@ -761,7 +810,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.acc_from_back_side_y = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -775,7 +827,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "acc_from_back_side_y"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.acc_from_back_side_z = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -789,7 +844,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "acc_from_back_side_z"),
             )
 
-        if _GearboxQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _GearboxQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.gearbox = _GearboxQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -803,7 +858,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "gearbox"),
             )
 
-        if _GeneratorQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _GeneratorQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.generator = _GeneratorQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -817,7 +872,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "generator"),
             )
 
-        if _HighSpeedShaftQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _HighSpeedShaftQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.high_speed_shaft = _HighSpeedShaftQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -831,7 +886,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "high_speed_shaft"),
             )
 
-        if _MainShaftQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _MainShaftQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.main_shaft = _MainShaftQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -845,7 +900,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "main_shaft"),
             )
 
-        if _PowerInverterQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _PowerInverterQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.power_inverter = _PowerInverterQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -859,7 +914,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "power_inverter"),
             )
 
-        if _WindTurbineQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _WindTurbineQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.wind_turbine = _WindTurbineQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -873,7 +928,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "wind_turbine"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.yaw_direction = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -887,7 +945,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "yaw_direction"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.yaw_error = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
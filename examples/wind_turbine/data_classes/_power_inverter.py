@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -130,6 +131,13 @@ class PowerInverter(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "PowerInverter", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "active_power_total",
+            "apparent_power_total",
+            "reactive_power_total",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -143,6 +151,24 @@ class PowerInverter(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "active_power_total" in properties:
+            args["active_power_total"] = parse_single_connection(properties["active_power_total"], "active_power_total")
+        if "apparent_power_total" in properties:
+            args["apparent_power_total"] = parse_single_connection(
+                properties["apparent_power_total"], "apparent_power_total"
+            )
+        if "reactive_power_total" in properties:
+            args["reactive_power_total"] = parse_single_connection(
+                properties["reactive_power_total"], "reactive_power_total"
+            )
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> PowerInverterWrite:
         """Convert this read version of power inverter to the writing version."""
         return PowerInverterWrite.model_validate(as_write_args(self))
@@ -407,7 +433,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.active_power_total = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -421,7 +450,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "active_power_total"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.apparent_power_total = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -435,7 +467,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "apparent_power_total"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -449,7 +481,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "nacelle"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.reactive_power_total = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
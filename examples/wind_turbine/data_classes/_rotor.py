@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -133,6 +134,12 @@ class Rotor(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "Rotor", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "rotor_speed_controller",
+            "rpm_low_speed_shaft",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -145,6 +152,22 @@ class Rotor(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "rotor_speed_controller" in properties:
+            args["rotor_speed_controller"] = parse_single_connection(
+                properties["rotor_speed_controller"], "rotor_speed_controller"
+            )
+        if "rpm_low_speed_shaft" in properties:
+            args["rpm_low_speed_shaft"] = parse_single_connection(
+                properties["rpm_low_speed_shaft"], "rpm_low_speed_shaft"
+            )
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> RotorWrite:
         """Convert this read version of rotor to the writing version."""
         return RotorWrite.model_validate(as_write_args(self))
@@ -363,7 +386,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.rotor_speed_controller = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -377,7 +403,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "rotor_speed_controller"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.rpm_low_speed_shaft = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -391,7 +420,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "rpm_low_speed_shaft"),
             )
 
-        if _WindTurbineQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _WindTurbineQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.wind_turbine = _WindTurbineQuery(
                 created_types.copy(),
                 self._creation_path,
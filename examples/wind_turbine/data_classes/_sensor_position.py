@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -162,6 +163,20 @@ class SensorPosition(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "SensorPosition", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "blade",
+            "edgewise_bend_mom_crosstalk_corrected",
+            "edgewise_bend_mom_offset",
+            "edgewise_bend_mom_offset_crosstalk_corrected",
+            "edgewisewise_bend_mom",
+            "flapwise_bend_mom",
+            "flapwise_bend_mom_crosstalk_corrected",
+            "flapwise_bend_mom_offset",
+            "flapwise_bend_mom_offset_crosstalk_corrected",
+            "position",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -200,6 +215,50 @@ class SensorPosition(DomainModel):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "blade" in properties:
+            args["blade"] = parse_single_connection(properties["blade"], "blade")
+        if "edgewise_bend_mom_crosstalk_corrected" in properties:
+            args["edgewise_bend_mom_crosstalk_corrected"] = parse_single_connection(
+                properties["edgewise_bend_mom_crosstalk_corrected"], "edgewise_bend_mom_crosstalk_corrected"
+            )
+        if "edgewise_bend_mom_offset" in properties:
+            args["edgewise_bend_mom_offset"] = parse_single_connection(
+                properties["edgewise_bend_mom_offset"], "edgewise_bend_mom_offset"
+            )
+        if "edgewise_bend_mom_offset_crosstalk_corrected" in properties:
+            args["edgewise_bend_mom_offset_crosstalk_corrected"] = parse_single_connection(
+                properties["edgewise_bend_mom_offset_crosstalk_corrected"],
+                "edgewise_bend_mom_offset_crosstalk_corrected",
+            )
+        if "edgewisewise_bend_mom" in properties:
+            args["edgewisewise_bend_mom"] = parse_single_connection(
+                properties["edgewisewise_bend_mom"], "edgewisewise_bend_mom"
+            )
+        if "flapwise_bend_mom" in properties:
+            args["flapwise_bend_mom"] = parse_single_connection(properties["flapwise_bend_mom"], "flapwise_bend_mom")
+        if "flapwise_bend_mom_crosstalk_corrected" in properties:
+            args["flapwise_bend_mom_crosstalk_corrected"] = parse_single_connection(
+                properties["flapwise_bend_mom_crosstalk_corrected"], "flapwise_bend_mom_crosstalk_corrected"
+            )
+        if "flapwise_bend_mom_offset" in properties:
+            args["flapwise_bend_mom_offset"] = parse_single_connection(
+                properties["flapwise_bend_mom_offset"], "flapwise_bend_mom_offset"
+            )
+        if "flapwise_bend_mom_offset_crosstalk_corrected" in properties:
+            args["flapwise_bend_mom_offset_crosstalk_corrected"] = parse_single_connection(
+                properties["flapwise_bend_mom_offset_crosstalk_corrected"],
+                "flapwise_bend_mom_offset_crosstalk_corrected",
+            )
+        if "position" in properties:
+            args["position"] = properties["position"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> SensorPositionWrite:
         """Convert this read version of sensor position to the writing version."""
         return SensorPositionWrite.model_validate(as_write_args(self))
@@ -802,7 +861,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _BladeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _BladeQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.blade = _BladeQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -816,7 +875,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "blade"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.edgewise_bend_mom_crosstalk_corrected = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -830,7 +892,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "edgewise_bend_mom_crosstalk_corrected"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.edgewise_bend_mom_offset = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -844,7 +909,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "edgewise_bend_mom_offset"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.edgewise_bend_mom_offset_crosstalk_corrected = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -858,7 +926,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "edgewise_bend_mom_offset_crosstalk_corrected"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.edgewisewise_bend_mom = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -872,7 +943,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "edgewisewise_bend_mom"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.flapwise_bend_mom = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -886,7 +960,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "flapwise_bend_mom"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.flapwise_bend_mom_crosstalk_corrected = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -900,7 +977,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "flapwise_bend_mom_crosstalk_corrected"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.flapwise_bend_mom_offset = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -914,7 +994,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "flapwise_bend_mom_offset"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.flapwise_bend_mom_offset_crosstalk_corrected = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -30,6 +30,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -138,6 +139,18 @@ class SensorTimeSeries(DomainModel):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "SensorTimeSeries", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "aliases",
+            "conceptId",
+            "description",
+            "isStep",
+            "name",
+            "sourceUnit",
+            "standardName",
+            "type",
+        }
+    )
 
     space: str = DEFAULT_INSTANCE_SPACE
     node_type: Union[dm.DirectRelationReference, None] = None
@@ -150,6 +163,30 @@ class SensorTimeSeries(DomainModel):
     standard_name: Optional[str] = Field(None, alias="standardName")
     type_: Literal["numeric", "string"] | str = Field(alias="type")
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "aliases" in properties:
+            args["aliases"] = properties["aliases"]
+        if "conceptId" in properties:
+            args["concept_id"] = properties["conceptId"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "isStep" in properties:
+            args["is_step"] = properties["isStep"]
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "sourceUnit" in properties:
+            args["source_unit"] = properties["sourceUnit"]
+        if "standardName" in properties:
+            args["standard_name"] = properties["standardName"]
+        if "type" in properties:
+            args["type_"] = properties["type"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> SensorTimeSeriesWrite:
         """Convert this read version of sensor time series to the writing version."""
         return SensorTimeSeriesWrite.model_validate(as_write_args(self))
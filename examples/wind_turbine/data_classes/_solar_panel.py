@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -29,6 +29,7 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -139,6 +140,15 @@ class SolarPanel(GeneratingUnit):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "SolarPanel", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "capacity",
+            "description",
+            "efficiency",
+            "name",
+            "orientation",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     efficiency: Union[SensorTimeSeries, str, dm.NodeId, None] = Field(default=None, repr=False)
@@ -149,6 +159,24 @@ class SolarPanel(GeneratingUnit):
     def parse_single(cls, value: Any, info: ValidationInfo) -> Any:
         return parse_single_connection(value, info.field_name)
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "capacity" in properties:
+            args["capacity"] = properties["capacity"]
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "efficiency" in properties:
+            args["efficiency"] = parse_single_connection(properties["efficiency"], "efficiency")
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "orientation" in properties:
+            args["orientation"] = parse_single_connection(properties["orientation"], "orientation")
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> SolarPanelWrite:
         """Convert this read version of solar panel to the writing version."""
         return SolarPanelWrite.model_validate(as_write_args(self))
@@ -361,7 +389,10 @@ def __init__(
             reverse_expression,
         )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.efficiency = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -375,7 +406,10 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "efficiency"),
             )
 
-        if _SensorTimeSeriesQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if (
+            _SensorTimeSeriesQuery not in created_types
+            and len(creation_path) + 1 < config.global_config.max_select_depth
+        ):
             self.orientation = _SensorTimeSeriesQuery(
                 created_types.copy(),
                 self._creation_path,
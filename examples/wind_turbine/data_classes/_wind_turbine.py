@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 
 from cognite.client import data_modeling as dm, CogniteClient
@@ -11,7 +11,7 @@
 from pydantic import Field
 from pydantic import field_validator, model_validator, ValidationInfo
 
-from wind_turbine.config import global_config
+from wind_turbine import config
 from wind_turbine.data_classes._core import (
     DEFAULT_INSTANCE_SPACE,
     DEFAULT_QUERY_LIMIT,
@@ -39,6 +39,8 @@
     is_tuple_id,
     as_instance_dict_id,
     parse_single_connection,
+    parse_connection_list,
+    unpack_view_properties,
     QueryCore,
     NodeQueryCore,
     StringFilter,
@@ -176,6 +178,19 @@ class WindTurbine(GeneratingUnit):
     """
 
     _view_id: ClassVar[dm.ViewId] = dm.ViewId("sp_pygen_power", "WindTurbine", "1")
+    _raw_property_names: ClassVar[frozenset[str]] = frozenset(
+        {
+            "blades",
+            "capacity",
+            "datasheets",
+            "description",
+            "nacelle",
+            "name",
+            "powerCurve",
+            "rotor",
+            "windfarm",
+        }
+    )
 
     node_type: Union[dm.DirectRelationReference, None] = None
     blades: Optional[list[Union[Blade, str, dm.NodeId]]] = Field(default=None, repr=False)
@@ -198,6 +213,32 @@ def parse_list(cls, value: Any, info: ValidationInfo) -> Any:
             return None
         return [parse_single_connection(item, info.field_name) for item in value]
 
+    @classmethod
+    def _raw_properties(cls, properties: Mapping[str, Any]) -> dict[str, Any]:
+        args: dict[str, Any] = {}
+        if "blades" in properties:
+            args["blades"] = parse_connection_list(properties["blades"], "blades")
+        if "capacity" in properties:
+            args["capacity"] = properties["capacity"]
+        if "datasheets" in properties:
+            args["datasheets"] = parse_connection_list(properties["datasheets"], "datasheets")
+        if "description" in properties:
+            args["description"] = properties["description"]
+        if "nacelle" in properties:
+            args["nacelle"] = parse_single_connection(properties["nacelle"], "nacelle")
+        if "name" in properties:
+            args["name"] = properties["name"]
+        if "powerCurve" in properties:
+            args["power_curve"] = properties["powerCurve"]
+        if "rotor" in properties:
+            args["rotor"] = parse_single_connection(properties["rotor"], "rotor")
+        if "windfarm" in properties:
+            args["windfarm"] = properties["windfarm"]
+        if unknown := properties.keys() - cls._raw_property_names:
+            # Properties added to the view after the SDK was generated.
+            args.update(unpack_view_properties({key: properties[key] for key in unknown}))
+        return args
+
     def as_write(self) -> WindTurbineWrite:
         """Convert this read version of wind turbine to the writing version."""
         return WindTurbineWrite.model_validate(as_write_args(self))
@@ -497,7 +538,7 @@ def __init__(
             reverse_expression,
         )
 
-        if _BladeQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _BladeQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.blades = _BladeQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -511,7 +552,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "blades"),
             )
 
-        if _DataSheetQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _DataSheetQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.datasheets = _DataSheetQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -525,7 +566,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "datasheets"),
             )
 
-        if _DistanceQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _DistanceQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.metmast = _DistanceQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -540,7 +581,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "metmast"),
             )
 
-        if _NacelleQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _NacelleQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.nacelle = _NacelleQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -554,7 +595,7 @@ def __init__(
                 connection_property=ViewPropertyId(self._view_id, "nacelle"),
             )
 
-        if _RotorQuery not in created_types and len(creation_path) + 1 < global_config.max_select_depth:
+        if _RotorQuery not in created_types and len(creation_path) + 1 < config.global_config.max_select_depth:
             self.rotor = _RotorQuery(
                 created_types.copy(),
                 self._creation_path,
@@ -1,15 +1,26 @@
 import importlib
+import json
 import sys
+import tracemalloc
 import warnings
+from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
+from types import ModuleType
 from typing import Any
+from unittest.mock import MagicMock
 
+import msgspec
+import pytest
+from cognite.client import ClientConfig
 from cognite.client import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Properties
+from cognite.client.testing import monkeypatch_cognite_client
 from pydantic import BaseModel
 
 from cognite.pygen import generate_sdk
-from tests.constants import CORE_SDK
+from cognite.pygen.config import PygenConfig
+from tests.constants import CORE_SDK, OMNI_SUB_SDK
 
 
 @contextmanager
@@ -304,6 +315,177 @@ def test_generate_sdk_view_with_property_named_query(self, tmp_path: Path) -> No
             assert "query" not in query_property_view.model_fields
 
 
+@pytest.fixture(scope="module")
+def compact_sdk(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ModuleType]:
+    tmp_path = tmp_path_factory.mktemp("compact_sdk")
+    top_level_package = "compact_read_classes_model"
+    generate_sdk(
+        OMNI_SUB_SDK.load_data_model(),
+        top_level_package=top_level_package,
+        output_dir=tmp_path / top_level_package,
+        overwrite=True,
+        client_name="CompactClient",
+        default_instance_space="my_space",
+        config=PygenConfig(compact_read_classes=True),
+    )
+    with append_to_sys_path(str(tmp_path)):
+        yield importlib.import_module(top_level_package)
+
+
+def create_connection_item_a_nodes(count: int) -> dm.NodeList[dm.Node]:
+    view_id = dm.ViewId("sp_pygen_models", "ConnectionItemA", "1")
+    return dm.NodeList[dm.Node](
+        [
+            dm.Node(
+                space="my_space",
+                external_id=f"item_{no}",
+                version=1,
+                last_updated_time=1_700_000_000_000 + no,
+                created_time=1_700_000_000_000,
+                deleted_time=None,
+                type=dm.DirectRelationReference("sp_pygen_models", "ConnectionItemA"),
+                properties=Properties(
+                    {
+                        view_id: {
+                            "name": f"Item {no}",
+                            "selfDirect": {"space": "my_space", "externalId": f"item_{no + 1}"},
+                            # otherDirect is left out to test unset properties.
+                        }
+                    }
+                ),
+            )
+            for no in range(count)
+        ]
+    )
+
+
+class TestCompactReadClasses:
+    def test_list_compact(self, compact_sdk: ModuleType) -> None:
+        data_classes = importlib.import_module(f"{compact_sdk.__name__}.data_classes")
+        nodes = create_connection_item_a_nodes(3)
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.list.return_value = nodes
+            pygen = compact_sdk.CompactClient(mock_client)
+
+            items = pygen.connection_item_a.list_compact(name_prefix="Item", limit=-1)
+            expected = pygen.connection_item_a.list(name_prefix="Item", limit=-1)
+
+        assert isinstance(items, data_classes.ConnectionItemACompactList)
+        assert items.as_node_ids() == nodes.as_ids()
+        first = items[0]
+        assert isinstance(first, data_classes.ConnectionItemACompact)
+        assert first.name == "Item 0"
+        # Connections in the default instance space are returned as external IDs, as in the read classes.
+        assert first.self_direct == expected[0].self_direct == "item_1"
+        assert first.other_direct is None
+        assert first.data_record.last_updated_time == expected[0].data_record.last_updated_time
+        assert not hasattr(first, "__dict__"), "Compact classes should be slotted"
+        assert items.as_read().dump() == expected.dump()
+        assert items.as_write().dump() == expected.as_write().dump()
+
+    def test_compact_read_classes_use_less_memory(self, compact_sdk: ModuleType) -> None:
+        data_classes = importlib.import_module(f"{compact_sdk.__name__}.data_classes")
+        nodes = create_connection_item_a_nodes(2_000)
+
+        def allocated(create: Any) -> int:
+            tracemalloc.start()
+            try:
+                items = [create(node) for node in nodes]
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(items) == len(nodes)
+            return size
+
+        read_size = allocated(data_classes.ConnectionItemA._from_raw)
+        compact_size = allocated(data_classes.ConnectionItemACompact._from_raw)
+
+        assert compact_size < read_size / 2, f"Compact: {compact_size:,} bytes, read: {read_size:,} bytes"
+
+
+@pytest.fixture(scope="module")
+def msgspec_sdk(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ModuleType]:
+    tmp_path = tmp_path_factory.mktemp("msgspec_sdk")
+    top_level_package = "msgspec_read_classes_model"
+    generate_sdk(
+        OMNI_SUB_SDK.load_data_model(),
+        top_level_package=top_level_package,
+        output_dir=tmp_path / top_level_package,
+        overwrite=True,
+        client_name="StructClient",
+        default_instance_space="my_space",
+        config=PygenConfig(msgspec_read_classes=True),
+    )
+    with append_to_sys_path(str(tmp_path)):
+        yield importlib.import_module(top_level_package)
+
+
+class TestMsgspecReadClasses:
+    def test_list_structs(self, msgspec_sdk: ModuleType) -> None:
+        data_classes = importlib.import_module(f"{msgspec_sdk.__name__}.data_classes")
+        nodes = create_connection_item_a_nodes(3)
+        page = {"items": nodes.dump(camel_case=True), "nextCursor": None}
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.post.return_value = MagicMock(content=json.dumps(page).encode("utf-8"))
+            mock_client.data_modeling.instances.list.return_value = nodes
+            pygen = msgspec_sdk.StructClient(mock_client)
+
+            items = pygen.connection_item_a.list_structs(name_prefix="Item", limit=-1)
+            expected = pygen.connection_item_a.list(name_prefix="Item", limit=-1)
+
+        body = mock_client.post.call_args.kwargs["json"]
+        assert body["sources"] == [{"source": {**expected[0]._view_id.dump(camel_case=True), "type": "view"}}]
+        assert body["filter"] == mock_client.data_modeling.instances.list.call_args.kwargs["filter"].dump(
+            camel_case_property=False
+        )
+        assert isinstance(items, data_classes.ConnectionItemAStructList)
+        assert items.as_node_ids() == nodes.as_ids()
+        first = items[0]
+        assert isinstance(first, data_classes.ConnectionItemAStruct)
+        assert first.name == "Item 0"
+        assert first.self_direct == data_classes.DirectRelationStruct(space="my_space", external_id="item_1")
+        assert first.other_direct is None
+        assert first.data_record.last_updated_time == expected[0].data_record.last_updated_time
+        assert first.node_type == expected[0].node_type
+        assert items.as_read().dump() == expected.dump()
+        assert items.as_write().dump() == expected.as_write().dump()
+
+    def test_structs_decode_properties_by_type(self, msgspec_sdk: ModuleType) -> None:
+        data_classes = importlib.import_module(f"{msgspec_sdk.__name__}.data_classes")
+        node = create_connection_item_a_nodes(1)[0].dump(camel_case=True)
+        node["properties"]["sp_pygen_models"]["ConnectionItemA/1"]["name"] = 42
+        page = json.dumps({"items": [node]}).encode("utf-8")
+
+        with pytest.raises(msgspec.ValidationError, match=r"Expected `str \| null`, got `int`"):
+            data_classes.ConnectionItemAStruct._load_page(page)
+
+    def test_sdk_is_importable_without_msgspec(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        top_level_package = "msgspec_missing_model"
+        generate_sdk(
+            OMNI_SUB_SDK.load_data_model(),
+            top_level_package=top_level_package,
+            output_dir=tmp_path / top_level_package,
+            overwrite=True,
+            client_name="StructClient",
+            default_instance_space="my_space",
+            config=PygenConfig(msgspec_read_classes=True),
+        )
+        # Setting the module to None makes the import raise an ImportError.
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        with append_to_sys_path(str(tmp_path)):
+            importlib.import_module(top_level_package)
+            data_classes = importlib.import_module(f"{top_level_package}.data_classes")
+
+        with pytest.raises(ImportError, match=r"cognite-pygen\[msgspec\]"):
+            data_classes.ConnectionItemAStruct._load_page(b'{"items": []}')
+        with pytest.raises(ImportError, match=r"cognite-pygen\[msgspec\]"):
+            data_classes.ConnectionItemAStruct(name="Item 0")
+
+
 _DEFAULT_SPACE_VALUES: dict[str, Any] = dict(
     is_global=False,
     last_updated_time=0,
@@ -0,0 +1,9 @@
+import pytest
+from cognite.client.data_classes import data_modeling as dm
+
+from tests.constants import OMNI_SDK
+
+
+@pytest.fixture(scope="module")
+def omni_nodes() -> dm.NodeList[dm.Node]:
+    return OMNI_SDK.load_read_nodes(OMNI_SDK.data_model_ids[0])
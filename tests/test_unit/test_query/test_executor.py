@@ -0,0 +1,940 @@
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from contextlib import closing
+from pathlib import Path
+from typing import Any, ClassVar, cast
+
+import pytest
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Properties
+from cognite.client.data_classes.data_modeling.query import NodeResultSetExpression, Query, QueryResult
+from cognite.client.exceptions import CogniteAPIError
+from cognite.client.testing import monkeypatch_async_cognite_client, monkeypatch_cognite_client
+
+from cognite.pygen._query import executor as executor_module
+from cognite.pygen._query.builder import QueryBuilder
+from cognite.pygen._query.executor import (
+    AsyncQueryExecutor,
+    CountCache,
+    PaginationStatus,
+    Progress,
+    QueryExecutor,
+    QueryReducingBatchSize,
+    bind_parameters,
+)
+from cognite.pygen._query.partitioning import (
+    PARTITION_BOUNDARIES_CURSOR,
+    PartitionedQueryExecutor,
+    create_external_id_boundaries,
+)
+from cognite.pygen._query.reporting import (
+    BatchLimitChanged,
+    BatchRetrieved,
+    LoggingReporter,
+    QueryEvent,
+    QueryReporter,
+    StatsReporter,
+)
+from cognite.pygen._query.step import QueryBuildStepFactory, QueryResultStepList, ViewPropertyId
+from cognite.pygen._query.tuning import BatchLimitStore
+
+VIEW_ID = dm.ViewId("my_space", "MyView", "v1")
+CHILD_VIEW_ID = dm.ViewId("my_space", "MyChildView", "v1")
+
+
+def create_node(external_id: str, view_id: dm.ViewId = VIEW_ID) -> dm.Node:
+    return dm.Node(
+        space="my_instances",
+        external_id=external_id,
+        version=1,
+        last_updated_time=1,
+        created_time=0,
+        deleted_time=None,
+        type=None,
+        properties=Properties({view_id: {"name": external_id}}),
+    )
+
+
+def create_pages(page_count: int, page_size: int) -> list[QueryResult]:
+    pages: list[QueryResult] = []
+    for page_no in range(page_count):
+        nodes = [create_node(f"node_{page_no}_{no}") for no in range(page_size)]
+        cursor = f"cursor_{page_no}" if page_no < page_count - 1 else None
+        pages.append(QueryResult({"0": dm.NodeListWithCursor(nodes, cursor=cursor)}))
+    return pages
+
+
+def get_node_expression(query: Query, name: str) -> NodeResultSetExpression:
+    expression = query.with_[name]
+    assert isinstance(expression, NodeResultSetExpression)
+    return expression
+
+
+def create_builder(limit: int | None = None, chunk_size: int | None = None) -> QueryBuilder:
+    builder = QueryBuilder()
+    factory = QueryBuildStepFactory(builder.create_name, view_id=VIEW_ID)
+    builder.append(factory.root(limit=limit, max_retrieve_batch_limit=chunk_size))
+    return builder
+
+
+class TestQueryExecutorIterate:
+    def test_prefetch_yields_pages_in_cursor_order(self) -> None:
+        pages = create_pages(page_count=5, page_size=2)
+        used_cursors: list[str | None] = []
+
+        def query_call(query: Query) -> QueryResult:
+            used_cursors.append(query.cursors.get("0"))
+            return pages[len(used_cursors) - 1]
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 10)
+            client.data_modeling.instances.query.side_effect = query_call
+            executor = create_builder(chunk_size=2).build()
+
+            batches = list(executor.iterate(client, prefetch=2))
+
+        assert used_cursors == [None, "cursor_0", "cursor_1", "cursor_2", "cursor_3"]
+        assert [batch._cursors["0"] for batch in batches] == ["cursor_0", "cursor_1", "cursor_2", "cursor_3", None]
+        assert [node.external_id for batch in batches for node in batch[0].results] == [
+            node.external_id for page in pages for node in page["0"]
+        ]
+
+    def test_prefetch_respects_limit(self) -> None:
+        pages = create_pages(page_count=5, page_size=2)
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 10)
+            client.data_modeling.instances.query.side_effect = pages
+            executor = create_builder(limit=4, chunk_size=2).build()
+
+            batches = list(executor.iterate(client, prefetch=3))
+
+        assert len(batches) == 2
+        assert client.data_modeling.instances.query.call_count == 2
+
+    def test_prefetch_stops_fetching_when_consumer_stops(self) -> None:
+        pages = create_pages(page_count=10, page_size=2)
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 20)
+            client.data_modeling.instances.query.side_effect = pages
+            executor = create_builder(chunk_size=2).build()
+
+            iterator = cast(Generator[QueryResultStepList, None, None], executor.iterate(client, prefetch=1))
+            with closing(iterator):
+                first = next(iterator)
+
+        assert first._cursors["0"] == "cursor_0"
+        # The first page, plus at most one prefetched page and one page in flight when closing.
+        assert client.data_modeling.instances.query.call_count <= 3
+
+    @pytest.mark.parametrize("prefetch", [1, 2])
+    def test_prefetch_fetches_exact_number_of_batches_ahead(self, prefetch: int) -> None:
+        pages = create_pages(page_count=10, page_size=2)
+        fetched = threading.Semaphore(0)
+
+        def query(query: Query) -> QueryResult:
+            fetched.release()
+            return pages[client.data_modeling.instances.query.call_count - 1]
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 20)
+            client.data_modeling.instances.query.side_effect = query
+            executor = create_builder(chunk_size=2).build()
+
+            iterator = cast(Generator[QueryResultStepList, None, None], executor.iterate(client, prefetch=prefetch))
+            with closing(iterator):
+                next(iterator)
+                # Waits for the held and the prefetched batches, and gives the worker time to fetch more.
+                for _ in range(1 + prefetch):
+                    assert fetched.acquire(timeout=5)
+                assert not fetched.acquire(timeout=0.2)
+                paused_calls = client.data_modeling.instances.query.call_count
+
+        # The batch held by the caller, plus the batches fetched ahead.
+        assert paused_calls == 1 + prefetch
+
+
+def create_reverse_list_builder(max_retrieve_limit: int = -1, child_filter: dm.Filter | None = None) -> QueryBuilder:
+    builder = QueryBuilder()
+    factory = QueryBuildStepFactory(builder.create_name, view_id=VIEW_ID)
+    builder.append(factory.root())
+    builder.extend(
+        factory.from_reverse_relation(
+            CHILD_VIEW_ID,
+            dm.PropertyId(CHILD_VIEW_ID, "parents"),
+            "reverse-list",
+            ViewPropertyId(VIEW_ID, "children"),
+            max_retrieve_limit=max_retrieve_limit,
+        )
+    )
+    builder[-1].raw_filter = child_filter
+    return builder
+
+
+NAME_IS_PARAMETER = dm.filters.Equals(CHILD_VIEW_ID.as_property_ref("name"), dm.filters.ParameterValue("name"))
+
+
+class TestFetchReverseDirectRelationOfLists:
+    @staticmethod
+    def search_call(**kwargs: Any) -> dm.NodeList[dm.Node]:
+        # Every parent has one child that only points to it, and all parents share the same child.
+        parent_ids = kwargs["filter"].dump()["in"]["values"]
+        children = [create_node(f"child_of_{parent['externalId']}", CHILD_VIEW_ID) for parent in parent_ids]
+        children.append(create_node("shared_child", CHILD_VIEW_ID))
+        return dm.NodeList[dm.Node](children[: kwargs["limit"]])
+
+    def test_search_chunks_are_merged_in_order(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(250)]
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = self.search_call
+            executor = create_reverse_list_builder().build(max_search_workers=3)
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            executor._fetch_reverse_direct_relation_of_lists(client, executor._to_search, batch)
+
+        assert client.data_modeling.instances.search.call_count == 3
+        expected = [f"child_of_parent_{no:03d}" for no in range(100)] + ["shared_child"]
+        expected += [f"child_of_parent_{no:03d}" for no in range(100, 250)]
+        assert [node.external_id for node in batch["0_1"]] == expected
+
+    def test_search_stops_when_limit_is_reached(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(1_000)]
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = self.search_call
+            executor = create_reverse_list_builder(max_retrieve_limit=150).build(max_search_workers=2)
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            executor._fetch_reverse_direct_relation_of_lists(client, executor._to_search, batch)
+
+        assert len(batch["0_1"]) == 150
+        assert len({node.external_id for node in batch["0_1"]}) == 150
+        # Two chunks are enough to reach the limit, a third can already be in flight.
+        assert client.data_modeling.instances.search.call_count <= 3
+
+    def test_search_without_threading_support(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(executor_module, "IS_THREADING_SUPPORTED", False)
+        parents = [create_node(f"parent_{no:03d}") for no in range(250)]
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = self.search_call
+            executor = create_reverse_list_builder().build(max_search_workers=3)
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            executor._fetch_reverse_direct_relation_of_lists(client, executor._to_search, batch)
+
+        assert client.data_modeling.instances.search.call_count == 3
+        assert len(batch["0_1"]) == 251
+
+    def test_search_filter_has_parameter_values(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(2)]
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.search.return_value = dm.NodeList[dm.Node]([])
+            executor = create_reverse_list_builder(child_filter=NAME_IS_PARAMETER).build(parameters={"name": "child"})
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            executor._fetch_reverse_direct_relation_of_lists(client, executor._to_search, batch)
+
+        search_filter = client.data_modeling.instances.search.call_args.kwargs["filter"].dump()
+        assert search_filter["and"][1] == dm.filters.Equals(CHILD_VIEW_ID.as_property_ref("name"), "child").dump()
+
+
+class TestBindParameters:
+    def test_parameters_are_replaced_with_values(self) -> None:
+        filter_ = dm.filters.And(NAME_IS_PARAMETER, dm.filters.In(["node", "externalId"], ["a", "b"]))
+
+        bound = bind_parameters(filter_, {"name": "child"})
+
+        assert bound is not None
+        assert (
+            bound.dump()
+            == dm.filters.And(
+                dm.filters.Equals(CHILD_VIEW_ID.as_property_ref("name"), "child"),
+                dm.filters.In(["node", "externalId"], ["a", "b"]),
+            ).dump()
+        )
+
+    def test_filter_without_parameters_is_returned_as_is(self) -> None:
+        filter_ = dm.filters.Equals(["node", "space"], "my_space")
+
+        assert bind_parameters(filter_, {"name": "child"}) is filter_
+
+    def test_missing_parameter_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="Missing value for the parameter 'name'"):
+            bind_parameters(NAME_IS_PARAMETER, {})
+
+
+class TestAdaptiveBatchLimit:
+    def test_timeout_halves_and_success_increases_batch_limit(self) -> None:
+        pages = create_pages(page_count=3, page_size=2)
+        limits: list[int] = []
+
+        def query_call(query: Query) -> QueryResult:
+            limits.append(get_node_expression(query, "0").limit or 0)
+            if len(limits) == 1:
+                raise CogniteAPIError("Request timed out", code=408)
+            return pages[len(limits) - 2]
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 6)
+            client.data_modeling.instances.query.side_effect = query_call
+            executor = create_builder(chunk_size=1_000).build()
+
+            with pytest.warns(QueryReducingBatchSize):
+                list(executor.iterate(client))
+
+        assert limits == [1_000, 500, 600, 700]
+        assert executor.batch_limits == {"0": 800}
+
+    def test_slow_query_reduces_batch_limit_towards_target_latency(self) -> None:
+        executor = create_builder(chunk_size=1_000).build(target_latency=10.0)
+
+        executor._adapt_batch_limits(last_execution_time=12.5)
+        assert executor.batch_limits == {"0": 800}
+
+        executor._adapt_batch_limits(last_execution_time=100.0)
+        assert executor.batch_limits == {"0": 400}
+
+        executor._adapt_batch_limits(last_execution_time=1.0)
+        assert executor.batch_limits == {"0": 500}
+
+    def test_slow_query_keeps_batch_limit_without_target_latency(self) -> None:
+        executor = create_builder(chunk_size=1_000).build()
+        executor._reduce_max_batch_limit()
+
+        executor._adapt_batch_limits(last_execution_time=100.0)
+
+        assert executor.batch_limits == {"0": 600}
+
+    def test_batch_limit_never_exceeds_max_batch_limit(self) -> None:
+        status = PaginationStatus(
+            is_unlimited=True, max_retrieve_limit=-1, is_queryable=True, max_retrieve_batch_limit=10
+        )
+
+        for _ in range(5):
+            status.increase_batch_limit()
+
+        assert status.max_retrieve_batch_limit == 10
+
+
+class TestBatchLimitStore:
+    def test_executor_starts_from_stored_batch_limit(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "batch_limits.json"
+        pages = create_pages(page_count=2, page_size=2)
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 4)
+            client.data_modeling.instances.query.side_effect = [CogniteAPIError("Timeout", code=408), *pages]
+            executor = create_builder(chunk_size=1_000).build(
+                target_latency=None, batch_limit_store=BatchLimitStore(store_path)
+            )
+            with pytest.warns(QueryReducingBatchSize):
+                list(executor.iterate(client))
+
+        # The stable batch limit is the one used in the last successful query.
+        assert list(BatchLimitStore(store_path)._limits.values()) == [600]
+
+        next_executor = create_builder(chunk_size=1_000).build(batch_limit_store=BatchLimitStore(store_path))
+        assert next_executor.batch_limits == {"0": 600}
+
+    def test_stored_batch_limit_does_not_exceed_step_limit(self, tmp_path: Path) -> None:
+        store = BatchLimitStore(tmp_path / "batch_limits.json")
+        builder = create_builder(chunk_size=100)
+        store.set(builder[0], 500)
+
+        executor = builder.build(batch_limit_store=store)
+
+        assert executor.batch_limits == {"0": 100}
+
+    def test_key_depends_on_selected_properties(self) -> None:
+        first = QueryBuildStepFactory(lambda _: "0", view_id=VIEW_ID).root()
+        second = QueryBuildStepFactory(lambda _: "0", view_id=VIEW_ID).root()
+        second.select = dm.query.Select([dm.query.SourceSelector(VIEW_ID, ["name"])])
+
+        assert BatchLimitStore.create_key(first) != BatchLimitStore.create_key(second)
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "batch_limits.json"
+        store_path.write_text("not json")
+
+        assert BatchLimitStore(store_path).get(create_builder()[0]) is None
+
+    def test_save_keeps_batch_limits_saved_by_other_stores(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "batch_limits.json"
+        first, second = BatchLimitStore(store_path), BatchLimitStore(store_path)
+        first_step = create_builder()[0]
+        second_step = QueryBuildStepFactory(lambda _: "0", view_id=CHILD_VIEW_ID).root()
+        # Both stores load the (empty) file before either of them saves.
+        assert first.get(first_step) is None and second.get(second_step) is None
+
+        first.set(first_step, 100)
+        first.save()
+        second.set(second_step, 200)
+        second.save()
+
+        reloaded = BatchLimitStore(store_path)
+        assert reloaded.get(first_step) == 100
+        assert reloaded.get(second_step) == 200
+
+    def test_temporary_file_is_removed_when_save_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        store = BatchLimitStore(tmp_path / "batch_limits.json")
+        store.set(create_builder()[0], 100)
+
+        def fail_replace(self: Path, target: Path) -> Path:
+            raise OSError("Disk full")
+
+        monkeypatch.setattr(Path, "replace", fail_replace)
+        store.save()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCountTotal:
+    @pytest.fixture(autouse=True)
+    def empty_count_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(QueryExecutor, "_count_cache", CountCache(ttl=60))
+
+    def test_count_is_skipped_for_single_batch(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.query.return_value = create_pages(page_count=1, page_size=2)[0]
+            executor = create_builder(limit=25).build()
+
+            list(executor.iterate(client))
+
+        client.data_modeling.instances.aggregate.assert_not_called()
+
+    def test_count_is_cached_across_executions(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 4)
+            totals: list[float | None] = []
+            for _ in range(3):
+                executor = create_builder(chunk_size=2).build()
+                total = executor._start_count_total(client, executor._steps[0])
+                totals.append(total.result() if isinstance(total, Future) else total)
+
+        assert totals == [4, 4, 4]
+        assert client.data_modeling.instances.aggregate.call_count == 1
+
+    def test_count_filter_has_parameter_values(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 4)
+            totals: list[float | None] = []
+            for name in ["first", "second"]:
+                builder = create_reverse_list_builder(child_filter=NAME_IS_PARAMETER)
+                executor = builder.build(parameters={"name": name})
+                total = executor._start_count_total(client, executor._steps[1])
+                totals.append(total.result() if isinstance(total, Future) else total)
+
+        # Each value of the parameter is counted separately.
+        assert totals == [4, 4]
+        filters = [call.kwargs["filter"].dump() for call in client.data_modeling.instances.aggregate.call_args_list]
+        assert [filter_["equals"]["value"] for filter_ in filters] == ["first", "second"]
+
+    def test_expired_count_is_not_used(self) -> None:
+        cache = CountCache(ttl=0)
+        key = CountCache.create_key("my_project", VIEW_ID, dm.filters.Equals(["node", "space"], "my_space"))
+        cache.set(key, 42)
+
+        assert cache.get(key) is None
+
+    def test_least_recently_used_count_is_evicted(self) -> None:
+        cache = CountCache(ttl=60, maxsize=2)
+        first, second, third = (("my_project", VIEW_ID, str(no)) for no in range(3))
+        cache.set(first, 1)
+        cache.set(second, 2)
+        cache.get(first)
+        cache.set(third, 3)
+
+        assert (cache.get(first), cache.get(second), cache.get(third)) == (1, None, 3)
+
+
+class TestQueryReporter:
+    def test_stats_reporter_aggregates_execution(self) -> None:
+        pages = create_pages(page_count=3, page_size=2)
+        stats = StatsReporter()
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 6)
+            client.data_modeling.instances.query.side_effect = [CogniteAPIError("Throttled", code=429), *pages]
+            executor = create_builder(chunk_size=1_000).build()
+
+            with pytest.warns(QueryReducingBatchSize):
+                executor.execute_query(client, reporter=stats)
+
+        assert stats.batch_count == 3
+        assert stats.root_count == stats.instance_count == 6
+        assert stats.retry_count == 1
+        assert [(change.reason, change.new_limit) for change in stats.batch_limit_changes] == [
+            ("throttled", 500),
+            ("fast", 600),
+            ("fast", 700),
+            ("fast", 800),
+        ]
+
+    def test_search_is_reported(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(250)]
+        stats = StatsReporter()
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = TestFetchReverseDirectRelationOfLists.search_call
+            executor = create_reverse_list_builder().build()
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, None)})
+
+            executor._fetch_reverse_direct_relation_of_lists(client, executor._to_search, batch, stats)
+
+        assert stats.search_call_count == 3
+        assert list(stats.search_time_by_step) == ["0_1"]
+
+    def test_logging_reporter_logs_events_as_json(self, caplog: pytest.LogCaptureFixture) -> None:
+        reporter = LoggingReporter()
+        event = BatchLimitChanged("0", 1_000, 500, "timeout")
+
+        with caplog.at_level(logging.INFO, logger="cognite.pygen.query"):
+            reporter.on_event(event)
+
+        assert json.loads(caplog.records[0].getMessage()) == {
+            "event": "BatchLimitChanged",
+            "step_name": "0",
+            "old_limit": 1_000,
+            "new_limit": 500,
+            "reason": "timeout",
+        }
+        assert caplog.records[0].__dict__["pygen_event"] == event.dump()
+
+    def test_reporter_must_implement_on_event(self) -> None:
+        class IncompleteReporter(QueryReporter):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteReporter()  # type: ignore[abstract]
+
+    def test_custom_reporter_replaces_progress_printing(self, capsys: pytest.CaptureFixture) -> None:
+        events: list[QueryEvent] = []
+
+        class ListReporter(QueryReporter):
+            def on_event(self, event: QueryEvent) -> None:
+                events.append(event)
+
+        progress = Progress()
+        progress.on_event(BatchRetrieved(1, 10, {"0": 10}, 100.0, 0.0, 10, 1_000_000, {"0": 10}, is_finished=False))
+        assert "Large query detected" in capsys.readouterr().out
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = create_pages(page_count=2, page_size=2)
+            executor = create_builder(limit=4, chunk_size=2).build()
+            executor.execute_query(client, reporter=ListReporter())
+
+        assert [type(event) for event in events if isinstance(event, BatchRetrieved)] == [BatchRetrieved] * 2
+        assert capsys.readouterr().out == ""
+
+
+class TestIterateResolved:
+    @staticmethod
+    def create_builder() -> QueryBuilder:
+        builder = QueryBuilder()
+        factory = QueryBuildStepFactory(builder.create_name, view_id=VIEW_ID)
+        builder.append(factory.root(max_retrieve_batch_limit=2))
+        builder.extend(
+            factory.from_reverse_relation(
+                CHILD_VIEW_ID, dm.PropertyId(CHILD_VIEW_ID, "parent"), None, ViewPropertyId(VIEW_ID, "children")
+            )
+        )
+        return builder
+
+    @staticmethod
+    def create_batch(
+        parents: list[str], children: list[str], parent_cursor: str | None, child_cursor: str | None
+    ) -> QueryResult:
+        return QueryResult(
+            {
+                "0": dm.NodeListWithCursor([create_node(parent) for parent in parents], cursor=parent_cursor),
+                "0_1": dm.NodeListWithCursor(
+                    [create_node(child, CHILD_VIEW_ID) for child in children], cursor=child_cursor
+                ),
+            }
+        )
+
+    def test_groups_batches_until_connections_are_resolved(self) -> None:
+        batches = [
+            # The children of the first parents span two batches.
+            self.create_batch(["p1", "p2"], ["c1"], "parent_cursor_1", "child_cursor_1"),
+            self.create_batch(["p3", "p4"], ["c2"], "parent_cursor_2", None),
+            self.create_batch(["p5"], ["c5"], None, None),
+        ]
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = batches
+            executor = self.create_builder().build()
+
+            groups = [
+                {step.name: [instance.external_id for instance in step.results] for step in group}
+                for group in executor.iterate_resolved(client)
+            ]
+
+        assert groups == [
+            {"0": ["p1", "p2", "p3", "p4"], "0_1": ["c1", "c2"]},
+            {"0": ["p5"], "0_1": ["c5"]},
+        ]
+
+
+class TestQueryBuilderBuild:
+    def test_execution_does_not_modify_step_expressions(self) -> None:
+        builder = create_builder(limit=4, chunk_size=2)
+        expression = builder[0].expression
+        limit_before = expression.limit
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 4)
+            client.data_modeling.instances.query.side_effect = create_pages(page_count=2, page_size=2)
+            executor = builder.build()
+            list(executor.iterate(client))
+
+        copied = get_node_expression(executor._query, "0")
+        assert copied is not expression
+        assert copied.limit != limit_before
+        assert expression.limit == limit_before
+        # The filter is shared, not copied.
+        assert copied.filter is expression.filter
+
+    def test_reverse_list_parent_is_selected_without_properties(self) -> None:
+        builder = create_reverse_list_builder()
+        builder[0].select = None
+
+        query, search, temporary_select = builder._build()
+
+        assert [step.name for step in search] == [builder[1].name]
+        assert temporary_select == {builder[0].name}
+        assert query.select[builder[0].name].dump() == {}
+
+    def test_reverse_list_parent_reuses_existing_select(self) -> None:
+        builder = create_reverse_list_builder()
+
+        query, _, temporary_select = builder._build()
+
+        assert temporary_select == set()
+        assert query.select[builder[0].name] is builder[0].select
+
+
+class TestExplain:
+    def test_explain_without_client_uses_limits(self) -> None:
+        plan = create_builder(limit=25, chunk_size=10).explain()
+
+        assert len(plan.steps) == 1
+        step = plan.steps[0]
+        assert (step.method, step.max_retrieve_limit, step.batch_limit) == ("query", 25, 10)
+        assert (step.estimated_count, step.estimated_calls) == (25, 3)
+        assert plan.estimated_round_trips == 3
+
+    def test_explain_reverse_list_with_counts(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 250)
+
+            plan = create_reverse_list_builder().explain(client)
+
+        root, children = plan.steps
+        assert (root.method, root.estimated_count, root.estimated_calls) == ("query", 250, 1)
+        assert (children.method, children.from_, children.view_id) == ("search", root.name, CHILD_VIEW_ID)
+        # The 250 parents are searched in chunks of 100.
+        assert children.estimated_calls == 3
+        assert (plan.query_calls, plan.search_calls, plan.estimated_round_trips) == (1, 3, 4)
+        assert plan.dump()["steps"][1]["method"] == "search"
+        assert "Estimated round trips: 4" in str(plan)
+        client.data_modeling.instances.query.assert_not_called()
+
+    def test_explain_unknown_count(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = CogniteAPIError("Unavailable", 503)
+
+            plan = create_reverse_list_builder().explain(client)
+
+        assert plan.steps[0].estimated_count is None
+        assert plan.estimated_round_trips is None
+
+    def test_explain_with_parameters(self) -> None:
+        def aggregate_call(view_id: dm.ViewId, aggregate: Any, filter: dm.Filter | None) -> dm.aggregations.CountValue:
+            return dm.aggregations.CountValue("externalId", 250 if view_id == VIEW_ID else 40)
+
+        builder = create_reverse_list_builder(child_filter=NAME_IS_PARAMETER)
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = aggregate_call
+
+            with_values = builder.explain(client, parameters={"name": "child"})
+            without_values = builder.explain(client)
+
+        assert with_values.steps[1].estimated_count == 40
+        # Without the value of the parameter, the step is not counted and the count of the parent is used.
+        assert without_values.steps[1].estimated_count == 250
+        filters = [call.kwargs["filter"] for call in client.data_modeling.instances.aggregate.call_args_list]
+        child_filters = [filter_.dump() for filter_ in filters if filter_ is not None]
+        assert child_filters == [dm.filters.Equals(CHILD_VIEW_ID.as_property_ref("name"), "child").dump()]
+
+
+def find_filter(dumped: Any, name: str) -> dict[str, Any] | None:
+    if isinstance(dumped, dict):
+        if name in dumped:
+            return dumped[name]
+        dumped = list(dumped.values())
+    if isinstance(dumped, list):
+        return next((found for item in dumped if (found := find_filter(item, name)) is not None), None)
+    return None
+
+
+def filter_external_ids(
+    external_ids: list[str], filter_: dm.Filter | None, collate: Callable[[str], str] = str
+) -> list[str]:
+    # The collate function gives the order the server compares the external IDs in range filters.
+    dumped = filter_.dump() if filter_ is not None else {}
+    if (prefix := find_filter(dumped, "prefix")) is not None:
+        external_ids = [external_id for external_id in external_ids if external_id.startswith(prefix["value"])]
+    if (range_ := find_filter(dumped, "range")) is not None:
+        gte, lt = collate(range_.get("gte", "")), collate(range_["lt"]) if "lt" in range_ else None
+        external_ids = [
+            external_id
+            for external_id in external_ids
+            if gte <= collate(external_id) and (lt is None or collate(external_id) < lt)
+        ]
+    return external_ids
+
+
+class TestPartitionedQueryExecutor:
+    external_ids: ClassVar[list[str]] = ["a1", "a2", "b1", "b2", "c1", "c2"]
+
+    @pytest.fixture(autouse=True)
+    def empty_count_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(QueryExecutor, "_count_cache", CountCache(ttl=60))
+
+    def query_call(self, query: Query) -> QueryResult:
+        # Returns one node per page of the external IDs in the partition of the query.
+        external_ids = filter_external_ids(self.external_ids, get_node_expression(query, "0").filter)
+        offset = int(query.cursors.get("0") or 0)
+        nodes = [create_node(external_id) for external_id in external_ids[offset : offset + 1]]
+        cursor = str(offset + 1) if offset + 1 < len(external_ids) else None
+        return QueryResult({"0": dm.NodeListWithCursor(nodes, cursor=cursor)})
+
+    @staticmethod
+    def build(partition_filter: dm.Filter | None) -> QueryExecutor:
+        builder = QueryBuilder()
+        factory = QueryBuildStepFactory(builder.create_name, view_id=VIEW_ID)
+        builder.append(factory.root(filter=partition_filter, max_retrieve_batch_limit=1))
+        return builder.build()
+
+    def test_boundaries_split_nodes_evenly(self) -> None:
+        external_ids = [f"a{no}" for no in range(10)] + ["b1", "b2", "c1", "c2", "d1", "d2"]
+
+        def count(view_id: dm.ViewId, aggregate: Any, instance_type: str, filter: dm.Filter | None) -> Any:
+            return dm.aggregations.CountValue("externalId", len(filter_external_ids(external_ids, filter)))
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = count
+            boundaries = create_external_id_boundaries(client, VIEW_ID, None, partitions=4)
+
+        # The 'a' prefix has more nodes than a partition, and is split by the second character.
+        assert boundaries == ["a4", "a8", "c"]
+
+    def test_partitions_follow_server_order(self) -> None:
+        external_ids = ["alpha", "Beta", "beta", "Charlie", "delta", "Echo", "Ärlig", "Øst", "éclair", "Zulu", "zeta"]
+        external_ids += ["_x", "42", "Γάμμα"]
+
+        def count(view_id: dm.ViewId, aggregate: Any, instance_type: str, filter: dm.Filter | None) -> Any:
+            # The server sorts the external IDs ignoring case, while Python sorts the uppercase letters first.
+            matches = filter_external_ids(external_ids, filter, str.casefold)
+            return dm.aggregations.CountValue("externalId", len(matches))
+
+        def query_call(query: Query) -> QueryResult:
+            matches = filter_external_ids(external_ids, get_node_expression(query, "0").filter, str.casefold)
+            return QueryResult({"0": dm.NodeListWithCursor([create_node(item) for item in matches], cursor=None)})
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = count
+            client.data_modeling.instances.query.side_effect = query_call
+            boundaries = create_external_id_boundaries(client, VIEW_ID, None, partitions=4)
+            batches = list(PartitionedQueryExecutor(self.build, boundaries).iterate(client))
+
+        assert boundaries == sorted(boundaries, key=str.casefold)
+        # Every node is retrieved by exactly one partition.
+        assert sorted(node.external_id for batch in batches for node in batch[0].results) == sorted(external_ids)
+
+    def test_iterate_all_partitions(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 2)
+            client.data_modeling.instances.query.side_effect = self.query_call
+            batches = list(PartitionedQueryExecutor(self.build, ["b", "c"]).iterate(client))
+
+        assert sorted(node.external_id for batch in batches for node in batch[0].results) == self.external_ids
+        assert batches[-1]._cursors == {PARTITION_BOUNDARIES_CURSOR: '["b", "c"]'}
+
+    def test_resume_from_cursors(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 2)
+            client.data_modeling.instances.query.side_effect = self.query_call
+            executor = PartitionedQueryExecutor(self.build, ["b", "c"])
+            with closing(cast(Generator[QueryResultStepList, None, None], executor.iterate(client))) as iterator:
+                first = next(iterator)
+
+            resumed = list(
+                PartitionedQueryExecutor(self.build, ["b", "c"]).iterate(client, init_cursors=first._cursors)
+            )
+
+        retrieved = [node.external_id for batch in [first, *resumed] for node in batch[0].results]
+        assert sorted(retrieved) == self.external_ids
+
+    def test_total_is_counted_and_reported_once_for_all_partitions(self) -> None:
+        events: list[BatchRetrieved] = []
+
+        class ListReporter(QueryReporter):
+            def on_event(self, event: QueryEvent) -> None:
+                if isinstance(event, BatchRetrieved):
+                    events.append(event)
+
+        def count(view_id: dm.ViewId, aggregate: Any, filter: dm.Filter | None) -> Any:
+            return dm.aggregations.CountValue("externalId", len(filter_external_ids(self.external_ids, filter)))
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = count
+            client.data_modeling.instances.query.side_effect = self.query_call
+            list(PartitionedQueryExecutor(self.build, ["b", "c"]).iterate(client, reporter=ListReporter()))
+
+        assert client.data_modeling.instances.aggregate.call_count == 1
+        assert [event.batch_no for event in events] == [1, 2, 3, 4, 5, 6]
+        assert sorted(event.total_retrieved for event in events) == [1, 2, 3, 4, 5, 6]
+        assert [event.is_finished for event in events] == [False] * 5 + [True]
+        assert events[-1].estimated_total == len(self.external_ids)
+
+    def test_boundaries_fall_back_to_single_partition_when_count_fails(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = CogniteAPIError("Unavailable", code=503)
+            boundaries = create_external_id_boundaries(client, VIEW_ID, None, partitions=4)
+
+        assert boundaries == []
+
+    def test_boundaries_skip_candidates_that_cannot_be_counted(self) -> None:
+        external_ids = [f"a{no}" for no in range(10)] + ["b1", "b2", "c1", "c2", "d1", "d2"]
+
+        def count(view_id: dm.ViewId, aggregate: Any, instance_type: str, filter: dm.Filter | None) -> Any:
+            range_ = find_filter(filter.dump() if filter is not None else {}, "range")
+            if range_ is not None and range_.get("lt") == "a8":
+                raise CogniteAPIError("Unavailable", code=503)
+            return dm.aggregations.CountValue("externalId", len(filter_external_ids(external_ids, filter)))
+
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.aggregate.side_effect = count
+            boundaries = create_external_id_boundaries(client, VIEW_ID, None, partitions=4)
+
+        assert boundaries == ["a4", "c"]
+
+    def test_resume_with_other_boundaries_raises(self) -> None:
+        executor = PartitionedQueryExecutor(self.build, ["b"])
+        with monkeypatch_cognite_client() as client:
+            with pytest.raises(ValueError, match="different partitions"):
+                list(executor.iterate(client, init_cursors={PARTITION_BOUNDARIES_CURSOR: '["c"]', "0/0": "1"}))
+
+
+class TestAsyncQueryExecutor:
+    @pytest.fixture(autouse=True)
+    def empty_count_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(QueryExecutor, "_count_cache", CountCache(ttl=60))
+
+    def test_iterate_yields_pages_in_cursor_order(self) -> None:
+        pages = create_pages(page_count=3, page_size=2)
+        used_cursors: list[str | None] = []
+
+        async def query_call(query: Query) -> QueryResult:
+            used_cursors.append(query.cursors.get("0"))
+            return pages[len(used_cursors) - 1]
+
+        async def collect(executor: AsyncQueryExecutor) -> list[list[str]]:
+            return [[node.external_id for node in batch[0].results] async for batch in executor.iterate(client)]
+
+        with monkeypatch_async_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = query_call
+            client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 6)
+            executor = AsyncQueryExecutor(create_builder(chunk_size=2).build())
+
+            batches = asyncio.run(collect(executor))
+
+        assert used_cursors == [None, "cursor_0", "cursor_1"]
+        assert batches == [[f"node_{page_no}_{no}" for no in range(2)] for page_no in range(3)]
+        assert executor.is_finished
+
+    def test_count_is_cancelled_when_iteration_ends(self) -> None:
+        pages = create_pages(page_count=2, page_size=2)
+
+        async def aggregate_call(*args: Any, **kwargs: Any) -> dm.aggregations.CountValue:
+            await asyncio.sleep(60)
+            return dm.aggregations.CountValue("externalId", 4)
+
+        async def is_count_cancelled(executor: AsyncQueryExecutor) -> bool:
+            async for _ in executor.iterate(client):
+                pass
+            count_task = executor._executor._total
+            assert isinstance(count_task, asyncio.Future)
+            # Let the event loop process the cancellation.
+            await asyncio.sleep(0)
+            return count_task.cancelled()
+
+        with monkeypatch_async_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = pages
+            client.data_modeling.instances.aggregate.side_effect = aggregate_call
+            executor = AsyncQueryExecutor(create_builder(chunk_size=2).build())
+
+            is_cancelled = asyncio.run(is_count_cancelled(executor))
+
+        assert is_cancelled
+
+    def test_concurrent_queries_share_one_event_loop(self) -> None:
+        pages = create_pages(page_count=1, page_size=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def query_call(query: Query) -> QueryResult:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return pages[0]
+
+        async def run_all() -> list[list[Any]]:
+            executors = [AsyncQueryExecutor(create_builder(limit=25).build()) for _ in range(10)]
+            return await asyncio.gather(*(executor.execute_query(client) for executor in executors))
+
+        with monkeypatch_async_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = query_call
+            results = asyncio.run(run_all())
+
+        assert max_in_flight == 10
+        assert all(len(result[0].results) == 2 for result in results)
+
+    def test_reverse_list_search_is_awaited_in_chunks(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(250)]
+
+        async def search_call(**kwargs: Any) -> dm.NodeList[dm.Node]:
+            return TestFetchReverseDirectRelationOfLists.search_call(**kwargs)
+
+        with monkeypatch_async_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = search_call
+            executor = AsyncQueryExecutor(create_reverse_list_builder().build(max_search_workers=3))
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            asyncio.run(executor._fetch_reverse_direct_relation_of_lists(client, batch, Progress()))
+
+        assert client.data_modeling.instances.search.call_count == 3
+        assert len(batch["0_1"]) == 251
+
+    def test_reverse_list_search_filter_has_parameter_values(self) -> None:
+        parents = [create_node(f"parent_{no:03d}") for no in range(2)]
+
+        async def search_call(**kwargs: Any) -> dm.NodeList[dm.Node]:
+            return dm.NodeList[dm.Node]([])
+
+        with monkeypatch_async_cognite_client() as client:
+            client.data_modeling.instances.search.side_effect = search_call
+            builder = create_reverse_list_builder(child_filter=NAME_IS_PARAMETER)
+            executor = AsyncQueryExecutor(builder.build(parameters={"name": "child"}))
+            batch = QueryResult({"0": dm.NodeListWithCursor(parents, cursor=None)})
+
+            asyncio.run(executor._fetch_reverse_direct_relation_of_lists(client, batch, Progress()))
+
+        search_filter = client.data_modeling.instances.search.call_args.kwargs["filter"].dump()
+        assert search_filter["and"][1]["equals"]["value"] == "child"
@@ -3,13 +3,20 @@
 import pytest
 from cognite.client import ClientConfig, CogniteClient
 from cognite.client.credentials import Token
+from cognite.client.data_classes import data_modeling as dm
 from cognite.client.data_classes.aggregations import (
     AggregatedNumberedValue,
     CountValue,
     MaxValue,
     MinValue,
 )
-from cognite.client.data_classes.data_modeling.instances import InstanceAggregationResult, InstanceAggregationResultList
+from cognite.client.data_classes.data_modeling.instances import (
+    InstanceAggregationResult,
+    InstanceAggregationResultList,
+    Properties,
+)
+from cognite.client.data_classes.data_modeling.query import QueryResult
+from cognite.client.testing import monkeypatch_cognite_client
 
 from cognite.pygen._query.interface import QueryExecutor
 from cognite.pygen._version import __version__
@@ -111,3 +118,76 @@ def test_not_prefix_existing_client(self) -> None:
         _ = QueryExecutor(client)
 
         assert client.config.client_name == client_name, "Client name should not be prefixed again."
+
+
+class TestToArrow:
+    view_version = "v1"
+    view_id = dm.ViewId("my_space", "MyView", view_version)
+
+    @classmethod
+    def create_view(cls) -> dm.View:
+        return dm.View(
+            cls.view_id.space,
+            cls.view_id.external_id,
+            cls.view_version,
+            properties={},
+            last_updated_time=0,
+            created_time=0,
+            description=None,
+            name=None,
+            filter=None,
+            implements=[],
+            writable=True,
+            used_for="node",
+            is_global=False,
+        )
+
+    @classmethod
+    def create_pages(cls) -> list[QueryResult]:
+        return [
+            QueryResult(
+                {
+                    "0": dm.NodeListWithCursor(
+                        [
+                            dm.Node(
+                                space="my_instances",
+                                external_id=f"node_{page_no}_{no}",
+                                version=1,
+                                last_updated_time=1,
+                                created_time=0,
+                                deleted_time=None,
+                                type=None,
+                                properties=Properties({cls.view_id: {"name": f"Node {page_no} {no}"}}),
+                            )
+                            for no in range(2)
+                        ],
+                        cursor="cursor" if page_no == 0 else None,
+                    )
+                }
+            )
+            for page_no in range(2)
+        ]
+
+    def test_to_arrow_reads_all_pages(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = ClientConfig(client_name="test", project="test", credentials=Token("abc"), cluster="test")
+            client.data_modeling.instances.aggregate.return_value = CountValue("externalId", 4)
+            client.data_modeling.instances.query.side_effect = self.create_pages()
+            executor = QueryExecutor(client, views=[self.create_view()])
+
+            tables = executor.to_arrow(self.view_id, ["externalId", "name"])
+
+        assert list(tables) == [""]
+        assert tables[""].column("name").to_pylist() == ["Node 0 0", "Node 0 1", "Node 1 0", "Node 1 1"]
+
+    def test_iterate_arrow_resumes_from_cursor(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = ClientConfig(client_name="test", project="test", credentials=Token("abc"), cluster="test")
+            client.data_modeling.instances.query.side_effect = self.create_pages()[1:]
+            executor = QueryExecutor(client, views=[self.create_view()])
+
+            chunks = list(executor.iterate_arrow(self.view_id, ["externalId", "name"], initial_cursor="cursor"))
+
+        assert client.data_modeling.instances.query.call_args.args[0].cursors == {"0": "cursor"}
+        assert [chunk[""].column("name").to_pylist() for chunk in chunks] == [["Node 1 0", "Node 1 1"]]
+        assert chunks[0][""].schema.metadata[b"cursor"] == b"null"
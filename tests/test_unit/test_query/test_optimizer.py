@@ -0,0 +1,221 @@
+from typing import Any
+
+import pytest
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Properties
+from cognite.client.data_classes.data_modeling.query import Query, QueryResult
+from cognite.client.testing import monkeypatch_cognite_client
+
+from cognite.pygen._query.builder import QueryBuilder
+from cognite.pygen._query.optimizer import QueryOptimizer
+from cognite.pygen._query.processing import QueryUnpacker
+from cognite.pygen._query.step import QueryBuildStep, QueryResultStep, ViewPropertyId
+
+ITEM_A = dm.ViewId("sp_pygen_models", "ConnectionItemA", "1")
+ITEM_C = dm.ViewId("sp_pygen_models", "ConnectionItemC", "1")
+
+
+def has_data(node: dm.Node, filter_: dm.Filter | None) -> bool:
+    if filter_ is None:
+        return True
+    views = {dm.ViewId.load(view) for view in filter_.dump()["hasData"]}
+    return bool(views & set(node.properties.keys()))
+
+
+def project(node: dm.Node, select: dm.query.Select) -> dm.Node:
+    properties: dict[dm.ViewId, dict[str, Any]] = {}
+    for source in select.sources:
+        view_properties = node.properties.get(source.source) or {}
+        selected = source.properties or []
+        properties[source.source] = {
+            key: value for key, value in view_properties.items() if "*" in selected or key in selected
+        }
+    return dm.Node(
+        node.space,
+        node.external_id,
+        node.version,
+        node.last_updated_time,
+        node.created_time,
+        node.deleted_time,
+        properties=Properties(properties),  # type: ignore[arg-type]
+        type=node.type,
+    )
+
+
+def evaluate(query: Query, nodes: dm.NodeList[dm.Node]) -> QueryResult:
+    """Evaluates a query of root and direct relation steps over the omni nodes."""
+    node_by_id = {node.as_id(): node for node in nodes}
+    results: dict[str, list[dm.Node]] = {}
+    for name, expression in query.with_.items():
+        assert isinstance(expression, dm.query.NodeResultSetExpression)
+        if expression.from_ is None:
+            candidates = list(nodes)
+        else:
+            assert expression.through is not None and expression.direction == "outwards"
+            view_id, prop = expression.through.source, expression.through.property
+            assert isinstance(view_id, dm.ViewId)
+            targets = {
+                dm.NodeId.load(value)
+                for parent in results[expression.from_]
+                if isinstance(value := (parent.properties.get(view_id) or {}).get(prop), dict)
+            }
+            candidates = [node_by_id[node_id] for node_id in targets if node_id in node_by_id]
+        results[name] = [node for node in candidates if has_data(node, expression.filter)]
+    return QueryResult(
+        {
+            name: dm.NodeListWithCursor([project(node, select) for node in results[name]], cursor=None)
+            for name, select in query.select.items()
+        }
+    )
+
+
+def create_builder(with_duplicate: bool = False) -> QueryBuilder:
+    has_data_a, has_data_c = dm.filters.HasData(views=[ITEM_A]), dm.filters.HasData(views=[ITEM_C])
+    builder = QueryBuilder()
+    builder.append(
+        QueryBuildStep(
+            "root",
+            dm.query.NodeResultSetExpression(filter=has_data_a),
+            view_id=ITEM_A,
+            selected_properties=["externalId", "name", "selfDirect", "otherDirect"],
+        )
+    )
+    builder.append(
+        QueryBuildStep(
+            "self",
+            dm.query.NodeResultSetExpression(
+                from_="root", through=ITEM_A.as_property_ref("selfDirect"), direction="outwards", filter=has_data_a
+            ),
+            view_id=ITEM_A,
+            connection_property=ViewPropertyId(ITEM_A, "selfDirect"),
+            selected_properties=["externalId", "name"],
+        )
+    )
+    if with_duplicate:
+        builder.append(
+            QueryBuildStep(
+                "self_copy",
+                dm.query.NodeResultSetExpression(
+                    from_="root", through=ITEM_A.as_property_ref("selfDirect"), direction="outwards", filter=has_data_a
+                ),
+                view_id=ITEM_A,
+                connection_property=ViewPropertyId(ITEM_A, "selfDirect"),
+                selected_properties=["externalId", "name"],
+            )
+        )
+    builder.append(
+        QueryBuildStep(
+            "other",
+            dm.query.NodeResultSetExpression(
+                from_="root", through=ITEM_A.as_property_ref("otherDirect"), direction="outwards", filter=has_data_c
+            ),
+            view_id=ITEM_C,
+            connection_property=ViewPropertyId(ITEM_A, "otherDirect"),
+            selected_properties=["externalId"],
+        )
+    )
+    return builder
+
+
+def execute(
+    builder: QueryBuilder,
+    nodes: dm.NodeList[dm.Node],
+    optimize: bool,
+    page_count: int = 1,
+    remove_not_connected: bool = True,
+) -> tuple[list[QueryResultStep], Query]:
+    page_size = -(-len(nodes) // page_count)
+    pages = [dm.NodeList[dm.Node](nodes[start : start + page_size]) for start in range(0, len(nodes), page_size)]
+
+    def query_pages(query: Query) -> QueryResult:
+        page_no = client.data_modeling.instances.query.call_count - 1
+        result = evaluate(query, pages[page_no])
+        if page_no < len(pages) - 1:
+            for items in result.values():
+                items.cursor = f"cursor_{page_no}"
+        return result
+
+    with monkeypatch_cognite_client() as client:
+        client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", len(nodes))
+        client.data_modeling.instances.query.side_effect = query_pages
+        executor = builder.build(optimize=optimize)
+        results = executor.execute_query(client, remove_not_connected=remove_not_connected)
+    sent: Query = client.data_modeling.instances.query.call_args.args[0]
+    return results, sent
+
+
+def ids_by_step(results: list[QueryResultStep]) -> dict[str, list[dm.NodeId]]:
+    return {step.name: sorted((node.as_id() for node in step.node_results), key=str) for step in results}
+
+
+def sort_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(items, key=lambda item: item["externalId"])
+
+
+class TestQueryOptimizer:
+    def test_narrow_selects_to_read_properties(self) -> None:
+        builder = create_builder()
+        query, _, temporary_select = builder._build()
+
+        aliases = QueryOptimizer(builder, temporary_select).optimize(query)
+
+        assert aliases == {}
+        assert query.select["root"].dump()["sources"][0]["properties"] == ["name", "selfDirect", "otherDirect"]
+        assert query.select["self"].dump()["sources"][0]["properties"] == ["name"]
+        # Only the external ID is read from the other step, thus, no properties are retrieved.
+        assert query.select["other"].sources == []
+
+    def test_merge_identical_result_sets(self) -> None:
+        builder = create_builder(with_duplicate=True)
+        query, _, temporary_select = builder._build()
+
+        aliases = QueryOptimizer(builder, temporary_select).optimize(query)
+
+        assert aliases == {"self_copy": "self"}
+        assert set(query.with_) == {"root", "self", "other"}
+        assert set(query.select) == {"root", "self", "other"}
+
+    def test_step_expressions_are_not_modified(self) -> None:
+        builder = create_builder(with_duplicate=True)
+        before = [(step.expression.dump(), step.select.dump() if step.select else None) for step in builder]
+        query, _, temporary_select = builder._build()
+
+        QueryOptimizer(builder, temporary_select).optimize(query)
+
+        assert [(step.expression.dump(), step.select.dump() if step.select else None) for step in builder] == before
+
+    def test_optimized_results_are_equivalent(self, omni_nodes: dm.NodeList[dm.Node]) -> None:
+        expected, unoptimized_query = execute(create_builder(), omni_nodes, optimize=False)
+        actual, optimized_query = execute(create_builder(), omni_nodes, optimize=True)
+
+        expected_items = QueryUnpacker(expected).unpack()
+        assert expected_items, "The test data should give results"
+        assert any(isinstance(item.get("selfDirect"), list) for item in expected_items), "Expected connections"
+        assert sort_items(QueryUnpacker(actual).unpack()) == sort_items(expected_items)
+        assert optimized_query.select != unoptimized_query.select
+
+    def test_merged_step_has_same_results(self, omni_nodes: dm.NodeList[dm.Node]) -> None:
+        expected, unoptimized_query = execute(create_builder(with_duplicate=True), omni_nodes, optimize=False)
+        actual, optimized_query = execute(create_builder(with_duplicate=True), omni_nodes, optimize=True)
+
+        assert "self_copy" in unoptimized_query.with_
+        assert "self_copy" not in optimized_query.with_
+        assert ids_by_step(actual) == ids_by_step(expected)
+        assert ids_by_step(actual)["self_copy"], "The merged step should have results"
+
+    @pytest.mark.parametrize("remove_not_connected", [True, False])
+    def test_merged_step_has_own_results_across_batches(
+        self, omni_nodes: dm.NodeList[dm.Node], remove_not_connected: bool
+    ) -> None:
+        expected, _ = execute(
+            create_builder(True), omni_nodes, False, page_count=3, remove_not_connected=remove_not_connected
+        )
+        actual, sent = execute(
+            create_builder(True), omni_nodes, True, page_count=3, remove_not_connected=remove_not_connected
+        )
+
+        assert "self_copy" not in sent.with_
+
+        results_by_name = {step.name: step for step in actual}
+        assert results_by_name["self_copy"].results is not results_by_name["self"].results
+        assert ids_by_step(actual) == ids_by_step(expected)
@@ -16,6 +16,7 @@
     Properties,
 )
 
+from cognite.pygen._query.columnar import ColumnarTable, ColumnarUnpacker, concat_tables
 from cognite.pygen._query.processing import QueryUnpacker
 from cognite.pygen._query.step import QueryResultStep, ViewPropertyId
 
@@ -459,3 +460,52 @@ def test_nested_connection_limit_direct_relation(
 
         assert len(unpacked) == 1
         assert len(unpacked[0]["friends"]) == expected_count
+
+
+class TestColumnarUnpacker:
+    def test_unpack_edges_and_nodes(self, node_with_three_edges_and_nodes: list[QueryResultStep]) -> None:
+        tables = ColumnarUnpacker(node_with_three_edges_and_nodes).unpack()
+
+        assert list(tables) == ["", "outwards", "outwards.endNode"]
+        assert tables[""].columns["name"] == ["Jennifer"]
+        assert tables["outwards"].columns["externalId"] == ["edge_0", "edge_1", "edge_2"]
+        assert tables["outwards"].parent_index == [0, 0, 0]
+        assert tables["outwards.endNode"].columns["name"] == ["Brenda", "Charlie", "Dave"]
+        assert tables["outwards.endNode"].parent == "outwards"
+        assert tables["outwards.endNode"].parent_offsets == [0, 1, 2, 3]
+        assert tables["outwards.endNode"].parent_index == [0, 1, 2]
+
+    def test_unpack_direct_relations(self, node_with_three_direct_relations: list[QueryResultStep]) -> None:
+        tables = ColumnarUnpacker(node_with_three_direct_relations).unpack()
+
+        assert tables["friends"].columns["externalId"] == ["brenda", "charlie", "dave"]
+        assert tables["friends"].parent_index == [0, 0, 0]
+
+    def test_concat_tables_shifts_parent_index(self, node_with_three_direct_relations: list[QueryResultStep]) -> None:
+        tables = ColumnarUnpacker(node_with_three_direct_relations).unpack()
+
+        concat_tables(tables, ColumnarUnpacker(node_with_three_direct_relations).unpack())
+
+        assert len(tables[""]) == 2
+        assert tables["friends"].parent_offsets == [0, 1, 2, 3, 4, 5, 6]
+        assert tables["friends"].parent_index == [0, 0, 0, 1, 1, 1]
+
+    def test_to_numpy_masks_missing_values(self) -> None:
+        table = ColumnarTable(
+            "", {"externalId": ["a", "b", "c"], "height": [1, None, 3], "isActive": [True, False, None]}
+        )
+
+        columns = table.to_numpy()
+
+        assert columns["height"].dtype.name == "int64"
+        assert columns["height"].mask.tolist() == [False, True, False]
+        assert columns["isActive"].dtype.name == "bool"
+        assert columns["externalId"].dtype == object
+
+    def test_to_arrow(self, node_with_three_edges_and_nodes: list[QueryResultStep]) -> None:
+        tables = ColumnarUnpacker(node_with_three_edges_and_nodes).unpack()
+
+        arrow_table = tables["outwards.endNode"].to_arrow()
+
+        assert arrow_table.column("name").to_pylist() == ["Brenda", "Charlie", "Dave"]
+        assert arrow_table.column("_parentIndex").to_pylist() == [[0], [1], [2]]
@@ -0,0 +1,148 @@
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from cognite.client.data_classes import data_modeling as dm
+from cognite.client.data_classes.data_modeling.instances import Properties
+from cognite.client.data_classes.data_modeling.query import Query
+from cognite.client.testing import monkeypatch_cognite_client
+
+from cognite.pygen._query import raw as raw_module
+from cognite.pygen._query.processing import QueryUnpacker
+from cognite.pygen._query.raw import RawEdge, RawNode, list_raw, list_typed
+from tests.test_unit.test_query.test_optimizer import create_builder, evaluate, sort_items
+
+
+def as_response(query: Query, nodes: dm.NodeList[dm.Node]) -> dict[str, Any]:
+    result = evaluate(query, nodes)
+    return {
+        "items": {name: [node.dump(camel_case=True) for node in items] for name, items in result.items()},
+        "nextCursor": {name: None for name in result},
+    }
+
+
+class TestRawInstances:
+    @pytest.mark.parametrize("camel_case", [True, False])
+    def test_node_dump_matches_sdk(self, omni_nodes: dm.NodeList[dm.Node], camel_case: bool) -> None:
+        for node in omni_nodes:
+            raw = RawNode(node.dump(camel_case=True))
+
+            assert raw.dump(camel_case) == node.dump(camel_case)
+            assert raw.properties == node.properties
+            assert raw.type == node.type
+            if len(node.properties) == 1:
+                assert raw.get("name") == node.get("name")
+
+    @pytest.mark.parametrize("camel_case", [True, False])
+    def test_edge_dump_matches_sdk(self, camel_case: bool) -> None:
+        edge = dm.Edge(
+            space="my_space",
+            external_id="edge_1",
+            version=1,
+            type=dm.DirectRelationReference("my_space", "my_type"),
+            start_node=dm.DirectRelationReference("my_space", "start"),
+            end_node=dm.DirectRelationReference("my_space", "end"),
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=None,
+            properties=Properties({dm.ViewId("my_space", "MyEdge", "v1"): {"weight": 1.0}}),
+        )
+        raw = RawEdge(edge.dump(camel_case=True))
+
+        assert raw.dump(camel_case) == edge.dump(camel_case)
+        assert raw.properties == edge.properties
+        assert raw.start_node == edge.start_node
+        assert raw["weight"] == edge["weight"]
+
+    def test_msgspec_is_imported_on_first_raw_read(self) -> None:
+        # msgspec is an optional dependency, thus, the SDK must be importable without it.
+        assert "msgspec" not in vars(raw_module)
+
+
+class TestRawQuery:
+    def test_raw_results_unpack_as_sdk_results(self, omni_nodes: dm.NodeList[dm.Node]) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.data_modeling.instances.query.side_effect = lambda query: evaluate(query, omni_nodes)
+            expected = create_builder().build().execute_query(client, remove_not_connected=True)
+
+            client.post.side_effect = lambda url, json: MagicMock(
+                json=MagicMock(return_value=as_response(Query.load(json), omni_nodes))
+            )
+            actual = create_builder().build(raw=True).execute_query(client, remove_not_connected=True)
+
+        assert client.post.call_args.args[0] == "/models/instances/query"
+        assert all(isinstance(node, RawNode) for step in actual for node in step.node_results)
+        expected_items = QueryUnpacker(expected).unpack()
+        assert expected_items, "The test data should give results"
+        assert sort_items(QueryUnpacker(actual).unpack()) == sort_items(expected_items)
+
+    def test_list_raw_paginates_until_limit(self) -> None:
+        view_id = dm.ViewId("my_space", "MyView", "v1")
+        pages = [
+            {
+                "items": [
+                    {
+                        "instanceType": "node",
+                        "space": "my_space",
+                        "externalId": f"node_{page_no}_{no}",
+                        "version": 1,
+                        "lastUpdatedTime": 1,
+                        "createdTime": 1,
+                        "properties": {"my_space": {"MyView/v1": {"name": "a"}}},
+                    }
+                    for no in range(2)
+                ],
+                "nextCursor": f"cursor_{page_no}",
+            }
+            for page_no in range(3)
+        ]
+        with monkeypatch_cognite_client() as client:
+            client.post.side_effect = [MagicMock(json=MagicMock(return_value=page)) for page in pages]
+            nodes = list_raw(client, "node", view_id, limit=4)
+
+        assert [node.external_id for node in nodes] == ["node_0_0", "node_0_1", "node_1_0", "node_1_1"]
+        assert client.post.call_count == 2
+        assert client.post.call_args.kwargs["json"]["cursor"] == "cursor_0"
+        assert nodes[0].properties[view_id] == {"name": "a"}
+
+    def test_responses_are_decoded_with_msgspec(self) -> None:
+        page = {
+            "items": [
+                {
+                    "instanceType": "node",
+                    "space": "my_space",
+                    "externalId": "node_1",
+                    "version": 1,
+                    "lastUpdatedTime": 1,
+                    "createdTime": 1,
+                    "properties": {"my_space": {"MyView/v1": {"name": "a"}}},
+                }
+            ],
+            "nextCursor": None,
+        }
+        response = MagicMock(content=json.dumps(page).encode("utf-8"))
+        response.json.side_effect = AssertionError("The response should be decoded with msgspec")
+        with monkeypatch_cognite_client() as client:
+            client.post.return_value = response
+            nodes = list_raw(client, "node", dm.ViewId("my_space", "MyView", "v1"), limit=None)
+
+        assert [node.dump() for node in nodes] == page["items"]
+
+    def test_list_typed_decodes_each_page(self) -> None:
+        pages = [
+            {"items": [{"externalId": "node_0"}, {"externalId": "node_1"}], "nextCursor": "cursor_0"},
+            {"items": [{"externalId": "node_2"}], "nextCursor": None},
+        ]
+
+        def load_page(content: bytes) -> tuple[list[str], str | None]:
+            page = json.loads(content)
+            return [item["externalId"] for item in page["items"]], page["nextCursor"]
+
+        with monkeypatch_cognite_client() as client:
+            client.post.side_effect = [MagicMock(content=json.dumps(page).encode("utf-8")) for page in pages]
+            items = list_typed(client, dm.ViewId("my_space", "MyView", "v1"), -1, load_page)
+
+        assert items == ["node_0", "node_1", "node_2"]
+        assert client.post.call_count == 2
+        assert client.post.call_args.kwargs["json"]["cursor"] == "cursor_0"
@@ -1,3 +1,10 @@
+import asyncio
+import datetime
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -5,15 +12,21 @@
 from cognite.client import ClientConfig
 from cognite.client import data_modeling as dm
 from cognite.client.data_classes.data_modeling.instances import Properties
-from cognite.client.testing import monkeypatch_cognite_client
+from cognite.client.testing import monkeypatch_async_cognite_client, monkeypatch_cognite_client
 from cognite_core import CogniteCoreClient
-from omni import OmniClient
+from omni import AsyncOmniClient, OmniClient
 from omni import data_classes as dc
-from omni._api._core import instantiate_classes
+from omni._api import _core as core
+from omni._api._core import InstanceCache, LocalMirror, RetrieveBatcher, instantiate_classes, instantiate_nodes
 from omni.config import global_config
+from omni.data_classes._core import DomainModel
+from omni.data_classes._core.query import BatchLimitStore
+from pydantic import ValidationError
 from wind_turbine import data_classes as wdc
 from wind_turbine._api._core import GraphQLQueryResponse
 
+from tests.constants import OMNI_SDK
+
 
 def parse_graphql_query():
     result = {"listBlade": {"items": [{"__typename": "Blade", "name": "A"}]}}
@@ -216,6 +229,17 @@ def test_skip_validation(self) -> None:
                 "space": "my_space",
             }
 
+    def test_iterate_partitions_with_prefetch_raises(self) -> None:
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            pygen = OmniClient(mock_client)
+
+            with pytest.raises(ValueError, match="prefetch is not supported"):
+                next(pygen.primitive_nullable.iterate(chunk_size=10, prefetch=2, partitions=4))
+
+        mock_client.data_modeling.instances.aggregate.assert_not_called()
+
     def test_retrieve_extra_arguments(self) -> None:
         with monkeypatch_cognite_client() as mock_client:
             mock_client.config = MagicMock(spec=ClientConfig)
@@ -293,6 +317,489 @@ def test_retrieve_unknown_enum(self) -> None:
             }
 
 
+class TestAsyncClient:
+    @staticmethod
+    def create_node(external_id: str) -> dm.Node:
+        return dm.Node(
+            space="my_space",
+            external_id=external_id,
+            version=1,
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=None,
+            type=None,
+            properties=Properties(
+                {dm.ViewId("sp_pygen_models", "PrimitiveNullable", "1"): {"boolean": True, "int32": 10}}
+            ),
+        )
+
+    def test_list_awaits_async_client(self) -> None:
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_async_client.data_modeling.instances.list.return_value = dm.NodeList[dm.Node](
+                [self.create_node("my_node")]
+            )
+            pygen = AsyncOmniClient(mock_client)
+
+            listed = asyncio.run(pygen.primitive_nullable.list(limit=10))
+
+        assert [node.external_id for node in listed] == ["my_node"]
+        assert listed[0].int_32 == 10
+        mock_client.data_modeling.instances.list.assert_not_called()
+        assert mock_async_client.data_modeling.instances.list.call_args.kwargs["limit"] == 10
+
+    def test_retrieve_single_and_multiple(self) -> None:
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_async_client.data_modeling.instances.retrieve.return_value = dm.InstancesResult(
+                dm.NodeList[dm.Node]([self.create_node("my_node")]), dm.EdgeList[dm.Edge]([])
+            )
+            pygen = AsyncOmniClient(mock_client)
+
+            async def retrieve_both() -> tuple[Any, Any]:
+                return await asyncio.gather(
+                    pygen.primitive_nullable.retrieve("my_node", space="my_space"),
+                    pygen.primitive_nullable.retrieve(["my_node"], space="my_space"),
+                )
+
+            single, multiple = asyncio.run(retrieve_both())
+
+        assert isinstance(single, dc.PrimitiveNullable)
+        assert isinstance(multiple, dc.PrimitiveNullableList)
+        assert [node.external_id for node in multiple] == ["my_node"]
+
+    def test_retrieve_uses_instance_cache(self) -> None:
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_async_client.data_modeling.instances.retrieve.return_value = dm.InstancesResult(
+                dm.NodeList[dm.Node]([self.create_node("my_node")]), dm.EdgeList[dm.Edge]([])
+            )
+            pygen = AsyncOmniClient(mock_client)
+            cache = pygen.enable_cache()
+
+            first = asyncio.run(pygen.primitive_nullable.retrieve("my_node", space="my_space"))
+            second = asyncio.run(pygen.primitive_nullable.retrieve(["my_node"], space="my_space"))
+
+        assert first is second[0]
+        assert mock_async_client.data_modeling.instances.retrieve.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_retrieve_with_raw_read(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(global_config, "raw_read", True)
+        response = {"items": [self.create_node("my_node").dump(camel_case=True)]}
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_async_client.post.return_value = MagicMock(json=MagicMock(return_value=response))
+            pygen = AsyncOmniClient(mock_client)
+
+            retrieved = asyncio.run(pygen.primitive_nullable.retrieve("my_node", space="my_space"))
+
+        assert isinstance(retrieved, dc.PrimitiveNullable)
+        assert retrieved.int_32 == 10
+        assert mock_async_client.post.call_args.args[0] == "/models/instances/byids"
+        mock_async_client.data_modeling.instances.retrieve.assert_not_called()
+
+    def test_list_and_search_with_raw_read(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(global_config, "raw_read", True)
+        response = {"items": [self.create_node("my_node").dump(camel_case=True)]}
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_client.post.return_value = MagicMock(json=MagicMock(return_value=response))
+            pygen = AsyncOmniClient(mock_client)
+
+            listed = asyncio.run(pygen.primitive_nullable.list(limit=10))
+            found = asyncio.run(pygen.primitive_nullable.search("my_node"))
+
+        assert [node.int_32 for node in [*listed, *found]] == [10, 10]
+        assert [call.args[0] for call in mock_client.post.call_args_list] == [
+            "/models/instances/list",
+            "/models/instances/search",
+        ]
+        mock_async_client.data_modeling.instances.list.assert_not_called()
+        mock_async_client.data_modeling.instances.search.assert_not_called()
+
+    def test_list_fills_instance_cache(self) -> None:
+        with monkeypatch_cognite_client() as mock_client, monkeypatch_async_cognite_client() as mock_async_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.get_async_client.return_value = mock_async_client
+            mock_async_client.data_modeling.instances.list.return_value = dm.NodeList[dm.Node](
+                [self.create_node("my_node")]
+            )
+            pygen = AsyncOmniClient(mock_client)
+            pygen.enable_cache()
+
+            listed = asyncio.run(pygen.primitive_nullable.list(limit=10))
+            retrieved = asyncio.run(pygen.primitive_nullable.retrieve("my_node", space="my_space"))
+
+        assert retrieved is listed[0]
+        mock_async_client.data_modeling.instances.retrieve.assert_not_called()
+
+
+class TestRetrieveBatching:
+    @staticmethod
+    def retrieve_call(nodes: list[dm.NodeId], sources: dm.ViewId) -> dm.InstancesResult:
+        return dm.InstancesResult(
+            dm.NodeList[dm.Node](
+                [TestAsyncClient.create_node(node.external_id) for node in nodes if node.external_id != "missing"]
+            ),
+            dm.EdgeList[dm.Edge]([]),
+        )
+
+    def test_concurrent_retrieves_are_coalesced(self) -> None:
+        external_ids = [f"node_{no}" for no in range(8)]
+        barrier = threading.Barrier(len(external_ids))
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.retrieve.side_effect = self.retrieve_call
+            pygen = OmniClient(mock_client)
+            pygen.primitive_nullable.enable_retrieve_batching(window=1.0)
+
+            def retrieve(external_id: str) -> dc.PrimitiveNullable | None:
+                barrier.wait()
+                return pygen.primitive_nullable.retrieve(external_id, space="my_space")
+
+            with ThreadPoolExecutor(max_workers=len(external_ids)) as pool:
+                retrieved = list(pool.map(retrieve, external_ids))
+
+        assert [node.external_id if node else None for node in retrieved] == external_ids
+        mock_client.data_modeling.instances.retrieve.assert_called_once()
+        assert len(mock_client.data_modeling.instances.retrieve.call_args.kwargs["nodes"]) == len(external_ids)
+
+    def test_full_batch_is_retrieved_without_waiting(self) -> None:
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.retrieve.side_effect = self.retrieve_call
+            pygen = OmniClient(mock_client)
+            pygen.primitive_nullable.enable_retrieve_batching(window=60.0, max_batch_size=2)
+
+            retrieved = pygen.primitive_nullable.retrieve(["node_1", "missing", "node_2"], space="my_space")
+
+        assert [node.external_id for node in retrieved] == ["node_1", "node_2"]
+        mock_client.data_modeling.instances.retrieve.assert_called_once()
+
+    def test_waiting_call_retrieves_itself_after_timeout(self) -> None:
+        nodes_by_id = {node.as_id(): node for node in TestInstanceCache.create_nodes(2)}
+        requested: list[list[str]] = []
+
+        def load(node_ids: list[dm.NodeId], retrieve_connections: str) -> list[dc.PrimitiveNullable]:
+            requested.append([node_id.external_id for node_id in node_ids])
+            return [nodes_by_id[node_id] for node_id in node_ids]
+
+        first, second = nodes_by_id
+        # The leader collects calls for longer than the other call waits for it.
+        batcher = RetrieveBatcher(load, window=1.0, timeout=0.05)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(batcher.retrieve, [first], "skip")
+            while not batcher._pending:
+                time.sleep(0.01)
+            waiting = batcher.retrieve([second], "skip")
+            led = leader.result()
+
+        assert waiting == [nodes_by_id[second]]
+        assert led == [nodes_by_id[first]]
+        assert requested == [["node_1"], ["node_0", "node_1"]]
+
+
+def find_in_values(dumped: Any) -> list[str]:
+    if isinstance(dumped, dict):
+        if "in" in dumped:
+            return dumped["in"]["values"]
+        return [value for item in dumped.values() for value in find_in_values(item)]
+    if isinstance(dumped, list):
+        return [value for item in dumped for value in find_in_values(item)]
+    return []
+
+
+class TestRetrieveWithConnections:
+    def test_chunks_are_queried_concurrently_and_unpacked_together(self) -> None:
+        external_ids = [f"node_{no:05d}" for no in range(12_000)]
+        # The call count of a mock is not thread-safe, so the concurrent calls are counted here.
+        queries: list[dm.query.Query] = []
+        lock = threading.Lock()
+
+        def query_call(query: dm.query.Query) -> dm.query.QueryResult:
+            with lock:
+                queries.append(query)
+            nodes = [TestAsyncClient.create_node(external_id) for external_id in find_in_values(query.dump())]
+            return dm.query.QueryResult({"0": dm.NodeListWithCursor(nodes, cursor=None)})
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.query.side_effect = query_call
+            pygen = OmniClient(mock_client)
+
+            # The primitive view has no connections, which keeps the query to a single step.
+            retrieved = pygen.primitive_nullable._retrieve(external_ids, "my_space", retrieve_connections="full")
+
+        assert isinstance(retrieved, dc.PrimitiveNullableList)
+        assert sorted(node.external_id for node in retrieved) == external_ids
+        # Chunks of the In filter limit, instead of one query per 100 nodes.
+        assert len(queries) == 3
+
+
+class TestIterateArrow:
+    def test_iterate_arrow_resumes_from_cursors(self) -> None:
+        used_cursors: list[str | None] = []
+
+        def query_call(query: dm.query.Query) -> dm.query.QueryResult:
+            used_cursors.append(query.cursors.get("0"))
+            cursor = "cursor_2" if len(used_cursors) == 1 else None
+            node = TestAsyncClient.create_node(f"node_{len(used_cursors)}")
+            return dm.query.QueryResult({"0": dm.NodeListWithCursor([node], cursor=cursor)})
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.aggregate.return_value = dm.aggregations.CountValue("externalId", 3)
+            mock_client.data_modeling.instances.query.side_effect = query_call
+            pygen = OmniClient(mock_client)
+
+            chunks = list(pygen.primitive_nullable.iterate_arrow(chunk_size=1, cursors={"0": "cursor_1"}))
+
+        assert used_cursors == ["cursor_1", "cursor_2"]
+        assert [chunk[""].column("externalId").to_pylist() for chunk in chunks] == [["node_1"], ["node_2"]]
+        assert [json.loads(chunk[""].schema.metadata[b"cursors"]) for chunk in chunks] == [
+            {"0": "cursor_2"},
+            {"0": None},
+        ]
+
+
+class TestBatchLimitStore:
+    def test_global_batch_limit_store_is_used_by_queries(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        store_path = tmp_path / "batch_limits.json"
+        monkeypatch.setattr(global_config, "batch_limit_store", BatchLimitStore(store_path))
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.query.return_value = dm.query.QueryResult(
+                {"0": dm.NodeListWithCursor([TestAsyncClient.create_node("node_1")], cursor=None)}
+            )
+            pygen = OmniClient(mock_client)
+
+            pygen.primitive_nullable._retrieve(["node_1"], "my_space", retrieve_connections="full")
+
+        assert len(BatchLimitStore(store_path)._limits) == 1
+
+
+class TestGlobalConfig:
+    def test_query_reporter_is_validated(self) -> None:
+        with pytest.raises(ValidationError):
+            global_config.query_reporter = "not a reporter"  # type: ignore[assignment]
+
+        assert global_config.query_reporter is None
+
+
+class TestInstanceCache:
+    def test_retrieve_is_cached_until_deleted(self) -> None:
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.retrieve.side_effect = TestRetrieveBatching.retrieve_call
+            mock_client.data_modeling.instances.delete.return_value = dm.InstancesDeleteResult(
+                nodes=[dm.NodeId("my_space", "node_1")], edges=[]
+            )
+            pygen = OmniClient(mock_client)
+            cache = pygen.enable_cache()
+
+            first = pygen.primitive_nullable.retrieve("node_1", space="my_space")
+            second = pygen.primitive_nullable.retrieve(["node_1", "node_2"], space="my_space")
+            pygen.delete("node_1", space="my_space")
+            third = pygen.primitive_nullable.retrieve("node_1", space="my_space")
+
+        assert first is second[0]
+        assert [node.external_id for node in second] == ["node_1", "node_2"]
+        assert third is not first
+        requested = [
+            [node.external_id for node in call.kwargs["nodes"]]
+            for call in mock_client.data_modeling.instances.retrieve.call_args_list
+        ]
+        assert requested == [["node_1"], ["node_2"], ["node_1"]]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_view_without_ttl_is_not_cached(self) -> None:
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.retrieve.side_effect = TestRetrieveBatching.retrieve_call
+            pygen = OmniClient(mock_client)
+            cache = pygen.enable_cache(ttl_by_view={pygen.primitive_nullable._view_id: 0})
+
+            for _ in range(2):
+                pygen.primitive_nullable.retrieve("node_1", space="my_space")
+
+        assert mock_client.data_modeling.instances.retrieve.call_count == 2
+        assert len(cache) == 0
+
+    @staticmethod
+    def create_nodes(count: int) -> list[dc.PrimitiveNullable]:
+        epoch = datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc)
+        return [
+            dc.PrimitiveNullable(
+                space="my_space",
+                external_id=f"node_{no}",
+                data_record=dc.DataRecord(version=1, last_updated_time=epoch, created_time=epoch),
+            )
+            for no in range(count)
+        ]
+
+    def test_invalidate_removes_written_nodes_and_nodes_with_connections(self) -> None:
+        cache = InstanceCache()
+        view_id = dm.ViewId("my_space", "MyView", "v1")
+        nodes = self.create_nodes(2)
+        cache.set(view_id, nodes, "skip")
+        cache.set(view_id, nodes, "full")
+
+        cache.invalidate([nodes[0].as_id()])
+
+        assert list(cache.get(view_id, [node.as_id() for node in nodes], "skip")) == [nodes[1].as_id()]
+        assert cache.get(view_id, [node.as_id() for node in nodes], "full") == {}
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        cache = InstanceCache(maxsize=2)
+        view_id = dm.ViewId("my_space", "MyView", "v1")
+        nodes = self.create_nodes(3)
+        cache.set(view_id, nodes[:2], "skip")
+        cache.get(view_id, [nodes[0].as_id()], "skip")
+        cache.set(view_id, nodes[2:], "skip")
+
+        assert set(cache.get(view_id, [node.as_id() for node in nodes], "skip")) == {
+            nodes[0].as_id(),
+            nodes[2].as_id(),
+        }
+
+
+class TestSync:
+    def test_sync_yields_changes_and_tombstones_until_caught_up(self) -> None:
+        deleted = TestAsyncClient.create_node("node_2")
+        deleted.deleted_time = 5
+        pages = [
+            dm.query.QueryResult(
+                {"nodes": dm.NodeListWithCursor([TestAsyncClient.create_node("node_1"), deleted], cursor="cursor_1")}
+            ),
+            dm.query.QueryResult(
+                {"nodes": dm.NodeListWithCursor([TestAsyncClient.create_node("node_3")], cursor="cursor_2")}
+            ),
+            dm.query.QueryResult({"nodes": dm.NodeListWithCursor([], cursor="cursor_3")}),
+        ]
+        used_cursors: list[str | None] = []
+
+        def sync_call(query: dm.query.QuerySync) -> dm.query.QueryResult:
+            used_cursors.append(query.cursors["nodes"])
+            return pages[len(used_cursors) - 1]
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.sync.side_effect = sync_call
+            pygen = OmniClient(mock_client)
+
+            batches = list(pygen.primitive_nullable.sync(cursor="cursor_0", chunk_size=2))
+
+        assert used_cursors == ["cursor_0", "cursor_1", "cursor_2"]
+        assert [[node.external_id for node in batch.items] for batch in batches] == [["node_1"], ["node_3"], []]
+        assert [batch.deleted for batch in batches] == [[dm.NodeId("my_space", "node_2")], [], []]
+        assert [batch.cursor for batch in batches] == ["cursor_1", "cursor_2", "cursor_3"]
+
+    def test_sync_continues_after_short_page(self) -> None:
+        pages = [["node_1"], ["node_2", "node_3"], []]
+        used_cursors: list[str | None] = []
+
+        def sync_call(query: dm.query.QuerySync) -> dm.query.QueryResult:
+            used_cursors.append(query.cursors["nodes"])
+            nodes = [TestAsyncClient.create_node(external_id) for external_id in pages[len(used_cursors) - 1]]
+            return dm.query.QueryResult({"nodes": dm.NodeListWithCursor(nodes, cursor=f"cursor_{len(used_cursors)}")})
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.sync.side_effect = sync_call
+            pygen = OmniClient(mock_client)
+
+            batches = list(pygen.primitive_nullable.sync(chunk_size=2))
+
+        # The first page is shorter than the chunk size, while the server still has more changes.
+        assert used_cursors == [None, "cursor_1", "cursor_2"]
+        assert [node.external_id for batch in batches for node in batch.items] == ["node_1", "node_2", "node_3"]
+        assert batches[-1].cursor == "cursor_3"
+
+
+class TestLocalMirror:
+    VIEW_ID = dm.ViewId("sp_pygen_models", "ConnectionItemA", "1")
+
+    def create_node(self, external_id: str, other_direct: str | None, deleted: bool = False) -> dm.Node:
+        properties: dict[str, Any] = {"name": external_id}
+        if other_direct is not None:
+            properties["otherDirect"] = {"space": "my_space", "externalId": other_direct}
+        return dm.Node(
+            space="my_space",
+            external_id=external_id,
+            version=1,
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=5 if deleted else None,
+            type=None,
+            properties=Properties({self.VIEW_ID: properties}),
+        )
+
+    def test_sqlite_is_imported_when_creating_mirror(self) -> None:
+        # sqlite3 is not available in Pyodide, thus, the SDK must be importable without it.
+        assert "sqlite3" not in vars(core)
+
+    def test_refresh_applies_changes_and_serves_reads(self) -> None:
+        pages = [
+            [self.create_node("a", "target_1"), self.create_node("b", "target_1")],
+            [self.create_node("c", "target_2")],
+            [],
+            [self.create_node("a", "target_2"), self.create_node("c", None, deleted=True)],
+            [],
+        ]
+        used_cursors: list[str | None] = []
+
+        def sync_call(query: dm.query.QuerySync) -> dm.query.QueryResult:
+            used_cursors.append(query.cursors["nodes"])
+            nodes = pages[len(used_cursors) - 1]
+            return dm.query.QueryResult({"nodes": dm.NodeListWithCursor(nodes, cursor=f"cursor_{len(used_cursors)}")})
+
+        with monkeypatch_cognite_client() as mock_client:
+            mock_client.config = MagicMock(spec=ClientConfig)
+            mock_client.config.client_name = "CognitePygen"
+            mock_client.data_modeling.instances.sync.side_effect = sync_call
+            pygen = OmniClient(mock_client)
+            mirror = LocalMirror()
+            pygen.connection_item_a.use_mirror(mirror)
+
+            first_count = mirror.refresh(pygen.connection_item_a, chunk_size=2)
+            referencing_before = pygen.connection_item_a.list_referencing("other_direct", "target_1", "my_space")
+            second_count = mirror.refresh(pygen.connection_item_a, chunk_size=2)
+            retrieved = pygen.connection_item_a.retrieve(["a", "b", "c"], space="my_space")
+            listed = pygen.connection_item_a.list(limit=-1)
+            referencing_after = pygen.connection_item_a.list_referencing("other_direct", "target_1", "my_space")
+
+        assert (first_count, second_count) == (3, 2)
+        assert used_cursors == [None, "cursor_1", "cursor_2", "cursor_3", "cursor_4"]
+        assert sorted(node.external_id for node in referencing_before) == ["a", "b"]
+        assert [node.external_id for node in retrieved] == ["a", "b"]
+        assert [node.external_id for node in listed] == ["a", "b"]
+        assert [node.external_id for node in referencing_after] == ["b"]
+        mock_client.data_modeling.instances.retrieve.assert_not_called()
+        mock_client.data_modeling.instances.list.assert_not_called()
+
+
 class TestInstantiateClasses:
     def test_raise_multiple(self) -> None:
         raw = [
@@ -330,3 +837,74 @@ def test_raise_multiple(self) -> None:
         with pytest.raises(ValueError) as exc_info:
             instantiate_classes(dc.PrimitiveRequired, raw, "retrieve")
         assert exc_info.match("Failed to retrieve 'PrimitiveRequired', 2 out of 3 instances failed validation.")
+
+
+def omni_nodes_by_class() -> list[tuple[type[DomainModel], dm.Node]]:
+    class_by_view_id = {
+        cls_._view_id: cls_
+        for cls_ in vars(dc).values()
+        if isinstance(cls_, type) and issubclass(cls_, DomainModel) and "_view_id" in vars(cls_)
+    }
+    output: list[tuple[type[DomainModel], dm.Node]] = []
+    for node in OMNI_SDK.load_read_nodes(OMNI_SDK.data_model_ids[0]):
+        for view_id, properties in node.properties.items():
+            # Listing through a view only returns the properties of that view.
+            view_node = dm.Node(
+                node.space,
+                node.external_id,
+                node.version,
+                node.last_updated_time,
+                node.created_time,
+                node.deleted_time,
+                properties=Properties({view_id: properties}),
+                type=node.type,
+            )
+            output.append((class_by_view_id[view_id], view_node))
+    return output
+
+
+class TestFromRaw:
+    def test_from_raw_matches_validated_instance(self) -> None:
+        compared = 0
+        for cls_, node in omni_nodes_by_class():
+            try:
+                expected = cls_.model_validate(cls_._to_dict(node))
+            except ValueError:
+                # The mock data does not satisfy all required fields.
+                continue
+            for actual in [cls_._from_raw(node), cls_.model_validate(cls_._raw_args(node))]:
+                assert actual.model_dump() == expected.model_dump(), cls_.__name__
+                assert actual.model_fields_set == expected.model_fields_set, cls_.__name__
+            compared += 1
+        assert compared > 50, "Expected most of the mock nodes to be compared"
+
+    def test_from_raw_converts_types_and_keeps_unknown_properties(self) -> None:
+        node = dm.Node(
+            space="my_space",
+            external_id="my_node",
+            version=1,
+            last_updated_time=1,
+            created_time=1,
+            deleted_time=None,
+            type=None,
+            properties=Properties(
+                {
+                    dm.ViewId("sp_pygen_models", "PrimitiveNullable", "1"): {
+                        "timestamp": "2025-01-01T00:00:00.000+00:00",
+                        "date": "2025-01-02",
+                        "int64": "invalid_value",
+                        "new_field": {"space": "my_space", "externalId": "other"},
+                    }
+                }
+            ),
+        )
+
+        item = dc.PrimitiveNullable._from_raw(node)
+
+        assert item.timestamp == datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        assert item.date == datetime.date(2025, 1, 2)
+        # Invalid values are kept as is when validation is skipped.
+        assert item.int_64 == "invalid_value"
+        assert item.model_extra == {"new_field": dm.NodeId("my_space", "other")}
+        with pytest.raises(ValueError):
+            instantiate_nodes(dc.PrimitiveNullable, [node], "list")
@@ -358,3 +358,96 @@ def test_as_write_maintain_view_type(self) -> None:
         assert isinstance(write.direct_parent_multi, list)
         assert len(write.direct_parent_multi) == 1
         assert isinstance(write.direct_parent_multi[0], dc.Implementation2Write)
+
+
+class TestColumnarToPandas:
+    record = dc.DataRecord(
+        version=3,
+        last_updated_time=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        created_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        deleted_time=None,
+    )
+
+    def test_columns_are_typed(self) -> None:
+        items = dc.PrimitiveNullableList(
+            [
+                dc.PrimitiveNullable(
+                    external_id="primitive_1",
+                    boolean=True,
+                    int_32=1,
+                    float_64=1.5,
+                    text="one",
+                    timestamp=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+                    node_type=dm.DirectRelationReference("my_space", "my_type"),
+                    data_record=self.record,
+                ),
+                dc.PrimitiveNullable(external_id="primitive_2", data_record=self.record),
+            ]
+        )
+
+        df = items.to_pandas(columnar=True)
+
+        assert str(df["boolean"].dtype) == "boolean"
+        assert str(df["int_32"].dtype) == "Int64"
+        assert str(df["float_64"].dtype) == "Float64"
+        assert str(df["timestamp"].dtype).startswith("datetime64")
+        assert str(df["node_type"].dtype) == "category"
+        assert df["int_32"].isna().tolist() == [False, True]
+        assert df["timestamp"][0] == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert df["node_type"].tolist()[0] == "my_type"
+        assert "data_record" not in df.columns
+        assert df["version"].tolist() == [3, 3]
+        assert df["last_updated_time"][0] == self.record.last_updated_time
+        assert df["deleted_time"].isna().all()
+        dumped = items.to_pandas()
+        assert set(dumped.columns) - {"data_record"} <= set(df.columns)
+        assert df[["external_id", "text"]].fillna("").values.tolist() == (
+            dumped[["external_id", "text"]].fillna("").values.tolist()
+        )
+
+    def test_connections_are_node_ids(self) -> None:
+        other = dc.ConnectionItemCNode(external_id="other", data_record=self.record)
+        items = dc.ConnectionItemAList(
+            [
+                dc.ConnectionItemA(
+                    external_id="a_1",
+                    self_direct="a_2",
+                    other_direct=other,
+                    outwards=[dm.NodeId("other_space", "b_1")],
+                    data_record=self.record,
+                )
+            ]
+        )
+
+        df = items.to_pandas(columnar=True)
+
+        assert df["self_direct"][0] == dm.NodeId("sp_omni_instances", "a_2")
+        assert df["other_direct"][0] == dm.NodeId("sp_omni_instances", "other")
+        assert df["outwards"][0] == [dm.NodeId("other_space", "b_1")]
+
+    def test_empty_list(self) -> None:
+        df = dc.PrimitiveNullableList([]).to_pandas(columnar=True)
+
+        assert df.empty
+        assert {"space", "external_id", "text", "node_type", "version", "last_updated_time"} <= set(df.columns)
+
+    def test_to_arrow(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        items = dc.ConnectionItemAList(
+            [
+                dc.ConnectionItemA(external_id="a_1", name="A", self_direct="a_2", data_record=self.record),
+                dc.ConnectionItemA(external_id="a_2", data_record=self.record),
+            ]
+        )
+
+        table = items.to_arrow()
+
+        assert table.num_rows == 2
+        assert table.schema.field("name").type == pa.string()
+        assert table.schema.field("version").type == pa.int64()
+        assert pa.types.is_timestamp(table.schema.field("last_updated_time").type)
+        assert pa.types.is_dictionary(table.schema.field("node_type").type)
+        assert table.column("self_direct").to_pylist() == [
+            {"space": "sp_omni_instances", "external_id": "a_2"},
+            None,
+        ]
@@ -2,8 +2,10 @@
 
 import pytest
 from cognite.client import ClientConfig
+from cognite.client import data_modeling as dm
 from cognite.client.testing import monkeypatch_cognite_client
 from omni import OmniClient
+from omni.data_classes._core.query.builder import QueryBuilder
 
 
 class TestSelectMethod:
@@ -29,3 +31,78 @@ def test_select_no_user_warning(self) -> None:
             client.config.client_name = "CognitePygen"
             pygen = OmniClient(client)
         pygen.connection_item_a.select().name.equals("test").list_full()
+
+
+class TestPrepare:
+    def test_prepare_reuses_compiled_query_for_same_shape(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = MagicMock(spec=ClientConfig)
+            client.config.client_name = "CognitePygen"
+            pygen = OmniClient(client)
+
+        first = pygen.connection_item_a.select().name.equals(dm.filters.ParameterValue("name")).prepare()
+        second = pygen.connection_item_a.select().name.equals(dm.filters.ParameterValue("name")).prepare()
+        other = pygen.connection_item_a.select().name.prefix(dm.filters.ParameterValue("name")).prepare()
+
+        assert first._compiled is second._compiled
+        assert first._compiled is not other._compiled
+
+    def test_prepare_separates_shapes_by_filter_values(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = MagicMock(spec=ClientConfig)
+            client.config.client_name = "CognitePygen"
+            pygen = OmniClient(client)
+
+        first, second, other = (
+            pygen.connection_item_a.select()
+            .other_direct_filter.in_([dm.NodeId("my_space", external_id) for external_id in external_ids])
+            .prepare()
+            for external_ids in [["a", "b"], ["a", "b"], ["a", "c"]]
+        )
+
+        assert first._compiled is second._compiled
+        assert first._compiled is not other._compiled
+
+    def test_execute_binds_parameters(self) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = MagicMock(spec=ClientConfig)
+            client.config.client_name = "CognitePygen"
+            client.data_modeling.instances.query.return_value = dm.query.QueryResult(
+                {"0": dm.NodeListWithCursor([], cursor=None)}
+            )
+            pygen = OmniClient(client)
+
+        prepared = pygen.connection_item_a.select().name.equals(dm.filters.ParameterValue("name")).prepare()
+        for name in ["first", "second"]:
+            items = prepared.execute(name=name)
+
+            assert len(items) == 0
+            query = client.data_modeling.instances.query.call_args.args[0]
+            assert query.parameters == {"name": name}
+            assert query.dump()["with"]["0"]["nodes"]["filter"]["and"][-1] == {
+                "equals": {
+                    "property": ("sp_pygen_models", "ConnectionItemA/1", "name"),
+                    "value": {"parameter": "name"},
+                }
+            }
+
+    def test_execute_does_not_rebuild_query(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with monkeypatch_cognite_client() as client:
+            client.config = MagicMock(spec=ClientConfig)
+            client.config.client_name = "CognitePygen"
+            client.data_modeling.instances.query.return_value = dm.query.QueryResult(
+                {"0": dm.NodeListWithCursor([], cursor=None)}
+            )
+            pygen = OmniClient(client)
+
+        prepared = pygen.connection_item_a.select().name.equals(dm.filters.ParameterValue("name")).prepare()
+        monkeypatch.setattr(QueryBuilder, "_build", MagicMock(side_effect=AssertionError("The query is rebuilt")))
+        queries = []
+        for name in ["first", "second"]:
+            prepared.execute(name=name)
+            queries.append(client.data_modeling.instances.query.call_args.args[0])
+
+        assert [query.parameters for query in queries] == [{"name": "first"}, {"name": "second"}]
+        # Each execution has its own copy of the compiled query.
+        assert queries[0] is not queries[1]
+        assert queries[0].with_["0"] is not prepared._compiled.query.with_["0"]